@@ -0,0 +1,55 @@
+"""
+Условные GET-запросы: вычисление ETag и проверка If-None-Match.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Вычислить ETag по сырым данным ответа до сериализации.
+
+    Args:
+        *parts (Any): Данные, однозначно определяющие тело ответа
+            (например, кортежи строк БД и курсор).
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    return f'"{hashlib.sha1(repr(parts).encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверить, совпадает ли If-None-Match клиента с ETag ответа.
+
+    Args:
+        if_none_match (Optional[str]): Значение заголовка If-None-Match.
+        etag (str): ETag текущего ответа.
+
+    Returns:
+        bool: True, если можно вернуть 304 Not Modified.
+    """
+    if if_none_match is None:
+        return False
+    return if_none_match.strip() == '*' or etag in (
+        tag.strip() for tag in if_none_match.split(',')
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Ответ 304 Not Modified без тела.
+
+    Args:
+        etag (str): ETag ответа.
+
+    Returns:
+        Response: Ответ 304 с заголовком ETag.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag}
+    )
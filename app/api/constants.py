@@ -13,8 +13,25 @@ class MeetingRoomConstants:
     )
     GET_ALL_SUMMARY = 'Получить все переговорные комнаты'
     GET_ALL_DESCRIPTION = (
-        'Возвращает список всех переговорных комнат.\n\n'
-        'Ответ: список объектов MeetingRoomDB.'
+        'Возвращает страницу списка переговорных комнат, упорядоченных по ID.\n\n'
+        'Параметры: limit — размер страницы, after — курсор из next_cursor '
+        'предыдущей страницы, unbounded=true — вернуть все комнаты одной страницей.\n\n'
+        'Ответ: объект MeetingRoomPage (items и next_cursor; '
+        'на последней странице next_cursor отсутствует) и заголовок ETag. '
+        'Если If-None-Match совпадает с ETag — 304 без тела.'
+    )
+    AVAILABILITY_SUMMARY = 'Свободные переговорные комнаты'
+    AVAILABILITY_DESCRIPTION = (
+        'Возвращает для каждой комнаты свободные промежутки в окне [from, to], '
+        'длина которых не меньше duration минут.\n\n'
+        'Пример запроса:\n'
+        '/meeting_rooms/availability?from=2024-06-01T09:00:00&to=2024-06-01T18:00:00&duration=60\n\n'
+        'Границы промежутков совпадают с границами соседних бронирований: '
+        'бронирования, которые касаются границами, не пересекаются, поэтому '
+        'промежуток можно забронировать целиком.\n'
+        'Комнаты без подходящих промежутков в ответ не попадают.\n\n'
+        'Ответ: список объектов MeetingRoomAvailability.\n'
+        'Ошибки: 422 — некорректное или слишком длинное окно поиска.'
     )
     UPDATE_SUMMARY = 'Обновить переговорную комнату'
     UPDATE_DESCRIPTION = (
@@ -32,10 +49,41 @@ class MeetingRoomConstants:
     )
     GET_RESERVATIONS_SUMMARY = 'Бронирования для комнаты'
     GET_RESERVATIONS_DESCRIPTION = (
-        'Возвращает список будущих бронирований для выбранной переговорной комнаты.\n\n'
+        'Возвращает бронирования выбранной переговорной комнаты, пересекающиеся '
+        'с окном [from, to), упорядоченные по времени начала.\n\n'
+        'Параметры: from — начало окна (по умолчанию текущее время), '
+        'to — окончание окна (по умолчанию не ограничено), '
+        'limit — максимальное количество бронирований (по умолчанию '
+        'не ограничено). Если в окне есть бронирования сверх limit, заголовок '
+        'X-Next-From содержит значение from для следующей части расписания.\n\n'
+        'Пример запроса:\n'
+        '/meeting_rooms/1/reservations?from=2024-06-03T00:00:00&to=2024-06-10T00:00:00\n\n'
         'Ответ: список объектов ReservationDB.\n'
+        'Ошибки: 404 — комната не найдена, 422 — окончание окна не позже его начала.'
+    )
+    SCHEDULE_NEXT_FROM_HEADER = 'X-Next-From'
+    EVENTS_SUMMARY = 'События расписания комнаты'
+    EVENTS_DESCRIPTION = (
+        'Поток server-sent events (text/event-stream) с изменениями '
+        'бронирований выбранной переговорной комнаты вместо периодического '
+        'опроса /meeting_rooms/{id}/reservations.\n\n'
+        'События: reservation_created, reservation_updated, '
+        'reservation_deleted; data — {"reservations": [...]} с бронированиями '
+        'одной записи (для серии или пакета — все её вхождения) в формате '
+        'ReservationDB без user_id. Событие meeting_room_deleted '
+        '(data — {"meetingroom_id": ...}) означает удаление комнаты вместе '
+        'со всеми её бронированиями. При переподключении заголовок Last-Event-ID '
+        'возобновляет поток с пропущенных событий. Событие reset означает, '
+        'что пропущенные события недоступны и расписание нужно загрузить '
+        'заново. Медленный клиент, не успевающий читать поток, отключается.\n'
         'Ошибки: 404 — комната не найдена.'
     )
+    ALL_EVENTS_SUMMARY = 'События расписания всех комнат'
+    ALL_EVENTS_DESCRIPTION = (
+        'Поток server-sent events с изменениями бронирований всех '
+        'переговорных комнат. Формат событий и возобновление по '
+        'Last-Event-ID — как у /meeting_rooms/{id}/events.'
+    )
 
 class ReservationConstants:
     CREATE_SUMMARY = 'Создать бронирование'
@@ -43,13 +91,39 @@ class ReservationConstants:
         'Создаёт новое бронирование переговорной комнаты.\n\n'
         'Пример запроса:\n'
         '{"meetingroom_id": 1, "date_start": "2024-06-01T10:00:00", "date_end": "2024-06-01T11:00:00"}\n\n'
-        'Ответ: созданное бронирование.\n'
+        'Для повторяющегося бронирования передайте поле recurrence:\n'
+        '{"frequency": "weekly", "interval": 1, "count": 52} '
+        '(вместо count можно указать until).\n'
+        'Серия создаётся целиком или не создаётся вовсе.\n'
+        'Бронирование может начинаться в момент окончания другого.\n\n'
+        'Ответ: созданное бронирование (для серии — первое вхождение).\n'
         'Ошибки: 404 — комната не найдена, 422 — пересечение бронирований.'
     )
+    CREATE_BATCH_SUMMARY = 'Создать бронирования пакетом'
+    CREATE_BATCH_DESCRIPTION = (
+        'Создаёт несколько бронирований в одной транзакции.\n\n'
+        'Пример запроса:\n'
+        '[{"meetingroom_id": 1, "from_reserve": "2024-06-01T10:00:00", "to_reserve": "2024-06-01T11:00:00"}]\n\n'
+        'Бронирования, пересекающиеся с существующими или с более ранними '
+        'бронированиями того же пакета, не создаются.\n\n'
+        'Ответ: отчёт по каждому элементу (created, conflict, room_not_found).'
+    )
     GET_ALL_SUMMARY = 'Получить все бронирования'
     GET_ALL_DESCRIPTION = (
-        'Возвращает список всех бронирований. Только для суперпользователей.\n\n'
-        'Ответ: список объектов ReservationDB.'
+        'Возвращает страницу списка всех бронирований, упорядоченных по ID. '
+        'Только для суперпользователей.\n\n'
+        'Параметры: limit — размер страницы, after — курсор из next_cursor '
+        'предыдущей страницы, unbounded=true — вернуть все бронирования одной страницей.\n\n'
+        'Ответ: объект ReservationPage (items и next_cursor).'
+    )
+    EXPORT_SUMMARY = 'Выгрузить бронирования'
+    EXPORT_DESCRIPTION = (
+        'Потоково выгружает бронирования в формате NDJSON или CSV. '
+        'Только для суперпользователей.\n\n'
+        'Пример запроса:\n'
+        '/reservations/export?format=csv&from=2024-06-01T00:00:00&to=2024-07-01T00:00:00&room_id=1\n\n'
+        'Параметры from/to отбирают бронирования, пересекающиеся с периодом.\n\n'
+        'Ответ: поток строк (application/x-ndjson или text/csv).'
     )
     DELETE_SUMMARY = 'Удалить бронирование'
     DELETE_DESCRIPTION = (
@@ -67,8 +141,16 @@ class ReservationConstants:
     )
     GET_MY_SUMMARY = 'Мои бронирования'
     GET_MY_DESCRIPTION = (
-        'Возвращает список всех бронирований текущего пользователя.\n\n'
-        'Ответ: список объектов ReservationDB.'
+        'Возвращает страницу бронирований текущего пользователя, упорядоченных '
+        'по времени начала.\n\n'
+        'Параметры: upcoming_only=true — только незакончившиеся бронирования, '
+        'from/to — бронирования, пересекающие окно, order — asc или desc, '
+        'limit — размер страницы, after — курсор из next_cursor предыдущей '
+        'страницы.\n\n'
+        'Ответ: объект UserReservationPage (items и next_cursor; на последней '
+        'странице next_cursor равен null) и заголовок ETag. '
+        'Если If-None-Match совпадает с ETag — 304 без тела.\n'
+        'Ошибки: 422 — некорректное окно или курсор.'
     )
 
 class UserConstants:
@@ -90,11 +172,31 @@ class UserConstants:
         'Некоторые операции доступны только администраторам.'
     )
 
+class MetricsConstants:
+    METRICS_SUMMARY = 'Метрики Prometheus'
+    METRICS_DESCRIPTION = (
+        'Возвращает метрики приложения в текстовом формате Prometheus: '
+        'количество и время HTTP-запросов по шаблону маршрута, '
+        'обрабатываемые запросы, количество и время SQL-запросов на запрос, '
+        'состояние пула соединений, блокировок комнат, групповой фиксации '
+        'и кэшей.'
+    )
+
+class ScheduleEventType:
+    RESERVATION_CREATED = 'reservation_created'
+    RESERVATION_UPDATED = 'reservation_updated'
+    RESERVATION_DELETED = 'reservation_deleted'
+    MEETING_ROOM_DELETED = 'meeting_room_deleted'
+
 class MeetingRoomDetail:
     DUPLICATE_NAME = 'Переговорка с таким именем уже существует!'
     NOT_FOUND = 'Переговорка не найдена!'
+    INVALID_WINDOW = 'Начало окна поиска должно быть раньше его окончания!'
+    WINDOW_TOO_LONG = 'Окно поиска не может быть длиннее {max_days} дней!'
 
 class ReservationDetail:
     INTERSECTION = 'Пересечение бронирований по времени!'
+    RECURRENCE_IN_BATCH = 'Пакетное создание не поддерживает повторяющиеся бронирования!'
     NOT_FOUND = 'Бронь не найдена!'
     FORBIDDEN = 'Невозможно редактировать или удалить чужую бронь!'
+    INVALID_CURSOR = 'Некорректный курсор страницы бронирований!'
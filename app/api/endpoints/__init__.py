@@ -1,3 +1,4 @@
 from .meeting_room import router as meeting_room_router
+from .metrics import router as metrics_router
 from .reservation import router as reservation_router
 from .user import router as user_router
@@ -1,19 +1,43 @@
 """
 Эндпоинты для управления переговорными комнатами.
 
-Содержит CRUD-операции для переговорных комнат и получение бронирований по комнате.
+Содержит CRUD-операции для переговорных комнат, получение бронирований по комнате
+и потоки событий расписания.
 """
 
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.validators import check_meeting_room_exists, check_name_duplicate
-from app.core.db import get_async_session
+from app.api.conditional import etag_matches, not_modified
+from app.api.events import event_stream_response, publish_room_deleted
+from app.api.validators import (
+    check_availability_window,
+    check_meeting_room_exists,
+    check_meeting_room_id_exists,
+    check_meeting_room_updated,
+    check_name_duplicate,
+    check_room_schedule_found,
+    check_schedule_window
+)
+from app.core.db import get_async_read_session, get_async_session
+from app.core.serialization import json_response, trusted_items
 from app.core.user import current_superuser
 from app.crud.meeting_room import meeting_room_crud
 from app.crud.reservation import reservation_crud
-from app.schemas.meeting_room import MeetingRoomCreate, MeetingRoomDB, MeetingRoomUpdate
-from app.schemas.reservation import ReservationDB
+from app.crud.room_catalog import room_catalog
+from app.schemas.constants import PaginationConstants
+from app.schemas.meeting_room import (
+    MeetingRoomAvailability,
+    MeetingRoomCreate,
+    MeetingRoomDB,
+    MeetingRoomPage,
+    MeetingRoomUpdate
+)
+from app.schemas.reservation import RESERVATION_PUBLIC_EXCLUDE, ReservationDB
 from app.api.constants import MeetingRoomConstants
 
 router = APIRouter()
@@ -48,25 +72,96 @@ async def create_new_meeting_room(
 
 @router.get(
     '/',
-    response_model=list[MeetingRoomDB],
+    response_model=MeetingRoomPage,
     response_model_exclude_none=True,
     summary=MeetingRoomConstants.GET_ALL_SUMMARY,
     description=MeetingRoomConstants.GET_ALL_DESCRIPTION,
 )
 async def get_all_meeting_rooms(
-    session: AsyncSession = Depends(get_async_session),
-) -> list[MeetingRoomDB]:
+    limit: int = Query(
+        PaginationConstants.DEFAULT_LIMIT, ge=1, le=PaginationConstants.MAX_LIMIT
+    ),
+    after: Optional[int] = None,
+    unbounded: bool = False,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
     """
-    Получить список всех переговорных комнат.
+    Получить страницу списка переговорных комнат из кэша каталога.
+
+    Тело ответа сериализуется один раз и переиспользуется до изменения
+    каталога; при совпадении If-None-Match с ETag возвращается 304.
     
     Args:
-        session (AsyncSession): Асинхронная сессия БД.
+        limit (int): Размер страницы.
+        after (Optional[int]): Курсор — ID последней комнаты предыдущей страницы.
+        unbounded (bool): Вернуть все комнаты без ограничения limit.
+        if_none_match (Optional[str]): ETag, уже имеющийся у клиента.
+        session (AsyncSession): Асинхронная сессия БД для чтения.
     
     Returns:
-        list[MeetingRoomDB]: Список комнат.
+        Response: JSON-страница MeetingRoomPage или 304 Not Modified.
     """
-    all_rooms = await meeting_room_crud.get_multi(session)
-    return all_rooms
+    body, etag = await room_catalog.get_page(
+        session, None if unbounded else limit, after
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(
+        content=body, media_type='application/json', headers={'ETag': etag}
+    )
+
+
+@router.get(
+    '/availability',
+    response_model=list[MeetingRoomAvailability],
+    summary=MeetingRoomConstants.AVAILABILITY_SUMMARY,
+    description=MeetingRoomConstants.AVAILABILITY_DESCRIPTION,
+)
+async def get_meeting_rooms_availability(
+    window_start: datetime = Query(..., alias='from'),
+    window_end: datetime = Query(..., alias='to'),
+    duration: int = Query(..., ge=1),
+    session: AsyncSession = Depends(get_async_session),
+) -> list[MeetingRoomAvailability]:
+    """
+    Найти свободные промежутки нужной длины во всех переговорных комнатах.
+
+    Args:
+        window_start (datetime): Начало окна поиска.
+        window_end (datetime): Окончание окна поиска.
+        duration (int): Минимальная длина промежутка в минутах.
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Returns:
+        list[MeetingRoomAvailability]: Свободные промежутки по комнатам.
+    """
+    check_availability_window(window_start, window_end)
+    availability = await meeting_room_crud.get_availability(
+        window_start, window_end, timedelta(minutes=duration), session
+    )
+    return availability
+
+
+@router.get(
+    '/events',
+    response_class=StreamingResponse,
+    summary=MeetingRoomConstants.ALL_EVENTS_SUMMARY,
+    description=MeetingRoomConstants.ALL_EVENTS_DESCRIPTION,
+)
+async def get_all_rooms_events(
+    last_event_id: Optional[int] = Header(None),
+) -> StreamingResponse:
+    """
+    Поток событий расписания всех переговорных комнат.
+
+    Args:
+        last_event_id (Optional[int]): ID последнего полученного события.
+
+    Returns:
+        StreamingResponse: Поток text/event-stream.
+    """
+    return event_stream_response(None, last_event_id)
 
 
 @router.patch(
@@ -99,7 +194,7 @@ async def partially_update_meeting_room(
     meeting_room = await meeting_room_crud.update(
         meeting_room, obj_in, session
     )
-    return meeting_room
+    return check_meeting_room_updated(meeting_room)
 
 
 @router.delete(
@@ -126,32 +221,94 @@ async def remove_meeting_room(
     """
     meeting_room = await check_meeting_room_exists(meeting_room_id, session)
     meeting_room = await meeting_room_crud.remove(meeting_room, session)
+    publish_room_deleted(meeting_room.id)
     return meeting_room
 
 
 @router.get(
     '/{meeting_room_id}/reservations',
     response_model=list[ReservationDB],
-    response_model_exclude={'user_id'},
+    response_model_exclude=RESERVATION_PUBLIC_EXCLUDE,
     summary=MeetingRoomConstants.GET_RESERVATIONS_SUMMARY,
     description=MeetingRoomConstants.GET_RESERVATIONS_DESCRIPTION,
 )
 async def get_reservations_for_room(
     meeting_room_id: int,
-    session: AsyncSession = Depends(get_async_session),
-) -> list[ReservationDB]:
+    window_start: Optional[datetime] = Query(None, alias='from'),
+    window_end: Optional[datetime] = Query(None, alias='to'),
+    limit: Optional[int] = Query(None, ge=1, le=PaginationConstants.MAX_LIMIT),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> ORJSONResponse:
     """
-    Получить список будущих бронирований для выбранной переговорной комнаты.
+    Получить бронирования выбранной переговорной комнаты в окне времени.
+
+    Строки БД сериализуются напрямую, без построения ReservationDB. Если
+    limit отсёк часть окна, заголовок X-Next-From содержит окончание
+    последнего бронирования — начало окна для следующего запроса.
     
     Args:
         meeting_room_id (int): ID комнаты.
-        session (AsyncSession): Асинхронная сессия БД.
+        window_start (Optional[datetime]): Начало окна (по умолчанию — сейчас).
+        window_end (Optional[datetime]): Окончание окна (по умолчанию не ограничено).
+        limit (Optional[int]): Максимальное количество бронирований
+            (по умолчанию не ограничено).
+        session (AsyncSession): Асинхронная сессия БД для чтения.
     
     Returns:
-        list[ReservationDB]: Список бронирований.
+        ORJSONResponse: Бронирования, упорядоченные по началу.
     """
-    await check_meeting_room_exists(meeting_room_id, session)
-    reservations = await reservation_crud.get_future_reservations_for_room(
-        room_id=meeting_room_id, session=session
+    if window_start is None:
+        window_start = datetime.now()
+    check_schedule_window(window_start, window_end)
+    reservations = check_room_schedule_found(
+        await reservation_crud.get_room_schedule(
+            room_id=meeting_room_id,
+            session=session,
+            from_reserve=window_start,
+            to_reserve=window_end,
+            limit=None if limit is None else limit + 1,
+        )
+    )
+    headers = None
+    if limit is not None and len(reservations) > limit:
+        reservations = reservations[:limit]
+        headers = {
+            MeetingRoomConstants.SCHEDULE_NEXT_FROM_HEADER:
+                reservations[-1].to_reserve.isoformat()
+        }
+    return json_response(
+        trusted_items(
+            ReservationDB, reservations, exclude=RESERVATION_PUBLIC_EXCLUDE
+        ),
+        headers=headers,
     )
-    return reservations
+
+
+@router.get(
+    '/{meeting_room_id}/events',
+    response_class=StreamingResponse,
+    summary=MeetingRoomConstants.EVENTS_SUMMARY,
+    description=MeetingRoomConstants.EVENTS_DESCRIPTION,
+)
+async def get_room_events(
+    meeting_room_id: int,
+    last_event_id: Optional[int] = Header(None),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> StreamingResponse:
+    """
+    Поток событий расписания выбранной переговорной комнаты.
+
+    Сессия закрывается до начала потока, чтобы подписчик не удерживал
+    соединение с БД.
+
+    Args:
+        meeting_room_id (int): ID комнаты.
+        last_event_id (Optional[int]): ID последнего полученного события.
+        session (AsyncSession): Асинхронная сессия БД для чтения.
+
+    Returns:
+        StreamingResponse: Поток text/event-stream.
+    """
+    await check_meeting_room_id_exists(meeting_room_id, session)
+    await session.close()
+    return event_stream_response(meeting_room_id, last_event_id)
@@ -0,0 +1,29 @@
+"""
+Эндпоинт метрик приложения в формате Prometheus.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import metrics
+from app.api.constants import MetricsConstants
+
+router = APIRouter()
+
+
+@router.get(
+    '/metrics',
+    response_class=PlainTextResponse,
+    summary=MetricsConstants.METRICS_SUMMARY,
+    description=MetricsConstants.METRICS_DESCRIPTION,
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Получить метрики приложения.
+
+    Returns:
+        PlainTextResponse: Метрики в текстовом формате Prometheus 0.0.4.
+    """
+    return PlainTextResponse(
+        metrics.render(), media_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -2,22 +2,55 @@
 Эндпоинты для управления бронированиями переговорных комнат.
 
 Содержит CRUD-операции для бронирований и получение бронирований пользователя.
+Создания, изменения и удаления публикуются в поток событий расписания.
 """
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import compute_etag, etag_matches, not_modified
+from app.api.events import publish_reservations
+from app.api.export import MEDIA_TYPES, stream_reservations
+
 from app.api.validators import (
-    check_meeting_room_exists,
+    check_batch_without_recurrence,
+    check_meeting_room_id_exists,
     check_reservation_before_edit,
-    check_reservation_intersections
+    check_reservation_created,
+    check_reservation_cursor,
+    check_reservation_not_deleted,
+    check_reservation_updated,
+    check_reservation_intersections,
+    check_schedule_window,
+    check_series_intersections
 )
-from app.core.db import get_async_session
+from app.core.config import settings
+from app.core.db import get_async_read_session, get_async_session
+from app.core.locks import room_locks
+from app.core.serialization import json_response, trusted_items
 from app.core.user import current_superuser, current_user
+from app.crud.group_commit import reservation_writer
 from app.crud.reservation import reservation_crud
 from app.models import User
-from app.schemas.reservation import ReservationCreate, ReservationDB, ReservationUpdate
-from app.api.constants import ReservationConstants
+from app.schemas.constants import PaginationConstants
+from app.schemas.reservation import (
+    RESERVATION_PUBLIC_EXCLUDE,
+    ReservationBatchCreate,
+    ReservationBatchItem,
+    ReservationCreate,
+    ReservationDB,
+    ReservationExportFormat,
+    ReservationOrder,
+    ReservationPage,
+    ReservationUpdate,
+    UserReservationPage,
+    encode_reservation_cursor
+)
+from app.api.constants import ReservationConstants, ScheduleEventType
 
 router = APIRouter()
 
@@ -42,35 +75,169 @@ async def create_reservation(
         user (User): Текущий пользователь.
 
     Returns:
-        ReservationDB: Созданное бронирование.
+        ReservationDB: Созданное бронирование (для серии — первое вхождение).
     """
-    await check_meeting_room_exists(reservation.meetingroom_id, session)
-    await check_reservation_intersections(**reservation.dict(), session=session)
-    new_reservation = await reservation_crud.create(reservation, session, user)
+    if reservation.recurrence is None and settings.group_commit_enabled:
+        new_reservation = await reservation_writer.create(
+            reservation, session, user
+        )
+        new_reservation = await check_reservation_created(
+            new_reservation, reservation.meetingroom_id, session
+        )
+        publish_reservations(
+            ScheduleEventType.RESERVATION_CREATED, [new_reservation]
+        )
+        return new_reservation
+    async with room_locks.hold(reservation.meetingroom_id):
+        if reservation.recurrence is not None:
+            await reservation_crud.lock_rooms(
+                [reservation.meetingroom_id], session
+            )
+            await check_meeting_room_id_exists(
+                reservation.meetingroom_id, session
+            )
+            await check_series_intersections(reservation, session)
+            occurrences = await reservation_crud.create_series(
+                reservation, session, user
+            )
+            publish_reservations(
+                ScheduleEventType.RESERVATION_CREATED, occurrences
+            )
+            return occurrences[0]
+        new_reservation = await reservation_crud.create_if_free(
+            reservation, session, user
+        )
+    new_reservation = await check_reservation_created(
+        new_reservation, reservation.meetingroom_id, session
+    )
+    publish_reservations(ScheduleEventType.RESERVATION_CREATED, [new_reservation])
     return new_reservation
 
 
+@router.post(
+    '/batch',
+    response_model=list[ReservationBatchItem],
+    summary=ReservationConstants.CREATE_BATCH_SUMMARY,
+    description=ReservationConstants.CREATE_BATCH_DESCRIPTION,
+)
+async def create_reservations_batch(
+    reservations: ReservationBatchCreate,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user),
+) -> list[ReservationBatchItem]:
+    """
+    Создать пакет бронирований в одной транзакции.
+
+    Args:
+        reservations (ReservationBatchCreate): Список бронирований для создания.
+        session (AsyncSession): Асинхронная сессия БД.
+        user (User): Текущий пользователь.
+
+    Returns:
+        list[ReservationBatchItem]: Отчёт по каждому бронированию пакета.
+    """
+    check_batch_without_recurrence(reservations)
+    async with room_locks.hold(
+        *{reservation.meetingroom_id for reservation in reservations}
+    ):
+        results = await reservation_crud.create_batch(
+            reservations, session, user
+        )
+    publish_reservations(
+        ScheduleEventType.RESERVATION_CREATED,
+        [db_obj for _, db_obj in results if db_obj is not None],
+    )
+    return [
+        ReservationBatchItem(
+            index=index,
+            status=status,
+            reservation=db_obj and ReservationDB.from_orm(db_obj)
+        )
+        for index, (status, db_obj) in enumerate(results)
+    ]
+
+
 @router.get(
     '/',
-    response_model=list[ReservationDB],
+    response_model=ReservationPage,
     dependencies=[Depends(current_superuser)],
     summary=ReservationConstants.GET_ALL_SUMMARY,
     description=ReservationConstants.GET_ALL_DESCRIPTION,
 )
 async def get_all_reservations(
-    session: AsyncSession = Depends(get_async_session)
-) -> list[ReservationDB]:
+    limit: int = Query(
+        PaginationConstants.DEFAULT_LIMIT, ge=1, le=PaginationConstants.MAX_LIMIT
+    ),
+    after: Optional[int] = None,
+    unbounded: bool = False,
+    session: AsyncSession = Depends(get_async_read_session)
+) -> ORJSONResponse:
+    """
+    Получить страницу списка всех бронирований (только для суперпользователей).
+
+    Строки БД сериализуются напрямую, без построения ReservationDB.
+
+    Args:
+        limit (int): Размер страницы.
+        after (Optional[int]): Курсор — ID последнего бронирования предыдущей страницы.
+        unbounded (bool): Вернуть все бронирования без ограничения limit.
+        session (AsyncSession): Асинхронная сессия БД для чтения.
+
+    Returns:
+        ORJSONResponse: Страница ReservationPage — бронирования и курсор
+            следующей страницы.
+    """
+    if unbounded:
+        reservations = await reservation_crud.get_multi(
+            session, limit=None, after=after, as_rows=True
+        )
+        next_cursor = None
+    else:
+        reservations, next_cursor = await reservation_crud.get_page(
+            session, limit, after, as_rows=True
+        )
+    return json_response({
+        'items': trusted_items(ReservationDB, reservations),
+        'next_cursor': next_cursor,
+    })
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    dependencies=[Depends(current_superuser)],
+    summary=ReservationConstants.EXPORT_SUMMARY,
+    description=ReservationConstants.EXPORT_DESCRIPTION,
+)
+async def export_reservations(
+    export_format: ReservationExportFormat = Query(
+        ReservationExportFormat.NDJSON, alias='format'
+    ),
+    from_reserve: Optional[datetime] = Query(None, alias='from'),
+    to_reserve: Optional[datetime] = Query(None, alias='to'),
+    room_id: Optional[int] = None,
+) -> StreamingResponse:
     """
-    Получить список всех бронирований (только для суперпользователей).
+    Потоково выгрузить бронирования в NDJSON или CSV (только для суперпользователей).
 
     Args:
-        session (AsyncSession): Асинхронная сессия БД.
+        export_format (ReservationExportFormat): Формат выгрузки.
+        from_reserve (Optional[datetime]): Бронирования, заканчивающиеся позже.
+        to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше.
+        room_id (Optional[int]): ID переговорной комнаты.
 
     Returns:
-        list[ReservationDB]: Список бронирований.
+        StreamingResponse: Потоковый ответ с выгрузкой.
     """
-    reservations = await reservation_crud.get_multi(session)
-    return reservations
+    return StreamingResponse(
+        stream_reservations(export_format, from_reserve, to_reserve, room_id),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename=reservations.{export_format.value}'
+            )
+        },
+    )
 
 
 @router.delete(
@@ -97,6 +264,7 @@ async def delete_reservation(
     """
     reservation = await check_reservation_before_edit(reservation_id, session, user)
     reservation = await reservation_crud.remove(reservation, session)
+    publish_reservations(ScheduleEventType.RESERVATION_DELETED, [reservation])
     return reservation
 
 
@@ -125,40 +293,90 @@ async def update_reservation(
         ReservationDB: Обновлённое бронирование.
     """
     reservation = await check_reservation_before_edit(reservation_id, session, user)
-    await check_reservation_intersections(
-        **obj_in.dict(),
-        reservation_id=reservation_id,
-        meetingroom_id=reservation.meetingroom_id,
-        session=session
-    )
-    reservation = await reservation_crud.update(
-        db_obj=reservation,
-        obj_in=obj_in,
-        session=session,
-    )
+    if settings.group_commit_enabled:
+        updated = await reservation_writer.update(reservation, obj_in, session)
+        updated = check_reservation_updated(updated)
+        publish_reservations(ScheduleEventType.RESERVATION_UPDATED, [updated])
+        return updated
+    async with room_locks.hold(reservation.meetingroom_id):
+        await check_reservation_intersections(
+            **obj_in.dict(),
+            reservation_id=reservation_id,
+            meetingroom_id=reservation.meetingroom_id,
+            session=session
+        )
+        reservation = await reservation_crud.update(
+            db_obj=reservation,
+            obj_in=obj_in,
+            session=session,
+        )
+    reservation = check_reservation_not_deleted(reservation)
+    publish_reservations(ScheduleEventType.RESERVATION_UPDATED, [reservation])
     return reservation
 
 
 @router.get(
     '/my_reservations',
-    response_model=list[ReservationDB],
-    response_model_exclude={'user_id'},
+    response_model=UserReservationPage,
     summary=ReservationConstants.GET_MY_SUMMARY,
     description=ReservationConstants.GET_MY_DESCRIPTION,
 )
 async def get_my_reservations(
-    session: AsyncSession = Depends(get_async_session),
+    upcoming_only: bool = False,
+    from_reserve: Optional[datetime] = Query(None, alias='from'),
+    to_reserve: Optional[datetime] = Query(None, alias='to'),
+    order: ReservationOrder = ReservationOrder.ASC,
+    limit: int = Query(
+        PaginationConstants.DEFAULT_LIMIT, ge=1, le=PaginationConstants.MAX_LIMIT
+    ),
+    after: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_read_session),
     user: User = Depends(current_user)
-) -> list[ReservationDB]:
+) -> Response:
     """
-    Получить список всех бронирований для текущего пользователя.
+    Получить страницу бронирований текущего пользователя.
+
+    ETag вычисляется по строкам БД до сериализации: при совпадении
+    с If-None-Match возвращается 304 без построения тела ответа. Иначе
+    строки сериализуются напрямую, без построения ReservationDB.
 
     Args:
-        session (AsyncSession): Асинхронная сессия БД.
+        upcoming_only (bool): Только ещё не закончившиеся бронирования.
+        from_reserve (Optional[datetime]): Бронирования, заканчивающиеся позже.
+        to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше.
+        order (ReservationOrder): Порядок сортировки по началу.
+        limit (int): Размер страницы.
+        after (Optional[str]): Курсор из next_cursor предыдущей страницы.
+        if_none_match (Optional[str]): ETag, уже имеющийся у клиента.
+        session (AsyncSession): Асинхронная сессия БД для чтения.
         user (User): Текущий пользователь.
 
     Returns:
-        list[ReservationDB]: Список бронирований пользователя.
+        Response: JSON-страница UserReservationPage или 304 Not Modified.
     """
-    reservations = await reservation_crud.get_by_user(session=session, user=user)
-    return reservations
+    if from_reserve is not None:
+        check_schedule_window(from_reserve, to_reserve)
+    rows, next_key = await reservation_crud.get_user_page(
+        session,
+        user,
+        limit,
+        from_reserve=from_reserve,
+        to_reserve=to_reserve,
+        upcoming_only=upcoming_only,
+        order=order,
+        after=check_reservation_cursor(after),
+    )
+    next_cursor = next_key and encode_reservation_cursor(*next_key)
+    etag = compute_etag(user.id, [tuple(row) for row in rows], next_cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return json_response(
+        {
+            'items': trusted_items(
+                ReservationDB, rows, exclude=RESERVATION_PUBLIC_EXCLUDE
+            ),
+            'next_cursor': next_cursor,
+        },
+        headers={'ETag': etag},
+    )
@@ -0,0 +1,130 @@
+"""
+Потоки server-sent events с изменениями расписания комнат.
+
+Эндпоинты бронирований публикуют изменения через publish_reservations,
+удаление комнаты — через publish_room_deleted, эндпоинты событий отдают их подписчикам хаба schedule_events.
+"""
+
+import asyncio
+from typing import AsyncIterator, Iterable, Optional
+
+from fastapi.responses import StreamingResponse
+
+from app.api.constants import ScheduleEventType
+from app.core.config import settings
+from app.core.events import schedule_events
+from app.core.serialization import trusted_items
+from app.models import Reservation
+from app.schemas.reservation import RESERVATION_PUBLIC_EXCLUDE, ReservationDB
+
+KEEPALIVE = b': keepalive\n\n'
+EVENT_STREAM_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+
+
+def publish_reservations(
+    event_type: str,
+    reservations: Iterable[Reservation],
+) -> None:
+    """
+    Опубликовать одно событие со всеми бронированиями записи.
+
+    Подписчики комнаты получают только её бронирования, подписчики всех
+    комнат — все. Серия или пакет занимают в очереди подписчика одно
+    событие, а не по событию на бронирование.
+
+    Args:
+        event_type (str): Тип события из ScheduleEventType.
+        reservations (Iterable[Reservation]): Бронирования.
+    """
+    items = trusted_items(
+        ReservationDB, reservations, exclude=RESERVATION_PUBLIC_EXCLUDE
+    )
+    if not items:
+        return
+    items_by_room: dict[int, list[dict]] = {}
+    for item in items:
+        items_by_room.setdefault(item['meetingroom_id'], []).append(item)
+    schedule_events.publish(
+        event_type,
+        {
+            room_id: {'reservations': room_items}
+            for room_id, room_items in items_by_room.items()
+        },
+        {'reservations': items},
+    )
+
+
+def publish_room_deleted(room_id: int) -> None:
+    """
+    Опубликовать удаление комнаты вместе со всеми её бронированиями.
+
+    Args:
+        room_id (int): ID удалённой комнаты.
+    """
+    data = {'meetingroom_id': room_id}
+    schedule_events.publish(
+        ScheduleEventType.MEETING_ROOM_DELETED, {room_id: data}, data
+    )
+
+
+async def stream_events(
+    room_id: Optional[int],
+    last_event_id: Optional[int],
+) -> AsyncIterator[bytes]:
+    """
+    Подписаться на события и отдавать их, пока клиент подключён.
+
+    Накопившиеся в очереди события отправляются одним фрагментом; без
+    событий раз в events_keepalive_seconds отправляется комментарий, чтобы
+    прокси не закрывали соединение.
+
+    Args:
+        room_id (Optional[int]): ID комнаты; None — все комнаты.
+        last_event_id (Optional[int]): Last-Event-ID клиента.
+
+    Yields:
+        bytes: Фрагменты text/event-stream.
+    """
+    subscriber = schedule_events.subscribe(room_id, last_event_id)
+    queue = subscriber.queue
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(
+                    queue.get(), settings.events_keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                yield KEEPALIVE
+                continue
+            frames = [frame]
+            while frames[-1] is not None and not queue.empty():
+                frames.append(queue.get_nowait())
+            if frames[-1] is None:
+                frames.pop()
+                if frames:
+                    yield b''.join(frames)
+                return
+            yield b''.join(frames)
+    finally:
+        schedule_events.unsubscribe(subscriber)
+
+
+def event_stream_response(
+    room_id: Optional[int],
+    last_event_id: Optional[int],
+) -> StreamingResponse:
+    """
+    Ответ с потоком событий расписания.
+
+    Args:
+        room_id (Optional[int]): ID комнаты; None — все комнаты.
+        last_event_id (Optional[int]): Last-Event-ID клиента.
+
+    Returns:
+        StreamingResponse: Поток text/event-stream.
+    """
+    return StreamingResponse(
+        stream_events(room_id, last_event_id),
+        media_type='text/event-stream',
+        headers=EVENT_STREAM_HEADERS,
+    )
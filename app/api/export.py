@@ -0,0 +1,118 @@
+"""
+Потоковая сериализация бронирований для выгрузки в NDJSON и CSV.
+
+Строки БД сериализуются напрямую из кортежей Row, без ORM-объектов и Pydantic.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.core.db import AsyncSessionLocal
+from app.crud.reservation import EXPORT_COLUMNS, reservation_crud
+from app.schemas.reservation import ReservationExportFormat
+
+EXPORT_FIELDS = tuple(column.key for column in EXPORT_COLUMNS)
+MEDIA_TYPES = {
+    ReservationExportFormat.NDJSON: 'application/x-ndjson',
+    ReservationExportFormat.CSV: 'text/csv',
+}
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """
+    Преобразовать дату в строку ISO 8601.
+
+    Args:
+        value (Optional[datetime]): Дата или None.
+
+    Returns:
+        Optional[str]: Строка ISO 8601 или None.
+    """
+    return value.isoformat() if value is not None else None
+
+
+def serialize_ndjson(rows: list) -> str:
+    """
+    Сериализовать партию строк в NDJSON.
+
+    Args:
+        rows (list): Строки из EXPORT_COLUMNS.
+
+    Returns:
+        str: По одному JSON-объекту на строку.
+    """
+    return ''.join(
+        json.dumps({
+            'id': reservation_id,
+            'from_reserve': _isoformat(from_reserve),
+            'to_reserve': _isoformat(to_reserve),
+            'meetingroom_id': meetingroom_id,
+            'user_id': user_id,
+            'series_id': series_id,
+        }, ensure_ascii=False) + '\n'
+        for (
+            reservation_id, from_reserve, to_reserve,
+            meetingroom_id, user_id, series_id
+        ) in rows
+    )
+
+
+def serialize_csv(rows: list) -> str:
+    """
+    Сериализовать партию строк в CSV (без заголовка).
+
+    Args:
+        rows (list): Строки из EXPORT_COLUMNS.
+
+    Returns:
+        str: Строки CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (
+            reservation_id, _isoformat(from_reserve), _isoformat(to_reserve),
+            meetingroom_id, user_id, series_id
+        )
+        for (
+            reservation_id, from_reserve, to_reserve,
+            meetingroom_id, user_id, series_id
+        ) in rows
+    )
+    return buffer.getvalue()
+
+
+async def stream_reservations(
+    export_format: ReservationExportFormat,
+    from_reserve: Optional[datetime] = None,
+    to_reserve: Optional[datetime] = None,
+    meetingroom_id: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    Потоково выгрузить бронирования в выбранном формате.
+
+    Открывает собственную сессию: она живёт, пока клиент читает ответ,
+    а не до завершения обработчика эндпоинта.
+
+    Args:
+        export_format (ReservationExportFormat): Формат выгрузки.
+        from_reserve (Optional[datetime]): Бронирования, заканчивающиеся позже.
+        to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше.
+        meetingroom_id (Optional[int]): ID переговорной комнаты.
+
+    Yields:
+        str: Очередной фрагмент выгрузки.
+    """
+    if export_format == ReservationExportFormat.CSV:
+        serialize = serialize_csv
+        yield ','.join(EXPORT_FIELDS) + '\r\n'
+    else:
+        serialize = serialize_ndjson
+    async with AsyncSessionLocal() as session:
+        async for rows in reservation_crud.stream_export_rows(
+            session, from_reserve, to_reserve, meetingroom_id
+        ):
+            yield serialize(rows)
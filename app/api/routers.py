@@ -4,8 +4,9 @@
 
 from fastapi import APIRouter
 from app.api.endpoints import (
-    meeting_room_router, reservation_router, user_router
+    meeting_room_router, metrics_router, reservation_router, user_router
 )
+from app.core.config import settings
 
 main_router = APIRouter()
 main_router.include_router(
@@ -15,3 +16,5 @@ main_router.include_router(
     reservation_router, prefix='/reservations', tags=['Reservations']
 )
 main_router.include_router(user_router)
+if settings.metrics_enabled:
+    main_router.include_router(metrics_router, tags=['Metrics'])
@@ -4,13 +4,21 @@
 Содержит проверки уникальности имени, существования объектов и прав пользователя.
 """
 
+from datetime import datetime, timedelta
+from typing import Optional
+
 from fastapi import HTTPException
 from fastapi import status
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.meeting_room import meeting_room_crud
 from app.crud.reservation import reservation_crud
 from app.models import MeetingRoom, Reservation, User
+from app.schemas.constants import MeetingRoomAvailabilityConstants
+from app.schemas.reservation import (
+    ReservationCreate, decode_reservation_cursor
+)
 from app.api.constants import MeetingRoomDetail, ReservationDetail
 
 
@@ -62,6 +70,127 @@ async def check_meeting_room_exists(
     return meeting_room
 
 
+async def check_meeting_room_id_exists(
+    meeting_room_id: int,
+    session: AsyncSession,
+) -> None:
+    """
+    Проверяет существование переговорной комнаты запросом EXISTS,
+    не загружая её из БД.
+
+    Args:
+        meeting_room_id (int): ID комнаты.
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Raises:
+        HTTPException: Если комната не найдена.
+    """
+    if not await meeting_room_crud.room_exists(meeting_room_id, session):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MeetingRoomDetail.NOT_FOUND
+        )
+
+
+def check_availability_window(
+    window_start: datetime,
+    window_end: datetime,
+) -> None:
+    """
+    Проверяет корректность окна поиска свободных комнат.
+
+    Args:
+        window_start (datetime): Начало окна.
+        window_end (datetime): Окончание окна.
+
+    Raises:
+        HTTPException: Если окно пустое или длиннее допустимого.
+    """
+    if window_start >= window_end:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=MeetingRoomDetail.INVALID_WINDOW
+        )
+    max_days = MeetingRoomAvailabilityConstants.MAX_WINDOW_DAYS
+    if window_end - window_start > timedelta(days=max_days):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=MeetingRoomDetail.WINDOW_TOO_LONG.format(max_days=max_days)
+        )
+
+
+def check_schedule_window(
+    window_start: datetime,
+    window_end: Optional[datetime],
+) -> None:
+    """
+    Проверяет окно расписания комнаты.
+
+    Args:
+        window_start (datetime): Начало окна.
+        window_end (Optional[datetime]): Окончание окна или None.
+
+    Raises:
+        HTTPException: Если окончание окна не позже его начала.
+    """
+    if window_end is not None and window_start >= window_end:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=MeetingRoomDetail.INVALID_WINDOW
+        )
+
+
+def check_room_schedule_found(
+    reservations: Optional[list[Row]],
+) -> list[Row]:
+    """
+    Проверяет, что расписание получено для существующей комнаты.
+
+    Args:
+        reservations (Optional[list[Row]]): Результат
+            get_room_schedule (None — комнаты нет).
+
+    Returns:
+        list[Row]: Бронирования комнаты.
+
+    Raises:
+        HTTPException: Если комната не найдена.
+    """
+    if reservations is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MeetingRoomDetail.NOT_FOUND
+        )
+    return reservations
+
+
+def check_reservation_cursor(
+    cursor: Optional[str],
+) -> Optional[tuple[datetime, int]]:
+    """
+    Проверяет и разбирает курсор страницы бронирований пользователя.
+
+    Args:
+        cursor (Optional[str]): Курсор из next_cursor или None.
+
+    Returns:
+        Optional[tuple[datetime, int]]: (from_reserve, id) последнего
+            бронирования предыдущей страницы или None.
+
+    Raises:
+        HTTPException: Если курсор некорректен.
+    """
+    if cursor is None:
+        return None
+    try:
+        return decode_reservation_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ReservationDetail.INVALID_CURSOR
+        )
+
+
 async def check_reservation_intersections(**kwargs) -> None:
     """
     Проверяет пересечения бронирований по времени и комнате.
@@ -72,16 +201,161 @@ async def check_reservation_intersections(**kwargs) -> None:
     Raises:
         HTTPException: Если есть пересекающиеся бронирования.
     """
-    reservations = await reservation_crud.get_reservations_at_the_same_time(
+    intersects = await reservation_crud.has_reservations_at_the_same_time(
         **kwargs
     )
-    if reservations:
+    if intersects:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=ReservationDetail.INTERSECTION
         )
 
 
+async def check_reservation_created(
+    reservation: Optional[Reservation],
+    meeting_room_id: int,
+    session: AsyncSession,
+) -> Reservation:
+    """
+    Проверяет результат атомарного создания бронирования.
+
+    Если бронирование не создано, отличает отсутствующую комнату (404)
+    от занятого интервала (422).
+
+    Args:
+        reservation (Optional[Reservation]): Результат create_if_free.
+        meeting_room_id (int): ID комнаты.
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Returns:
+        Reservation: Созданное бронирование.
+
+    Raises:
+        HTTPException: Если комната не найдена или интервал занят.
+    """
+    if reservation is None:
+        await check_meeting_room_exists(meeting_room_id, session)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ReservationDetail.INTERSECTION
+        )
+    return reservation
+
+
+def check_reservation_updated(
+    reservation: Optional[Reservation],
+) -> Reservation:
+    """
+    Проверяет результат условного изменения бронирования.
+
+    Args:
+        reservation (Optional[Reservation]): Изменённое бронирование или None.
+
+    Returns:
+        Reservation: Изменённое бронирование.
+
+    Raises:
+        HTTPException: Если новый интервал пересекается с другими бронированиями.
+    """
+    if reservation is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ReservationDetail.INTERSECTION
+        )
+    return reservation
+
+
+def check_meeting_room_updated(
+    meeting_room: Optional[MeetingRoom],
+) -> MeetingRoom:
+    """
+    Проверяет, что комната не была удалена во время изменения.
+
+    Args:
+        meeting_room (Optional[MeetingRoom]): Результат
+            meeting_room_crud.update (None — строки уже нет).
+
+    Returns:
+        MeetingRoom: Изменённая комната.
+
+    Raises:
+        HTTPException: Если комната удалена.
+    """
+    if meeting_room is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MeetingRoomDetail.NOT_FOUND
+        )
+    return meeting_room
+
+
+def check_reservation_not_deleted(
+    reservation: Optional[Reservation],
+) -> Reservation:
+    """
+    Проверяет, что бронирование не было удалено во время изменения.
+
+    Args:
+        reservation (Optional[Reservation]): Результат
+            reservation_crud.update (None — строки уже нет).
+
+    Returns:
+        Reservation: Изменённое бронирование.
+
+    Raises:
+        HTTPException: Если бронирование удалено.
+    """
+    if reservation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ReservationDetail.NOT_FOUND
+        )
+    return reservation
+
+
+async def check_series_intersections(
+    reservation: ReservationCreate,
+    session: AsyncSession,
+) -> None:
+    """
+    Проверяет пересечения всех вхождений серии одним диапазонным запросом.
+
+    Args:
+        reservation (ReservationCreate): Бронирование с правилом повторения.
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Raises:
+        HTTPException: Если хотя бы одно вхождение пересекается с бронированиями.
+    """
+    conflicts = await reservation_crud.find_conflicts(
+        reservation_crud.series_occurrences(reservation), session
+    )
+    if any(conflicts):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ReservationDetail.INTERSECTION
+        )
+
+
+def check_batch_without_recurrence(
+    reservations: list[ReservationCreate],
+) -> None:
+    """
+    Проверяет, что в пакете бронирований нет правил повторения.
+
+    Args:
+        reservations (list[ReservationCreate]): Пакет бронирований.
+
+    Raises:
+        HTTPException: Если хотя бы у одного бронирования задано повторение.
+    """
+    if any(reservation.recurrence is not None for reservation in reservations):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=ReservationDetail.RECURRENCE_IN_BATCH
+        )
+
+
 async def check_reservation_before_edit(
     reservation_id: int,
     session: AsyncSession,
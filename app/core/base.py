@@ -3,4 +3,4 @@
 """
 
 from app.core.db import Base  # noqa
-from app.models import MeetingRoom, Reservation, User  # noqa
+from app.models import MeetingRoom, Reservation, ReservationSeries, User  # noqa
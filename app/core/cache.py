@@ -0,0 +1,99 @@
+"""
+In-process кэш с ограничением по времени жизни (TTL) и размеру (LRU).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Кэш «ключ — значение» с вытеснением по TTL и LRU и счётчиками попаданий.
+
+    Предназначен для одного event loop: операции не блокируют и не требуют
+    синхронизации.
+    """
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        """
+        Инициализация кэша.
+
+        Args:
+            ttl_seconds (float): Время жизни записи в секундах; 0 отключает кэш.
+            max_size (int): Максимальное количество записей.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Включён ли кэш.
+
+        Returns:
+            bool: True, если TTL и размер больше нуля.
+        """
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Получить значение по ключу.
+
+        Args:
+            key (Hashable): Ключ.
+
+        Returns:
+            Optional[Any]: Значение или None, если записи нет или она устарела.
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Сохранить значение, вытеснив самую давнюю запись при переполнении.
+
+        Args:
+            key (Hashable): Ключ.
+            value (Any): Значение.
+        """
+        if not self.enabled:
+            return
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Удалить записи, ключи которых удовлетворяют условию.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Условие для ключа.
+        """
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """
+        Очистить кэш.
+        """
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Счётчики кэша.
+
+        Returns:
+            dict[str, int]: Попадания, промахи и текущий размер.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data)}
@@ -13,10 +13,46 @@ class Settings(BaseSettings):
     """
     app_title: str = 'Бронирование переговорок'
     database_url: str
+    database_echo: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30
+    database_pool_recycle: int = -1
+    database_pool_pre_ping: bool = False
+    database_read_url: Optional[str] = None
+    database_replica_max_lag_seconds: float = 2
+    database_replica_check_seconds: float = 1
+    database_replica_heartbeat_enabled: bool = False
+    database_read_your_writes_seconds: float = 5
+    sqlite_journal_mode: str = 'WAL'
+    sqlite_synchronous: str = 'NORMAL'
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = -64000
+    sqlite_mmap_size: int = 268435456
+    sqlite_temp_store: str = 'MEMORY'
     description: str = 'Описание проекта'
     secret: str = 'SECRET'
     first_superuser_email: Optional[EmailStr] = None
     first_superuser_password: Optional[str] = None
+    reservation_index_enabled: bool = False
+    user_cache_ttl_seconds: float = 30
+    user_cache_max_size: int = 10000
+    jwt_claims_enabled: bool = False
+    jwt_revocation_refresh_seconds: float = 30
+    room_catalog_ttl_seconds: float = 300
+    group_commit_enabled: bool = False
+    group_commit_window_ms: float = 2
+    group_commit_max_batch_size: int = 100
+    metrics_enabled: bool = False
+    sql_profiling_enabled: bool = False
+    sql_slow_query_ms: float = 100
+    sql_n_plus_one_threshold: int = 5
+    sql_profile_header_enabled: bool = False
+    password_hash_workers: int = 2
+    password_hash_max_concurrency: int = 2
+    events_queue_size: int = 100
+    events_history_size: int = 1000
+    events_keepalive_seconds: float = 15
 
     class Config:
         env_file = '.env'
@@ -16,4 +16,8 @@ class JWTConstants:
     """
     Константы для настройки JWT-аутентификации.
     """
-    LIFETIME_SECONDS: int = 3600 
\ No newline at end of file
+    LIFETIME_SECONDS: int = 3600
+    AUDIENCE: list[str] = ['fastapi-users:auth']
+    TOKEN_VERSION_CLAIM: str = 'ver'
+    USER_CLAIMS: tuple[str, ...] = ('is_active', 'is_superuser', 'is_verified')
+    REVOKING_FIELDS: tuple[str, ...] = ('password', *USER_CLAIMS) 
\ No newline at end of file
@@ -2,11 +2,31 @@
 Модуль инициализации базы данных и предоставления асинхронной сессии.
 """
 
-from sqlalchemy import Column, Integer
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Optional
+
+import jwt
+from fastapi import Request
+from fastapi_users.jwt import decode_jwt
+from sqlalchemy import Column, Float, Integer, Table, event, select, update
+from sqlalchemy.dialects.sqlite.base import SQLiteCompiler
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, declared_attr, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.sql import expression
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.constants import JWTConstants
+
+logger = logging.getLogger(__name__)
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+SQLITE_RETURNING_VERSION = (3, 35, 0)
+READ_YOUR_WRITES_PREFIXES = ('/meeting_rooms', '/reservations')
 
 
 class PreBase:
@@ -17,9 +37,498 @@ class PreBase:
     id = Column(Integer, primary_key=True)
 
 
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, замеряющий время ожидания выдачи соединения.
+
+    Учитывает ожидание свободного соединения в очереди пула и открытие
+    нового соединения; счётчики читает эндпоинт /metrics.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Инициализация пула с нулевыми счётчиками ожидания.
+        """
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+
+    def _do_get(self):
+        """
+        Выдать соединение из пула, замерив время ожидания.
+
+        Returns:
+            Запись пула с соединением.
+        """
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.checkout_wait_seconds_total += waited
+            self.checkout_wait_seconds_max = max(
+                self.checkout_wait_seconds_max, waited
+            )
+
+
+class SQLiteReturningCompiler(SQLiteCompiler):
+    """
+    Компилятор SQLite с поддержкой INSERT/UPDATE ... RETURNING.
+
+    SQLAlchemy 1.4 не компилирует RETURNING для SQLite, хотя сама SQLite
+    поддерживает его с версии 3.35; предложение собирается так же, как
+    в диалекте PostgreSQL.
+    """
+    def returning_clause(self, stmt, returning_cols) -> str:
+        """
+        Собрать предложение RETURNING.
+
+        Args:
+            stmt: INSERT или UPDATE.
+            returning_cols: Возвращаемые колонки.
+
+        Returns:
+            str: RETURNING со списком колонок.
+        """
+        columns = [
+            self._label_returning_column(
+                stmt, column, fallback_label_name=column._non_anon_label
+            )
+            for column in expression._select_iterables(returning_cols)
+        ]
+        return 'RETURNING ' + ', '.join(columns)
+
+
+def enable_sqlite_returning(async_engine: AsyncEngine) -> None:
+    """
+    Включить RETURNING для движка SQLite версии 3.35 и новее.
+
+    Компилятор подменяется только у диалекта этого движка; full_returning
+    сообщает CRUD-классам, что RETURNING доступен.
+
+    Args:
+        async_engine (AsyncEngine): Асинхронный движок SQLite.
+    """
+    dialect = async_engine.dialect
+    if dialect.dbapi.sqlite_version_info < SQLITE_RETURNING_VERSION:
+        return
+    dialect.statement_compiler = SQLiteReturningCompiler
+    dialect.full_returning = True
+
+
+def get_sqlite_pragmas() -> dict[str, object]:
+    """
+    PRAGMA, применяемые к каждому новому соединению SQLite.
+
+    Returns:
+        dict[str, object]: Имя и значение PRAGMA.
+    """
+    return {
+        'journal_mode': settings.sqlite_journal_mode,
+        'synchronous': settings.sqlite_synchronous,
+        'busy_timeout': settings.sqlite_busy_timeout_ms,
+        'cache_size': settings.sqlite_cache_size,
+        'mmap_size': settings.sqlite_mmap_size,
+        'temp_store': settings.sqlite_temp_store,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Обработчик события connect: применяет PRAGMA к соединению SQLite.
+
+    Args:
+        dbapi_connection: DBAPI-соединение.
+        connection_record: Запись пула соединений.
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in get_sqlite_pragmas().items():
+        cursor.execute(f'PRAGMA {name}={value}')
+    cursor.close()
+
+
+def get_engine_options(database_url: str) -> dict:
+    """
+    Параметры движка и пула соединений из настроек.
+
+    Для файловой SQLite вместо NullPool по умолчанию используется пул
+    соединений, если database_pool_size больше нуля; SQLite в памяти
+    оставляет пул диалекта (StaticPool). Очередь пула — InstrumentedQueuePool.
+
+    Args:
+        database_url (str): Строка подключения к БД.
+
+    Returns:
+        dict: Именованные аргументы для create_async_engine.
+    """
+    url = make_url(database_url)
+    options = {
+        'echo': settings.database_echo,
+        'pool_pre_ping': settings.database_pool_pre_ping,
+        'pool_recycle': settings.database_pool_recycle,
+    }
+    if url.get_backend_name() == 'sqlite':
+        if url.database in (None, '', ':memory:'):
+            return options
+        if settings.database_pool_size <= 0:
+            return {**options, 'poolclass': NullPool}
+    return {
+        **options,
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': settings.database_pool_size,
+        'max_overflow': settings.database_max_overflow,
+        'pool_timeout': settings.database_pool_timeout,
+    }
+
+
+def create_engine(database_url: str) -> AsyncEngine:
+    """
+    Создаёт асинхронный движок с настройками пула, PRAGMA и RETURNING
+    для SQLite.
+
+    Args:
+        database_url (str): Строка подключения к БД.
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy.
+    """
+    async_engine = create_async_engine(
+        database_url, **get_engine_options(database_url)
+    )
+    if async_engine.dialect.name == 'sqlite':
+        event.listen(async_engine.sync_engine, 'connect', set_sqlite_pragmas)
+        enable_sqlite_returning(async_engine)
+    return async_engine
+
+
+async def begin_immediate(session: AsyncSession) -> None:
+    """
+    Начать транзакцию SQLite с немедленным захватом блокировки записи.
+
+    BEGIN IMMEDIATE сериализует пишущие транзакции: проверка и последующая
+    запись выполняются без вмешательства других писателей, а конкурирующие
+    запросы ждут busy_timeout вместо ошибки при повышении блокировки.
+    Для других СУБД и уже открытой транзакции ничего не делает.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД.
+    """
+    connection = await session.connection()
+    if connection.dialect.name != 'sqlite':
+        return
+    raw_connection = await connection.get_raw_connection()
+    if not raw_connection.driver_connection.in_transaction:
+        await connection.exec_driver_sql('BEGIN IMMEDIATE')
+
+
 Base = declarative_base(cls=PreBase)
-engine = create_async_engine(settings.database_url)
+engine = create_engine(settings.database_url)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession)
+read_engine = (
+    create_engine(settings.database_read_url)
+    if settings.database_read_url else engine
+)
+AsyncReadSessionLocal = sessionmaker(read_engine, class_=AsyncSession)
+replica_heartbeat = Table(
+    'replicaheartbeat',
+    Base.metadata,
+    Column('id', Integer, primary_key=True),
+    Column('written_at', Float, nullable=False),
+)
+
+
+class ReadRouter:
+    """
+    Выбор базы для чтения: реплика (read_engine) или основная база.
+
+    Отметку времени (replica_heartbeat) раз в check_seconds записывает
+    в основную базу отдельная фоновая задача; она включается настройкой
+    database_replica_heartbeat_enabled в одном процессе приложения или
+    заменяется внешним заданием. Проверка задержки только читает: отметку
+    из основной базы и из реплики, разница — задержка репликации. Если
+    отметки в основной базе нет или она старше двух периодов, задержка
+    неизвестна.
+
+    Чтения идут в основную базу, если задержка неизвестна или больше
+    max_lag_seconds, а также для пользователей, изменивших комнаты или
+    бронирования за последние sticky_seconds (read your own writes).
+    Пользователь определяется по ID из JWT-токена запроса.
+    """
+    def __init__(
+        self,
+        max_lag_seconds: float,
+        check_seconds: float,
+        sticky_seconds: float,
+        heartbeat_enabled: bool = False,
+    ) -> None:
+        """
+        Инициализация без измеренной задержки: до первой проверки чтения
+        идут в основную базу.
+
+        Args:
+            max_lag_seconds (float): Допустимая задержка реплики.
+            check_seconds (float): Период измерения задержки и записи
+                отметки времени.
+            sticky_seconds (float): Сколько секунд после записи пользователя
+                читать его запросы из основной базы.
+            heartbeat_enabled (bool): Записывать отметку времени в основную
+                базу из этого процесса.
+        """
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self.heartbeat_enabled = heartbeat_enabled
+        self.lag: Optional[float] = None
+        self.recent_writers = TTLCache(
+            ttl_seconds=sticky_seconds, max_size=100000
+        )
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.check_errors = 0
+        self.heartbeat_errors = 0
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Настроена ли отдельная база для чтения.
+
+        Returns:
+            bool: True, если read_engine отличается от engine.
+        """
+        return read_engine is not engine
+
+    @property
+    def max_staleness(self) -> float:
+        """
+        Насколько могут отставать данные, прочитанные из реплики.
+
+        Returns:
+            float: Допустимая задержка плюс период её измерения в секундах.
+        """
+        return self.max_lag_seconds + self.check_seconds
+
+    def replica_allowed(self, user_id: Optional[int]) -> bool:
+        """
+        Можно ли читать из реплики для пользователя.
+
+        Args:
+            user_id (Optional[int]): ID пользователя запроса или None.
+
+        Returns:
+            bool: True, если реплика не отстаёт больше допустимого
+                и пользователь не выполнял запись в последние sticky_seconds.
+        """
+        if not self.enabled or self.lag is None:
+            return False
+        if self.lag > self.max_lag_seconds:
+            return False
+        return user_id is None or self.recent_writers.get(user_id) is None
+
+    def mark_write(self, user_id: Optional[int]) -> None:
+        """
+        Запомнить запись пользователя, чтобы следующие его чтения шли
+        в основную базу.
+
+        Args:
+            user_id (Optional[int]): ID пользователя запроса или None.
+        """
+        if user_id is not None:
+            self.recent_writers.set(user_id, True)
+
+    async def write_heartbeat(self) -> None:
+        """
+        Записать отметку времени в основную базу.
+        """
+        now = time.time()
+        async with engine.begin() as connection:
+            result = await connection.execute(
+                update(replica_heartbeat)
+                .where(replica_heartbeat.c.id == 1)
+                .values(written_at=now)
+            )
+            if not result.rowcount:
+                await connection.execute(
+                    replica_heartbeat.insert().values(id=1, written_at=now)
+                )
+
+    async def check(self) -> None:
+        """
+        Измерить задержку реплики, только читая отметки времени.
+
+        Если отметки в основной базе нет или она старше двух периодов
+        (отметку никто не пишет), задержка неизвестна. Если отметки нет
+        в реплике, задержка считается бесконечной.
+        """
+        select_written_at = select(replica_heartbeat.c.written_at).where(
+            replica_heartbeat.c.id == 1
+        )
+        async with engine.connect() as connection:
+            primary_written_at = await connection.scalar(select_written_at)
+        async with read_engine.connect() as connection:
+            replica_written_at = await connection.scalar(select_written_at)
+        if (
+            primary_written_at is None
+            or time.time() - primary_written_at > 2 * self.check_seconds
+        ):
+            self.lag = None
+        elif replica_written_at is None:
+            self.lag = float('inf')
+        else:
+            self.lag = max(0.0, primary_written_at - replica_written_at)
+
+    async def _run_check(self) -> None:
+        """
+        Фоновый цикл измерения задержки; при ошибке чтения идут в основную
+        базу до следующей успешной проверки.
+        """
+        while True:
+            try:
+                await self.check()
+            except Exception:
+                self.lag = None
+                self.check_errors += 1
+                logger.exception('Не удалось измерить задержку реплики')
+            await asyncio.sleep(self.check_seconds)
+
+    async def _run_heartbeat(self) -> None:
+        """
+        Фоновый цикл записи отметки времени; ошибки записываются в журнал.
+        """
+        while True:
+            try:
+                await self.write_heartbeat()
+            except Exception:
+                self.heartbeat_errors += 1
+                logger.exception('Не удалось записать отметку для реплики')
+            await asyncio.sleep(self.check_seconds)
+
+    def start(self) -> None:
+        """
+        Запустить фоновые задачи: измерение задержки, если реплика
+        настроена, и запись отметки времени, если она включена.
+
+        Задачи создаются в пустом контексте, чтобы не наследовать
+        contextvars вызывающего кода.
+        """
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        runs = []
+        if self.heartbeat_enabled:
+            runs.append(self._run_heartbeat)
+        if self.enabled:
+            runs.append(self._run_check)
+        self._tasks = [
+            contextvars.Context().run(loop.create_task, run()) for run in runs
+        ]
+
+    async def stop(self) -> None:
+        """
+        Остановить фоновые задачи.
+        """
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики маршрутизации чтений.
+
+        Returns:
+            dict[str, float]: Чтения из реплики и основной базы, задержка
+                реплики в секундах (-1, если неизвестна), пользователи
+                с недавней записью, ошибки проверки задержки и записи
+                отметки времени.
+        """
+        return {
+            'replica_reads': self.replica_reads,
+            'primary_reads': self.primary_reads,
+            'lag_seconds': -1 if self.lag is None else self.lag,
+            'sticky_clients': self.recent_writers.stats()['size'],
+            'check_errors': self.check_errors,
+            'heartbeat_errors': self.heartbeat_errors,
+        }
+
+
+read_router = ReadRouter(
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    check_seconds=settings.database_replica_check_seconds,
+    sticky_seconds=settings.database_read_your_writes_seconds,
+    heartbeat_enabled=settings.database_replica_heartbeat_enabled,
+)
+
+
+def request_user_id(scope: dict) -> Optional[int]:
+    """
+    ID пользователя запроса для read your own writes.
+
+    Берётся из подписанного JWT-токена без запроса к БД: отозванный токен
+    не пройдёт аутентификацию в эндпоинте, а маршрутизации чтений его ID
+    достаточно.
+
+    Args:
+        scope (dict): ASGI scope запроса.
+
+    Returns:
+        Optional[int]: ID пользователя или None для анонимного запроса
+            и невалидного токена.
+    """
+    for name, value in scope['headers']:
+        if name == b'authorization':
+            scheme, _, token = value.decode('latin-1').partition(' ')
+            if scheme.lower() != 'bearer':
+                return None
+            try:
+                data = decode_jwt(token, settings.secret, JWTConstants.AUDIENCE)
+                return int(data['user_id'])
+            except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+                return None
+    return None
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI-middleware, запоминающее пользователей, чьи изменяющие запросы
+    к комнатам и бронированиям завершились успешно (см.
+    ReadRouter.mark_write). Вход, регистрация и другие запросы без
+    изменения расписания пользователя не отмечают.
+    """
+    def __init__(self, app) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        """
+        Обработать запрос и отметить запись пользователя при статусе
+        ответа < 400.
+        """
+        if (
+            scope['type'] != 'http'
+            or scope['method'] in SAFE_METHODS
+            or not scope['path'].startswith(READ_YOUR_WRITES_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if (
+                message['type'] == 'http.response.start'
+                and message['status'] < 400
+            ):
+                read_router.mark_write(request_user_id(scope))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 async def get_async_session() -> AsyncSession:
@@ -31,3 +540,27 @@ async def get_async_session() -> AsyncSession:
     """
     async with AsyncSessionLocal() as async_session:
         yield async_session
+
+
+async def get_async_read_session(request: Request) -> AsyncSession:
+    """
+    Асинхронный генератор сессий только для чтения.
+
+    Сессия открывается к реплике, если ReadRouter разрешает чтение из неё
+    для пользователя запроса, иначе — к основной базе. Сессии реплики отмечены
+    в session.info['replica'].
+
+    Args:
+        request (Request): Запрос FastAPI.
+
+    Yields:
+        AsyncSession: Асинхронная сессия SQLAlchemy.
+    """
+    if read_router.replica_allowed(request_user_id(request.scope)):
+        read_router.replica_reads += 1
+        async with AsyncReadSessionLocal(info={'replica': True}) as session:
+            yield session
+    else:
+        read_router.primary_reads += 1
+        async with AsyncSessionLocal() as session:
+            yield session
@@ -0,0 +1,261 @@
+"""
+In-process рассылка событий расписания комнат для server-sent events.
+
+Эндпоинты бронирований публикуют в хаб создания, изменения и удаления:
+одно событие на запись, даже если она затрагивает много бронирований
+и комнат. Событие один раз сериализуется в готовые фрагменты
+text/event-stream — по фрагменту с данными каждой затронутой комнаты и один
+со всеми данными — и раскладывается по ограниченным очередям подписчиков
+этих комнат и подписчиков всех комнат: каждый подписчик получает одно
+событие на запись. Подписчик, очередь которого переполнена, отключается: клиент
+переподключается с Last-Event-ID и получает пропущенные события из
+ограниченной истории хаба. Ожидающий подписчик не занимает ничего, кроме
+своей пустой очереди.
+
+События видны только подписчикам того же процесса приложения.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.core.serialization import dumps
+
+RESET_EVENT = 'reset'
+
+
+@dataclass
+class ScheduleEvent:
+    """
+    Опубликованное событие.
+
+    Attributes:
+        id (int): Номер события; растёт и между перезапусками процесса.
+        frames (dict[Optional[int], bytes]): Событие в формате
+            text/event-stream для подписчиков каждой затронутой комнаты
+            и (по ключу None) для подписчиков всех комнат.
+    """
+    id: int
+    frames: dict[Optional[int], bytes]
+
+
+@dataclass(eq=False)
+class Subscriber:
+    """
+    Подписчик на события одной комнаты или всех комнат.
+
+    Attributes:
+        room_id (Optional[int]): ID комнаты; None — все комнаты.
+        queue (asyncio.Queue): Фрагменты для отправки; None — поток
+            закрыт хабом.
+        dropped (bool): Отключён ли подписчик из-за переполнения очереди.
+    """
+    room_id: Optional[int]
+    queue: asyncio.Queue = field(repr=False)
+    dropped: bool = False
+
+
+def format_event(event_id: int, event_type: str, data: Any) -> bytes:
+    """
+    Сериализовать событие в формат text/event-stream.
+
+    Args:
+        event_id (int): ID события (поле id, отсюда Last-Event-ID).
+        event_type (str): Тип события (поле event).
+        data (Any): Данные события, сериализуемые в JSON.
+
+    Returns:
+        bytes: Фрагмент потока, завершённый пустой строкой.
+    """
+    return (
+        f'id: {event_id}\nevent: {event_type}\ndata: '.encode()
+        + dumps(data) + b'\n\n'
+    )
+
+
+class ScheduleEventHub:
+    """
+    Хаб событий расписания с историей для возобновления по Last-Event-ID.
+
+    Рассчитан на один event loop: публикация и подписка синхронны, поэтому
+    подписчик получает историю и новые события без пропусков и повторов.
+    Нумерация событий начинается с времени запуска в миллисекундах, поэтому
+    Last-Event-ID от прошлого процесса всегда приводит к RESET_EVENT.
+    """
+    def __init__(self, queue_size: int, history_size: int) -> None:
+        """
+        Инициализация хаба без подписчиков.
+
+        Args:
+            queue_size (int): Размер очереди подписчика.
+            history_size (int): Сколько последних событий хранить для
+                возобновления.
+        """
+        self.queue_size = queue_size
+        self.history: deque[ScheduleEvent] = deque(maxlen=history_size)
+        self.published = 0
+        self.dropped = 0
+        first_id = int(time.time() * 1000)
+        self._ids = itertools.count(first_id)
+        self._last_id = first_id - 1
+        self._subscribers: dict[Optional[int], set[Subscriber]] = {}
+
+    def publish(
+        self,
+        event_type: str,
+        data_by_room: dict[int, Any],
+        data: Any,
+    ) -> int:
+        """
+        Опубликовать одно событие, затрагивающее одну или несколько комнат.
+
+        Args:
+            event_type (str): Тип события.
+            data_by_room (dict[int, Any]): Данные события для подписчиков
+                каждой затронутой комнаты, сериализуемые в JSON.
+            data (Any): Данные события для подписчиков всех комнат.
+
+        Returns:
+            int: ID события.
+        """
+        self._last_id = event_id = next(self._ids)
+        frames = {
+            room_id: format_event(event_id, event_type, room_data)
+            for room_id, room_data in data_by_room.items()
+        }
+        frames[None] = format_event(event_id, event_type, data)
+        self.history.append(ScheduleEvent(event_id, frames))
+        self.published += 1
+        for key, frame in frames.items():
+            for subscriber in tuple(self._subscribers.get(key, ())):
+                self._deliver(subscriber, frame)
+        return event_id
+
+    def _deliver(self, subscriber: Subscriber, frame: bytes) -> None:
+        """
+        Положить фрагмент в очередь подписчика; при переполнении отключить
+        подписчика.
+
+        Args:
+            subscriber (Subscriber): Подписчик.
+            frame (bytes): Фрагмент потока.
+        """
+        try:
+            subscriber.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            subscriber.dropped = True
+            self.dropped += 1
+            self._close(subscriber)
+
+    def _close(self, subscriber: Subscriber) -> None:
+        """
+        Отписать подписчика и завершить его поток.
+
+        Неотправленные события отбрасываются: клиент получит их при
+        переподключении с Last-Event-ID.
+
+        Args:
+            subscriber (Subscriber): Подписчик.
+        """
+        self.unsubscribe(subscriber)
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+    def subscribe(
+        self,
+        room_id: Optional[int],
+        last_event_id: Optional[int] = None,
+    ) -> Subscriber:
+        """
+        Подписаться на события комнаты или всех комнат.
+
+        Если передан last_event_id, в очередь сразу попадают более поздние
+        события из истории. Если часть пропущенных событий уже вытеснена из
+        истории, их больше размера очереди или last_event_id выдан другим
+        процессом, вместо них отправляется событие RESET_EVENT: клиенту нужно
+        заново загрузить расписание.
+
+        Args:
+            room_id (Optional[int]): ID комнаты; None — все комнаты.
+            last_event_id (Optional[int]): ID последнего полученного события.
+
+        Returns:
+            Subscriber: Подписчик.
+        """
+        subscriber = Subscriber(room_id, asyncio.Queue(self.queue_size))
+        if last_event_id is not None and last_event_id != self._last_id:
+            self._replay(subscriber, last_event_id)
+        self._subscribers.setdefault(room_id, set()).add(subscriber)
+        return subscriber
+
+    def _replay(self, subscriber: Subscriber, last_event_id: int) -> None:
+        """
+        Положить в очередь подписчика события истории после last_event_id.
+
+        Args:
+            subscriber (Subscriber): Новый подписчик.
+            last_event_id (int): ID последнего полученного события.
+        """
+        complete = (
+            last_event_id < self._last_id
+            and bool(self.history)
+            and self.history[0].id <= last_event_id + 1
+        )
+        missed = [
+            event.frames[subscriber.room_id] for event in self.history
+            if event.id > last_event_id and subscriber.room_id in event.frames
+        ]
+        if complete and len(missed) < self.queue_size:
+            for frame in missed:
+                subscriber.queue.put_nowait(frame)
+            return
+        subscriber.queue.put_nowait(
+            format_event(self._last_id, RESET_EVENT, {})
+        )
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        Отписать подписчика.
+
+        Args:
+            subscriber (Subscriber): Подписчик.
+        """
+        subscribers = self._subscribers.get(subscriber.room_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[subscriber.room_id]
+
+    def close(self) -> None:
+        """
+        Завершить потоки всех подписчиков (при остановке приложения).
+        """
+        for subscribers in list(self._subscribers.values()):
+            for subscriber in tuple(subscribers):
+                self._close(subscriber)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики хаба событий.
+
+        Returns:
+            dict[str, float]: Подписчики, опубликованные события, отключённые
+                медленные подписчики и размер истории.
+        """
+        return {
+            'subscribers': sum(map(len, self._subscribers.values())),
+            'published': self.published,
+            'dropped': self.dropped,
+            'history': len(self.history),
+        }
+
+
+schedule_events = ScheduleEventHub(
+    queue_size=settings.events_queue_size,
+    history_size=settings.events_history_size,
+)
@@ -0,0 +1,124 @@
+"""
+In-process блокировки по ключу для сериализации конфликтующих записей.
+
+Используются вокруг последовательности «проверка пересечений — запись»
+бронирований: записи в разные комнаты выполняются параллельно, записи в одну
+комнату — строго по очереди. Блокировки действуют в пределах одного процесса.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+
+class KeyedLockManager:
+    """
+    Менеджер asyncio.Lock по ключу со слабыми ссылками и метриками ожидания.
+
+    Блокировка ключа живёт, пока её удерживает или ждёт хотя бы одна задача,
+    после чего удаляется сборщиком мусора. asyncio.Lock пробуждает ожидающих
+    в порядке очереди и не отдаёт блокировку новым задачам в обход очереди.
+    """
+    def __init__(self) -> None:
+        """
+        Инициализация менеджера без блокировок.
+        """
+        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._queue_depths: Counter = Counter()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.queue_depth_max = 0
+
+    def _get_lock(self, key: Hashable) -> asyncio.Lock:
+        """
+        Получить блокировку ключа, создав её при необходимости.
+
+        Args:
+            key (Hashable): Ключ.
+
+        Returns:
+            asyncio.Lock: Блокировка ключа.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    @asynccontextmanager
+    async def hold(self, *keys: Hashable) -> AsyncIterator[None]:
+        """
+        Захватить блокировки ключей на время блока.
+
+        Ключи захватываются в отсортированном порядке, поэтому задачи,
+        блокирующие пересекающиеся наборы ключей, не образуют взаимоблокировок.
+
+        Args:
+            *keys (Hashable): Ключи, например ID комнат.
+        """
+        keys = sorted(set(keys))
+        locks = [self._get_lock(key) for key in keys]
+        for key in keys:
+            self._queue_depths[key] += 1
+            self.queue_depth_max = max(
+                self.queue_depth_max, self._queue_depths[key]
+            )
+        if any(self._queue_depths[key] > 1 for key in keys):
+            self.contended += 1
+        acquired = []
+        try:
+            for lock in locks:
+                started = time.perf_counter()
+                await lock.acquire()
+                acquired.append(lock)
+                waited = time.perf_counter() - started
+                self.acquisitions += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            for key in keys:
+                self._queue_depths[key] -= 1
+                if not self._queue_depths[key]:
+                    del self._queue_depths[key]
+
+    def queue_depth(self, key: Hashable) -> int:
+        """
+        Количество задач, удерживающих или ожидающих блокировку ключа.
+
+        Args:
+            key (Hashable): Ключ.
+
+        Returns:
+            int: Глубина очереди.
+        """
+        return self._queue_depths[key]
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики блокировок.
+
+        Returns:
+            dict[str, float]: Захваты блокировок, входы в очередь за занятым
+                ключом, суммарное и максимальное время ожидания, текущая
+                и максимальная глубина очереди, количество живых блокировок.
+        """
+        return {
+            'acquisitions': self.acquisitions,
+            'contended': self.contended,
+            'wait_seconds_total': self.wait_seconds_total,
+            'wait_seconds_max': self.wait_seconds_max,
+            'queue_depth': sum(self._queue_depths.values()),
+            'queue_depth_max': self.queue_depth_max,
+            'locks': len(self._locks),
+        }
+
+
+room_locks = KeyedLockManager()
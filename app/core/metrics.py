@@ -0,0 +1,519 @@
+"""
+Метрики приложения в текстовом формате Prometheus.
+
+Содержит минимальный реестр метрик (счётчики, gauge, гистограммы),
+ASGI-middleware с метриками запросов по шаблону маршрута и обработчики
+событий движка SQLAlchemy, считающие SQL-запросы и время в БД на запрос.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 7.5, 10
+)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+UNMATCHED_ROUTE = '<unmatched>'
+
+Labels = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    """
+    Экранировать значение метки.
+
+    Args:
+        value (str): Значение метки.
+
+    Returns:
+        str: Значение для текстового формата Prometheus.
+    """
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    """
+    Строка одного значения метрики.
+
+    Args:
+        name (str): Имя метрики.
+        labels (dict[str, str]): Метки.
+        value (float): Значение.
+
+    Returns:
+        str: Строка текстового формата Prometheus.
+    """
+    if labels:
+        pairs = ','.join(
+            f'{key}="{_escape(str(label))}"' for key, label in labels.items()
+        )
+        return f'{name}{{{pairs}}} {value!r}'
+    return f'{name} {value!r}'
+
+
+class Metric:
+    """
+    Метрика с набором меток: счётчик или gauge.
+    """
+    type = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+    ) -> None:
+        """
+        Инициализация метрики без значений.
+
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание для строки HELP.
+            labelnames (Labels): Имена меток.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Увеличить значение метрики.
+
+        Args:
+            labels (Labels): Значения меток в порядке labelnames.
+            amount (float): Приращение.
+        """
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Значения метрики.
+
+        Returns:
+            Iterable[Sample]: Имя, метки и значение каждой серии.
+        """
+        for labels, value in self._values.items():
+            yield self.name, dict(zip(self.labelnames, labels)), value
+
+
+class Counter(Metric):
+    """
+    Монотонно растущий счётчик.
+    """
+    type = 'counter'
+
+
+class Gauge(Metric):
+    """
+    Значение, которое может расти и уменьшаться.
+    """
+    type = 'gauge'
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Уменьшить значение метрики.
+
+        Args:
+            labels (Labels): Значения меток в порядке labelnames.
+            amount (float): Величина уменьшения.
+        """
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с накопительными корзинами, суммой и количеством.
+    """
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> None:
+        """
+        Инициализация гистограммы без наблюдений.
+
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание для строки HELP.
+            labelnames (Labels): Имена меток.
+            buckets (tuple[float, ...]): Верхние границы корзин по возрастанию.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        self._series: dict[Labels, list] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """
+        Добавить наблюдение.
+
+        Args:
+            labels (Labels): Значения меток в порядке labelnames.
+            value (float): Наблюдаемое значение.
+        """
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Значения корзин, суммы и количества наблюдений.
+
+        Returns:
+            Iterable[Sample]: Имя, метки и значение каждой серии.
+        """
+        for labels, (counts, total, count) in self._series.items():
+            labels = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield (
+                    f'{self.name}_bucket', {**labels, 'le': repr(float(bound))},
+                    cumulative
+                )
+            yield f'{self.name}_bucket', {**labels, 'le': '+Inf'}, count
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, count
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик и функций, собирающих значения в момент запроса /metrics.
+    """
+    def __init__(self) -> None:
+        """
+        Инициализация пустого реестра.
+        """
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Зарегистрировать метрику.
+
+        Args:
+            metric (Metric): Метрика.
+
+        Returns:
+            Metric: Та же метрика.
+        """
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(
+        self,
+        collector: Callable[[], Iterable[Metric]],
+    ) -> None:
+        """
+        Зарегистрировать функцию, строящую метрики при каждом запросе /metrics.
+
+        Args:
+            collector (Callable[[], Iterable[Metric]]): Функция без аргументов.
+        """
+        self._collectors.append(collector)
+
+    def register_stats(
+        self,
+        prefix: str,
+        stats: Callable[[], dict[str, float]],
+        documentation: str,
+        counters: Iterable[str] = (),
+    ) -> None:
+        """
+        Публиковать значения словаря stats() с общим префиксом.
+
+        Монотонные значения — ключи из counters и ключи с суффиксом _total —
+        публикуются как счётчики с суффиксом _total (к ним применим rate()),
+        остальные — как gauge.
+
+        Args:
+            prefix (str): Префикс имён метрик.
+            stats (Callable[[], dict[str, float]]): Функция метрик компонента,
+                например KeyedLockManager.stats.
+            documentation (str): Описание компонента для строк HELP.
+            counters (Iterable[str]): Ключи монотонно растущих значений.
+        """
+        counters = frozenset(counters)
+
+        def collect() -> Iterable[Metric]:
+            for key, value in stats().items():
+                if key in counters or key.endswith('_total'):
+                    name = key if key.endswith('_total') else f'{key}_total'
+                    metric = Counter(f'{prefix}_{name}', f'{documentation}: {key}.')
+                else:
+                    metric = Gauge(f'{prefix}_{key}', f'{documentation}: {key}.')
+                metric.inc((), value)
+                yield metric
+
+        self.register_collector(collect)
+
+    def render(self) -> str:
+        """
+        Сериализовать все метрики в текстовый формат Prometheus.
+
+        Returns:
+            str: Текст ответа /metrics.
+        """
+        metrics = list(self._metrics)
+        for collector in self._collectors:
+            metrics.extend(collector())
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(
+                _format_sample(name, labels, value)
+                for name, labels, value in metric.samples()
+            )
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+HTTP_REQUESTS = metrics.register(Counter(
+    'http_requests_total', 'Количество HTTP-запросов.',
+    ('method', 'route', 'status'),
+))
+HTTP_REQUEST_DURATION = metrics.register(Histogram(
+    'http_request_duration_seconds', 'Время обработки HTTP-запроса.',
+    ('method', 'route'),
+))
+HTTP_REQUESTS_IN_PROGRESS = metrics.register(Gauge(
+    'http_requests_in_progress', 'Количество обрабатываемых HTTP-запросов.',
+    ('method',),
+))
+HTTP_REQUEST_DB_STATEMENTS = metrics.register(Histogram(
+    'http_request_db_statements', 'Количество SQL-запросов на HTTP-запрос.',
+    ('method', 'route'), STATEMENT_BUCKETS,
+))
+HTTP_REQUEST_DB_DURATION = metrics.register(Histogram(
+    'http_request_db_duration_seconds',
+    'Суммарное время SQL-запросов на HTTP-запрос.',
+    ('method', 'route'),
+))
+DB_STATEMENTS = metrics.register(Counter(
+    'db_statements_total', 'Количество выполненных SQL-запросов.',
+))
+DB_STATEMENT_DURATION = metrics.register(Counter(
+    'db_statement_duration_seconds_total',
+    'Суммарное время выполнения SQL-запросов.',
+))
+
+
+@dataclass
+class RequestDatabaseStats:
+    """
+    SQL-запросы, выполненные в рамках одного HTTP-запроса.
+    """
+    statements: int = 0
+    seconds: float = 0.0
+
+
+request_database_stats: ContextVar[Optional[RequestDatabaseStats]] = ContextVar(
+    'request_database_stats', default=None
+)
+
+
+def before_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Обработчик before_cursor_execute: запомнить время начала запроса.
+    """
+    connection.info.setdefault('metrics_started', []).append(
+        time.perf_counter()
+    )
+
+
+def after_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Обработчик after_cursor_execute: учесть запрос и его длительность.
+    """
+    elapsed = time.perf_counter() - connection.info['metrics_started'].pop()
+    DB_STATEMENTS.inc()
+    DB_STATEMENT_DURATION.inc((), elapsed)
+    stats = request_database_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def handle_error(context) -> None:
+    """
+    Обработчик handle_error: снять время начала запроса, завершившегося ошибкой.
+    """
+    started = context.connection and context.connection.info.get(
+        'metrics_started'
+    )
+    if started:
+        started.pop()
+
+
+def collect_pool_metrics(engines: dict[str, AsyncEngine]) -> Iterable[Metric]:
+    """
+    Gauge и счётчики пулов соединений движков с меткой engine.
+
+    Args:
+        engines (dict[str, AsyncEngine]): Движки по именам.
+
+    Returns:
+        Iterable[Metric]: Размер пула, выданные и свободные соединения,
+            переполнение и время ожидания выдачи соединения.
+    """
+    pools = {name: engine.sync_engine.pool for name, engine in engines.items()}
+    gauges = {
+        'db_pool_size': ('size', 'Размер пула соединений.'),
+        'db_pool_checked_out': (
+            'checkedout', 'Соединения, выданные из пула.'
+        ),
+        'db_pool_checked_in': ('checkedin', 'Свободные соединения в пуле.'),
+        'db_pool_overflow': ('overflow', 'Соединения сверх размера пула.'),
+    }
+    for metric_name, (method, documentation) in gauges.items():
+        gauge = Gauge(metric_name, documentation, ('engine',))
+        for name, pool in pools.items():
+            if hasattr(pool, method):
+                gauge.inc((name,), getattr(pool, method)())
+        yield gauge
+    instrumented = {
+        name: pool for name, pool in pools.items()
+        if hasattr(pool, 'checkout_wait_seconds_total')
+    }
+    if not instrumented:
+        return
+    values = {
+        'db_pool_checkouts_total': (
+            Counter, 'checkouts', 'Количество выдач соединений из пула.'
+        ),
+        'db_pool_checkout_wait_seconds_total': (
+            Counter, 'checkout_wait_seconds_total',
+            'Суммарное время ожидания соединения из пула.',
+        ),
+        'db_pool_checkout_wait_seconds_max': (
+            Gauge, 'checkout_wait_seconds_max',
+            'Максимальное время ожидания соединения из пула.',
+        ),
+    }
+    for metric_name, (metric_class, attribute, documentation) in values.items():
+        metric = metric_class(metric_name, documentation, ('engine',))
+        for name, pool in instrumented.items():
+            metric.inc((name,), getattr(pool, attribute))
+        yield metric
+
+
+_pool_engines: dict[str, AsyncEngine] = {}
+
+
+def instrument_engine(async_engine: AsyncEngine, name: str = 'primary') -> None:
+    """
+    Подключить к движку учёт SQL-запросов и метрики пула соединений.
+
+    Args:
+        async_engine (AsyncEngine): Движок.
+        name (str): Значение метки engine метрик пула.
+    """
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(sync_engine, 'handle_error', handle_error)
+    if not _pool_engines:
+        metrics.register_collector(lambda: collect_pool_metrics(_pool_engines))
+    _pool_engines[name] = async_engine
+
+
+_route_templates: dict = {}
+
+
+def route_template(scope: dict) -> str:
+    """
+    Шаблон пути маршрута, обрабатывающего запрос.
+
+    Роутер Starlette записывает endpoint найденного маршрута в scope, поэтому
+    шаблон доступен с момента вызова эндпоинта.
+
+    Args:
+        scope (dict): ASGI scope запроса.
+
+    Returns:
+        str: Шаблон пути (например, /reservations/{reservation_id})
+            или UNMATCHED_ROUTE.
+    """
+    endpoint = scope.get('endpoint')
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+    if endpoint not in _route_templates:
+        _route_templates.update(
+            (route.endpoint, route.path)
+            for route in scope['app'].routes
+            if hasattr(route, 'endpoint')
+        )
+    return _route_templates.get(endpoint, UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware метрик HTTP-запросов.
+
+    Метка route — шаблон пути маршрута (например,
+    /reservations/{reservation_id}), а не сам путь, поэтому число серий
+    не зависит от ID в запросах. Запросы без маршрута получают
+    метку UNMATCHED_ROUTE.
+    """
+    def __init__(self, app) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        """
+        Обработать запрос, замерив время, статус и SQL-запросы.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        method = scope['method']
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        stats = RequestDatabaseStats()
+        token = request_database_stats.set(stats)
+        HTTP_REQUESTS_IN_PROGRESS.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec((method,))
+            request_database_stats.reset(token)
+            route = route_template(scope)
+            HTTP_REQUESTS.inc((method, route, str(status_code)))
+            HTTP_REQUEST_DURATION.observe((method, route), elapsed)
+            HTTP_REQUEST_DB_STATEMENTS.observe((method, route), stats.statements)
+            HTTP_REQUEST_DB_DURATION.observe((method, route), stats.seconds)
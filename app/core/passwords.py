@@ -0,0 +1,172 @@
+"""
+Хэширование и проверка паролей вне event loop.
+
+bcrypt занимает процессор на сотни миллисекунд и отпускает GIL, поэтому
+хэширование выполняется в ограниченном пуле потоков: вход и регистрация
+не останавливают обработку остальных запросов, а пароли разных
+пользователей проверяются параллельно.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from fastapi_users.password import PasswordHelper
+
+from app.core.config import settings
+
+T = TypeVar('T')
+
+
+class PasswordHasher:
+    """
+    Асинхронная обёртка над PasswordHelper FastAPI Users с пулом потоков.
+
+    Число одновременных операций ограничено семафором; ожидающие его
+    операции учитываются в метриках очереди. При workers=0 хэширование
+    выполняется прямо в event loop (прежнее поведение).
+    """
+    def __init__(self, workers: int, max_concurrency: int) -> None:
+        """
+        Инициализация без запущенного пула; потоки создаются при первой
+        операции.
+
+        Args:
+            workers (int): Количество потоков пула; 0 — без пула.
+            max_concurrency (int): Максимум одновременных операций.
+        """
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.password_helper = PasswordHelper()
+        self.operations = 0
+        self.waiting = 0
+        self.waiting_max = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Семафор ограничения одновременных операций для текущего event loop.
+
+        Returns:
+            asyncio.Semaphore: Семафор.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """
+        Выполнить операцию с паролем в пуле, дождавшись места в очереди.
+
+        Args:
+            func (Callable[..., T]): Синхронная функция PasswordHelper.
+            *args: Аргументы функции.
+
+        Returns:
+            T: Результат функции.
+        """
+        if self.workers <= 0:
+            started = time.perf_counter()
+            result = func(*args)
+            self.operations += 1
+            self.hash_seconds_total += time.perf_counter() - started
+            return result
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix='password-hasher'
+            )
+        semaphore = self._get_semaphore()
+        self.waiting += 1
+        self.waiting_max = max(self.waiting_max, self.waiting)
+        started = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        waited = time.perf_counter() - started
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        try:
+            started = time.perf_counter()
+            result = await self._loop.run_in_executor(
+                self._executor, func, *args
+            )
+            self.hash_seconds_total += time.perf_counter() - started
+        finally:
+            semaphore.release()
+        self.operations += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        """
+        Захэшировать пароль.
+
+        Args:
+            password (str): Пароль.
+
+        Returns:
+            str: Хэш пароля.
+        """
+        return await self._run(self.password_helper.hash, password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Проверить пароль и при необходимости получить обновлённый хэш.
+
+        Args:
+            plain_password (str): Пароль.
+            hashed_password (str): Сохранённый хэш.
+
+        Returns:
+            tuple[bool, Optional[str]]: Совпадает ли пароль и новый хэш,
+                если схему хэширования нужно обновить.
+        """
+        return await self._run(
+            self.password_helper.verify_and_update,
+            plain_password,
+            hashed_password,
+        )
+
+    def shutdown(self) -> None:
+        """
+        Остановить пул потоков.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики хэширования паролей.
+
+        Returns:
+            dict[str, float]: Выполненные операции, текущая и максимальная
+                очередь, суммарное и максимальное ожидание места, суммарное
+                время операций.
+        """
+        return {
+            'operations': self.operations,
+            'waiting': self.waiting,
+            'waiting_max': self.waiting_max,
+            'wait_seconds_total': self.wait_seconds_total,
+            'wait_seconds_max': self.wait_seconds_max,
+            'hash_seconds_total': self.hash_seconds_total,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_concurrency=settings.password_hash_max_concurrency,
+)
@@ -0,0 +1,347 @@
+"""
+Профилирование SQL-запросов по HTTP-запросам.
+
+Включается настройкой sql_profiling_enabled. Обработчики
+before_cursor_execute/after_cursor_execute движка записывают текст каждого
+запроса, параметры без строковых значений, длительность, маршрут и метод
+CRUD, из которого он выполнен. Запросы дольше sql_slow_query_ms попадают
+в журнал, повторы одного запроса в рамках HTTP-запроса — в предупреждение
+о N+1. По заголовку PROFILE_REQUEST_HEADER (если включён
+sql_profile_header_enabled) разбивка возвращается в заголовке Server-Timing.
+"""
+
+import logging
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Any, Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+PROFILE_REQUEST_HEADER = b'x-sql-profile'
+SERVER_TIMING_STATEMENT_LENGTH = 80
+REDACTED = '***'
+VISIBLE_PARAMETER_TYPES = (
+    bool, int, float, Decimal, date, datetime, dt_time, timedelta, type(None)
+)
+PROFILER_MODULES = (__name__, 'app.core.metrics')
+
+
+@dataclass
+class ProfiledStatement:
+    """
+    Выполненный SQL-запрос.
+
+    Attributes:
+        statement (str): Текст запроса.
+        parameters (Any): Параметры со скрытыми строковыми значениями.
+        duration (float): Длительность в секундах.
+        origin (str): Метод CRUD или функция приложения, выполнившая запрос.
+    """
+    statement: str
+    parameters: Any
+    duration: float
+    origin: str
+
+
+@dataclass
+class RequestProfile:
+    """
+    SQL-запросы одного HTTP-запроса.
+
+    Attributes:
+        scope (dict): ASGI scope запроса.
+        statements (list[ProfiledStatement]): Запросы в порядке выполнения.
+    """
+    scope: dict
+    statements: list[ProfiledStatement] = field(default_factory=list)
+
+    @property
+    def route(self) -> str:
+        """
+        Метод и шаблон маршрута HTTP-запроса.
+
+        Returns:
+            str: Например, «PATCH /reservations/{reservation_id}».
+        """
+        return f'{self.scope["method"]} {route_template(self.scope)}'
+
+    def repeated(self) -> dict[str, int]:
+        """
+        Запросы, выполненные не меньше sql_n_plus_one_threshold раз.
+
+        Returns:
+            dict[str, int]: Текст запроса и количество выполнений.
+        """
+        counts = Counter(item.statement for item in self.statements)
+        return {
+            statement: count for statement, count in counts.items()
+            if count >= settings.sql_n_plus_one_threshold
+        }
+
+    def server_timing(self) -> str:
+        """
+        Разбивка запросов для заголовка Server-Timing.
+
+        Returns:
+            str: Сводка «db» и по одной записи на каждый SQL-запрос.
+        """
+        total = sum(item.duration for item in self.statements)
+        entries = [
+            _timing_entry(
+                'db', total, f'{len(self.statements)} statements, '
+                f'{len(self.repeated())} repeated'
+            )
+        ]
+        entries.extend(
+            _timing_entry(
+                f'sql-{number}', item.duration,
+                f'{item.origin}: '
+                f'{item.statement[:SERVER_TIMING_STATEMENT_LENGTH]}'
+            )
+            for number, item in enumerate(self.statements, start=1)
+        )
+        return ', '.join(entries)
+
+
+request_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    'request_profile', default=None
+)
+
+
+def _timing_entry(name: str, duration: float, description: str) -> str:
+    """
+    Запись заголовка Server-Timing.
+
+    Args:
+        name (str): Имя метрики.
+        duration (float): Длительность в секундах.
+        description (str): Описание.
+
+    Returns:
+        str: Запись вида name;dur=<мс>;desc="...".
+    """
+    description = ' '.join(description.split())
+    description = description.replace('\\', '\\\\').replace('"', '\\"')
+    description = description.encode('ascii', 'replace').decode()
+    return f'{name};dur={duration * 1000:.3f};desc="{description}"'
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Скрыть значения параметров, которые могут содержать личные данные.
+
+    Числа, даты и None остаются как есть, строки и байты заменяются на
+    REDACTED: в них бывают email, хэши паролей и токены.
+
+    Args:
+        parameters (Any): Параметры DBAPI — кортеж, словарь или их список
+            для executemany.
+
+    Returns:
+        Any: Параметры той же структуры со скрытыми значениями.
+    """
+    if isinstance(parameters, dict):
+        return {
+            key: redact_parameters(value) for key, value in parameters.items()
+        }
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    if isinstance(parameters, VISIBLE_PARAMETER_TYPES):
+        return parameters
+    return REDACTED
+
+
+def _frame_origin(frame) -> Optional[str]:
+    """
+    Имя метода CRUD или функции приложения для кадра стека.
+
+    Args:
+        frame: Кадр стека.
+
+    Returns:
+        Optional[str]: «Класс.метод» для кадров app.crud, «модуль.функция»
+            для остальных модулей приложения или None.
+    """
+    module = frame.f_globals.get('__name__', '')
+    if not module.startswith('app.') or module in PROFILER_MODULES:
+        return None
+    instance = frame.f_locals.get('self')
+    if module.startswith('app.crud.') and instance is not None:
+        return f'{type(instance).__name__}.{frame.f_code.co_name}'
+    return f'{module}.{frame.f_code.co_name}'
+
+
+def find_origin() -> str:
+    """
+    Найти код приложения, выполнивший текущий SQL-запрос.
+
+    Синхронные обработчики событий выполняются в greenlet, созданном
+    асинхронным API SQLAlchemy, поэтому после его кадров просматриваются
+    кадры родительского greenlet — цепочка корутин, ожидающих запрос.
+    Приоритет у методов CRUD; иначе берётся ближайшая функция приложения.
+
+    Returns:
+        str: Источник запроса или «?», если код приложения не найден.
+    """
+    frames = [sys._getframe(1)]
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frames.append(parent.gr_frame)
+    fallback = None
+    for frame in frames:
+        while frame is not None:
+            origin = _frame_origin(frame)
+            if origin is not None:
+                if frame.f_globals['__name__'].startswith('app.crud.'):
+                    return origin
+                fallback = fallback or origin
+            frame = frame.f_back
+    return fallback or '?'
+
+
+def before_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Обработчик before_cursor_execute: запомнить время начала запроса.
+    """
+    if request_profile.get() is not None:
+        connection.info.setdefault('profiling_started', []).append(
+            time.perf_counter()
+        )
+
+
+def after_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Обработчик after_cursor_execute: записать запрос в профиль HTTP-запроса
+    и в журнал, если он медленный.
+
+    Для скомпилированных выражений берутся параметры до обработки типами
+    SQLAlchemy (даты ещё не превращены в строки и остаются видимыми).
+    """
+    profile = request_profile.get()
+    if profile is None:
+        return
+    started = connection.info.get('profiling_started')
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    if context is not None and context.compiled is not None:
+        parameters = context.compiled_parameters
+        if not executemany:
+            parameters = parameters[0]
+    item = ProfiledStatement(
+        statement=statement,
+        parameters=redact_parameters(parameters),
+        duration=duration,
+        origin=find_origin(),
+    )
+    profile.statements.append(item)
+    if duration * 1000 >= settings.sql_slow_query_ms:
+        logger.warning(
+            'Медленный SQL-запрос %.1f мс: %s, %s\n%s\nПараметры: %s',
+            duration * 1000, profile.route, item.origin,
+            item.statement, item.parameters,
+        )
+
+
+def handle_error(context) -> None:
+    """
+    Обработчик handle_error: снять время начала запроса, завершившегося ошибкой.
+    """
+    started = context.connection and context.connection.info.get(
+        'profiling_started'
+    )
+    if started:
+        started.pop()
+
+
+def instrument_engine(async_engine: AsyncEngine) -> None:
+    """
+    Подключить к движку профилирование SQL-запросов.
+
+    Args:
+        async_engine (AsyncEngine): Движок.
+    """
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(sync_engine, 'handle_error', handle_error)
+
+
+def report_repeated(profile: RequestProfile) -> None:
+    """
+    Записать в журнал запросы, повторённые в рамках HTTP-запроса (N+1).
+
+    Args:
+        profile (RequestProfile): Профиль HTTP-запроса.
+    """
+    for statement, count in profile.repeated().items():
+        origins = sorted({
+            item.origin for item in profile.statements
+            if item.statement == statement
+        })
+        logger.warning(
+            'Возможный N+1: запрос выполнен %d раз за %s (%s)\n%s',
+            count, profile.route, ', '.join(origins), statement,
+        )
+
+
+class ProfilingMiddleware:
+    """
+    ASGI-middleware, собирающее профиль SQL-запросов каждого HTTP-запроса.
+
+    После ответа проверяет профиль на N+1. Если включён
+    sql_profile_header_enabled и клиент прислал заголовок
+    PROFILE_REQUEST_HEADER, добавляет в ответ Server-Timing с разбивкой
+    по запросам, выполненным до начала ответа.
+    """
+    def __init__(self, app) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        """
+        Обработать запрос, собирая профиль SQL-запросов.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile(scope)
+        with_header = settings.sql_profile_header_enabled and any(
+            name == PROFILE_REQUEST_HEADER for name, _ in scope['headers']
+        )
+
+        async def send_wrapper(message) -> None:
+            if with_header and message['type'] == 'http.response.start':
+                message['headers'] = [
+                    *message.get('headers', []),
+                    (b'server-timing', profile.server_timing().encode()),
+                ]
+            await send(message)
+
+        token = request_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_profile.reset(token)
+            report_repeated(profile)
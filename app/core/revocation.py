@@ -0,0 +1,195 @@
+"""
+Отзыв JWT-токенов по версии токена пользователя.
+
+Используется при jwt_claims_enabled, когда доступ проверяется по флагам
+из токена. В каждый токен записывается версия токена пользователя
+(User.token_version). Смена пароля, блокировка и изменение прав увеличивают версию в БД, и токены
+с меньшей версией считаются отозванными. Чтобы проверять это без запроса
+к БД, процесс хранит в памяти версии только тех пользователей, у которых
+она увеличивалась не раньше срока жизни токена (позже все отозванные ею
+токены истекли сами), и периодически перечитывает их фоновой задачей по
+индексу User.token_version_changed_at: изменения, сделанные другим
+процессом, вступают в силу не позже чем через jwt_revocation_refresh_seconds.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.db import AsyncSessionLocal
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocations:
+    """
+    Версии токенов пользователей, у которых они увеличивались.
+
+    Версии только растут, поэтому перечитанные из БД значения объединяются
+    с известными по максимуму: увеличение, сделанное этим процессом, не
+    теряется, даже если чтение началось до его фиксации. Версии, увеличенные
+    раньше чем lifetime_seconds назад, удаляются при каждом перечитывании.
+    """
+    def __init__(self, refresh_seconds: float, lifetime_seconds: int) -> None:
+        """
+        Инициализация без загруженных версий.
+
+        Args:
+            refresh_seconds (float): Период перечитывания версий из БД.
+            lifetime_seconds (int): Срок жизни JWT-токена.
+        """
+        self.refresh_seconds = refresh_seconds
+        self.lifetime = timedelta(seconds=lifetime_seconds)
+        self.versions: dict[int, int] = {}
+        self.changed_at: dict[int, datetime] = {}
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self._refreshed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def fresh(self) -> bool:
+        """
+        Перечитывались ли версии достаточно недавно, чтобы им доверять.
+
+        Returns:
+            bool: True, если последнее успешное чтение было не раньше двух
+                периодов назад.
+        """
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at
+            <= 2 * self.refresh_seconds
+        )
+
+    def is_revoked(self, user_id: int, version: int) -> bool:
+        """
+        Отозван ли токен пользователя с указанной версией.
+
+        Args:
+            user_id (int): ID пользователя.
+            version (int): Версия из токена.
+
+        Returns:
+            bool: True, если текущая версия пользователя больше.
+        """
+        return version < self.versions.get(user_id, 0)
+
+    def bump(
+        self,
+        user_id: int,
+        version: int,
+        changed_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Запомнить новую версию токена пользователя.
+
+        Args:
+            user_id (int): ID пользователя.
+            version (int): Текущая версия токена пользователя.
+            changed_at (Optional[datetime]): Время увеличения версии
+                (по умолчанию — сейчас).
+        """
+        if version > self.versions.get(user_id, 0):
+            self.versions[user_id] = version
+            self.changed_at[user_id] = changed_at or datetime.now()
+
+    def prune(self, cutoff: datetime) -> None:
+        """
+        Забыть версии, увеличенные не позже cutoff: отозванные ими токены
+        выпущены раньше и уже истекли.
+
+        Args:
+            cutoff (datetime): Момент, раньше которого истекли все токены.
+        """
+        expired = [
+            user_id for user_id, changed_at in self.changed_at.items()
+            if changed_at <= cutoff
+        ]
+        for user_id in expired:
+            del self.versions[user_id]
+            del self.changed_at[user_id]
+
+    async def refresh(self) -> None:
+        """
+        Перечитать из БД версии, увеличенные в пределах срока жизни токена,
+        и забыть более старые.
+        """
+        cutoff = datetime.now() - self.lifetime
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(
+                select(
+                    User.id, User.token_version, User.token_version_changed_at
+                ).where(
+                    User.token_version_changed_at > cutoff
+                )
+            )
+            for user_id, version, changed_at in rows:
+                self.bump(user_id, version, changed_at)
+        self.prune(cutoff)
+        self.refreshes += 1
+        self._refreshed_at = time.monotonic()
+
+    async def _run(self) -> None:
+        """
+        Фоновый цикл перечитывания версий; ошибки записываются в журнал.
+        """
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception:
+                self.refresh_errors += 1
+                logger.exception('Не удалось перечитать версии токенов')
+
+    async def start(self) -> None:
+        """
+        Загрузить версии и запустить фоновую задачу их перечитывания.
+
+        Задача создаётся в пустом контексте, чтобы не наследовать
+        contextvars вызывающего кода.
+        """
+        try:
+            await self.refresh()
+        except Exception:
+            self.refresh_errors += 1
+            logger.exception('Не удалось загрузить версии токенов')
+        loop = asyncio.get_running_loop()
+        self._task = contextvars.Context().run(loop.create_task, self._run())
+
+    async def stop(self) -> None:
+        """
+        Остановить фоновую задачу.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики отзыва токенов.
+
+        Returns:
+            dict[str, float]: Количество пользователей с увеличенной версией,
+                успешных и неудачных перечитываний, возраст последнего
+                чтения в секундах (-1, если чтений не было).
+        """
+        return {
+            'users': len(self.versions),
+            'refreshes': self.refreshes,
+            'refresh_errors': self.refresh_errors,
+            'refresh_age_seconds': (
+                time.monotonic() - self._refreshed_at
+                if self._refreshed_at is not None else -1
+            ),
+        }
@@ -0,0 +1,86 @@
+"""
+Быстрая сериализация списков в JSON для эндпоинтов со списками бронирований
+и комнат.
+
+Строки БД уже соответствуют схемам ответа, поэтому вместо построения
+Pydantic-модели на каждую строку, jsonable_encoder и json.dumps словари
+полей схемы собираются напрямую из строк (как в BaseModel.construct, без
+валидации) и кодируются orjson сразу в байты ответа.
+"""
+
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, Optional
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def trusted_items(
+    schema: type[BaseModel],
+    rows: Iterable[Any],
+    exclude: Optional[set[str]] = None,
+    exclude_none: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Собрать словари полей схемы из доверенных строк без валидации.
+
+    Args:
+        schema (type[BaseModel]): Схема ответа, задающая поля и их порядок.
+        rows (Iterable[Any]): Строки Row, ORM-объекты или словари.
+        exclude (Optional[set[str]]): Поля, не попадающие в ответ
+            (аналог response_model_exclude).
+        exclude_none (bool): Не включать поля со значением None
+            (аналог response_model_exclude_none).
+
+    Returns:
+        list[dict[str, Any]]: Словари, готовые к кодированию в JSON.
+    """
+    fields = tuple(
+        name for name in schema.__fields__ if name not in (exclude or ())
+    )
+    rows = list(rows)
+    if not rows:
+        return []
+    getter = itemgetter if isinstance(rows[0], dict) else attrgetter
+    values = getter(*fields)
+    if len(fields) == 1:
+        items = [{fields[0]: values(row)} for row in rows]
+    else:
+        items = [dict(zip(fields, values(row))) for row in rows]
+    if exclude_none:
+        items = [
+            {key: value for key, value in item.items() if value is not None}
+            for item in items
+        ]
+    return items
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Закодировать содержимое ответа в JSON.
+
+    Args:
+        content (Any): Словари, списки и скалярные значения.
+
+    Returns:
+        bytes: JSON в UTF-8.
+    """
+    return orjson.dumps(content)
+
+
+def json_response(
+    content: Any,
+    headers: Optional[dict[str, str]] = None,
+) -> ORJSONResponse:
+    """
+    JSON-ответ, закодированный orjson.
+
+    Args:
+        content (Any): Содержимое ответа.
+        headers (Optional[dict[str, str]]): Дополнительные заголовки.
+
+    Returns:
+        ORJSONResponse: Ответ.
+    """
+    return ORJSONResponse(content=content, headers=headers)
@@ -2,23 +2,37 @@
 Модуль управления пользователями и аутентификацией.
 """
 
-from typing import Optional, Union
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
 
-from fastapi import Depends, Request
+import jwt
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_users import (
-    BaseUserManager, FastAPIUsers, IntegerIDMixin, InvalidPasswordException
+    BaseUserManager,
+    FastAPIUsers,
+    IntegerIDMixin,
+    InvalidPasswordException,
+    exceptions
 )
 from fastapi_users.authentication import (
     AuthenticationBackend, BearerTransport, JWTStrategy
 )
+from fastapi_users.jwt import decode_jwt, generate_jwt
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.db import get_async_session
+from app.core.db import AsyncSessionLocal, get_async_session
 from app.core.constants import UserPasswordConstants, JWTConstants
+from app.core.passwords import password_hasher
+from app.core.revocation import TokenRevocations
 from app.models.user import User
-from app.schemas.user import UserCreate
+from app.schemas.user import UserCreate, UserUpdate
 
 async def get_user_db(session: AsyncSession = Depends(get_async_session)):
     """
@@ -34,15 +48,282 @@ async def get_user_db(session: AsyncSession = Depends(get_async_session)):
 
 bearer_transport = BearerTransport(tokenUrl='auth/jwt/login')
 
+user_cache = TTLCache(
+    ttl_seconds=settings.user_cache_ttl_seconds,
+    max_size=settings.user_cache_max_size,
+)
+token_revocations = TokenRevocations(
+    refresh_seconds=settings.jwt_revocation_refresh_seconds,
+    lifetime_seconds=JWTConstants.LIFETIME_SECONDS,
+)
+USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Удаляет из кэша все записи пользователя (для всех его токенов).
+
+    Args:
+        user_id (int): ID пользователя.
+    """
+    user_cache.invalidate(lambda key: key[0] == user_id)
+
+
+class CachedJWTStrategy(JWTStrategy):
+    """
+    JWT-стратегия, кэширующая пользователя по паре (ID пользователя, iat токена).
+
+    При попадании в кэш пользователь восстанавливается из снимка колонок
+    и присоединяется к сессии запроса без обращения к БД.
+
+    Версия токена записывается в токен, но проверяется, только если
+    check_token_version включён (см. ClaimsJWTStrategy): без флагов в токене
+    смена пароля и прав не отзывает выпущенные токены, как и в FastAPI Users.
+    """
+    check_token_version = False
+
+    def decode(
+        self,
+        token: str,
+        user_manager: BaseUserManager[User, int],
+    ) -> Optional[tuple[int, Dict[str, Any]]]:
+        """
+        Декодирует токен; при check_token_version отбрасывает токены
+        с отозванной версией.
+
+        Args:
+            token (str): JWT-токен.
+            user_manager (BaseUserManager[User, int]): Менеджер пользователей.
+
+        Returns:
+            Optional[tuple[int, Dict[str, Any]]]: ID пользователя и данные
+                токена или None, если токен невалиден или отозван.
+        """
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience,
+                algorithms=[self.algorithm]
+            )
+            user_id = user_manager.parse_id(data.get('user_id'))
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+        if self.check_token_version and token_revocations.is_revoked(
+            user_id, token_version(data)
+        ):
+            return None
+        return user_id, data
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[User, int],
+    ) -> Optional[User]:
+        """
+        Декодирует токен и возвращает пользователя из кэша или из БД.
+
+        При check_token_version токен с версией меньше текущей версии
+        пользователя считается отозванным.
+
+        Args:
+            token (Optional[str]): JWT-токен.
+            user_manager (BaseUserManager[User, int]): Менеджер пользователей.
+
+        Returns:
+            Optional[User]: Пользователь или None, если токен невалиден.
+        """
+        if token is None:
+            return None
+        decoded = self.decode(token, user_manager)
+        if decoded is None:
+            return None
+        user_id, data = decoded
+        cache_key = (user_id, data.get('iat'))
+        snapshot = user_cache.get(cache_key)
+        if snapshot is not None:
+            user = await self._restore_user(snapshot, user_manager)
+        else:
+            try:
+                user = await user_manager.get(user_id)
+            except exceptions.UserNotExists:
+                return None
+            user_cache.set(cache_key, {
+                column: getattr(user, column) for column in USER_COLUMNS
+            })
+        if self.check_token_version and token_version(data) < user.token_version:
+            return None
+        return user
+
+    def token_data(self, user: User) -> Dict[str, Any]:
+        """
+        Данные выпускаемого токена.
+
+        Args:
+            user (User): Пользователь.
+
+        Returns:
+            Dict[str, Any]: ID пользователя, аудитория, время выпуска (iat)
+                и версия токена пользователя.
+        """
+        return {
+            'user_id': str(user.id),
+            'aud': self.token_audience,
+            'iat': int(time.time()),
+            JWTConstants.TOKEN_VERSION_CLAIM: user.token_version,
+        }
+
+    async def write_token(self, user: User) -> str:
+        """
+        Выпускает JWT-токен с временем выпуска (iat) и версией токена.
+
+        Args:
+            user (User): Пользователь.
+
+        Returns:
+            str: JWT-токен.
+        """
+        data = self.token_data(user)
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm
+        )
+
+    @staticmethod
+    async def _restore_user(
+        snapshot: Dict[str, Any],
+        user_manager: BaseUserManager[User, int],
+    ) -> User:
+        """
+        Восстанавливает пользователя из снимка в сессии текущего запроса.
+
+        Args:
+            snapshot (Dict[str, Any]): Значения колонок пользователя.
+            user_manager (BaseUserManager[User, int]): Менеджер пользователей.
+
+        Returns:
+            User: Пользователь, присоединённый к сессии без запроса к БД.
+        """
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await user_manager.user_db.session.merge(user, load=False)
+
+
+class ClaimsJWTStrategy(CachedJWTStrategy):
+    """
+    JWT-стратегия, записывающая в токен флаги is_active, is_superuser
+    и is_verified пользователя.
+
+    Зависимости current_user и current_superuser проверяют доступ по этим
+    флагам без запроса к БД (см. read_claims). Флаги в токене могут
+    устареть не больше чем на время жизни токена, поэтому их изменение
+    увеличивает версию токена пользователя и отзывает выпущенные токены.
+    """
+    check_token_version = True
+
+    def token_data(self, user: User) -> Dict[str, Any]:
+        """
+        Данные выпускаемого токена вместе с флагами пользователя.
+
+        Args:
+            user (User): Пользователь.
+
+        Returns:
+            Dict[str, Any]: Данные токена.
+        """
+        data = super().token_data(user)
+        for claim in JWTConstants.USER_CLAIMS:
+            data[claim] = getattr(user, claim)
+        return data
+
+    async def read_claims(
+        self,
+        token: str,
+        user_manager: BaseUserManager[User, int],
+    ) -> Optional[User]:
+        """
+        Восстанавливает пользователя из данных токена без запроса к БД.
+
+        Пользователь не присоединяется к сессии и содержит только ID,
+        флаги и версию токена. Токены без флагов (выпущенные до включения
+        jwt_claims_enabled) и все токены, пока версии отозванных токенов
+        давно не перечитывались, проверяются через read_token с запросом
+        к БД.
+
+        Args:
+            token (str): JWT-токен.
+            user_manager (BaseUserManager[User, int]): Менеджер пользователей.
+
+        Returns:
+            Optional[User]: Пользователь или None, если токен невалиден
+                или отозван.
+        """
+        if not token_revocations.fresh:
+            return await self.read_token(token, user_manager)
+        decoded = self.decode(token, user_manager)
+        if decoded is None:
+            return None
+        user_id, data = decoded
+        if any(claim not in data for claim in JWTConstants.USER_CLAIMS):
+            return await self.read_token(token, user_manager)
+        return User(
+            id=user_id,
+            token_version=token_version(data),
+            **{claim: data[claim] for claim in JWTConstants.USER_CLAIMS},
+        )
+
+
+def token_version(data: Dict[str, Any]) -> int:
+    """
+    Версия токена пользователя из данных JWT.
+
+    Args:
+        data (Dict[str, Any]): Данные токена.
+
+    Returns:
+        int: Версия; 0 для токенов, выпущенных до её появления.
+    """
+    return data.get(JWTConstants.TOKEN_VERSION_CLAIM, 0)
+
+
+def revokes_tokens(user: User, update_dict: Dict[str, Any]) -> bool:
+    """
+    Отзывает ли изменение пользователя его выпущенные токены.
+
+    Смена email сбрасывает is_verified (см. BaseUserManager._update),
+    поэтому тоже учитывается как изменение флага.
+
+    Args:
+        user (User): Пользователь до изменения.
+        update_dict (Dict[str, Any]): Обновляемые поля.
+
+    Returns:
+        bool: True, если меняется пароль или флаг из JWTConstants.USER_CLAIMS.
+    """
+    changes = dict(update_dict)
+    if changes.get('email', user.email) != user.email:
+        changes['is_verified'] = False
+    return any(
+        field in changes and (
+            field == 'password' or changes[field] != getattr(user, field)
+        )
+        for field in JWTConstants.REVOKING_FIELDS
+    )
+
 
 def get_jwt_strategy() -> JWTStrategy:
     """
     Возвращает стратегию JWT для аутентификации пользователей.
 
     Returns:
-        JWTStrategy: Стратегия JWT.
+        JWTStrategy: Стратегия JWT с кэшированием пользователей; при
+            jwt_claims_enabled — с флагами пользователя в токене.
     """
-    return JWTStrategy(secret=settings.secret, lifetime_seconds=JWTConstants.LIFETIME_SECONDS)
+    strategy_class = (
+        ClaimsJWTStrategy if settings.jwt_claims_enabled else CachedJWTStrategy
+    )
+    return strategy_class(
+        secret=settings.secret,
+        lifetime_seconds=JWTConstants.LIFETIME_SECONDS,
+        token_audience=JWTConstants.AUDIENCE,
+    )
 
 
 auth_backend = AuthenticationBackend(
@@ -55,7 +336,161 @@ auth_backend = AuthenticationBackend(
 class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     """
     Менеджер пользователей с кастомной валидацией пароля и хуками событий.
+
+    Хэширование и проверка паролей выполняются через password_hasher в пуле
+    потоков: методы create, authenticate и update повторяют методы
+    BaseUserManager, в которых PasswordHelper вызывается синхронно.
     """
+    password_hasher = password_hasher
+
+    async def create(
+        self,
+        user_create: UserCreate,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        """
+        Создаёт пользователя, хэшируя пароль вне event loop.
+
+        Args:
+            user_create (UserCreate): Данные пользователя.
+            safe (bool): Игнорировать is_superuser и is_verified из запроса.
+            request (Optional[Request]): Запрос FastAPI.
+
+        Returns:
+            User: Созданный пользователь.
+
+        Raises:
+            UserAlreadyExists: Если email уже занят.
+        """
+        await self.validate_password(user_create.password, user_create)
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop('password')
+        user_dict['hashed_password'] = await self.password_hasher.hash(password)
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[User]:
+        """
+        Проверяет email и пароль, не блокируя event loop.
+
+        Для несуществующего email пароль всё равно хэшируется, чтобы время
+        ответа не выдавало наличие пользователя. Пользователь загружается в
+        собственной короткой сессии и отсоединяется от неё: на время проверки
+        пароля соединение возвращается в пул, а не удерживается входами,
+        ожидающими очереди хэширования. Сессия запроса не используется.
+        Обновлённый хэш пароля сохраняется в отдельной короткой сессии.
+
+        Args:
+            credentials (OAuth2PasswordRequestForm): Email и пароль.
+
+        Returns:
+            Optional[User]: Пользователь или None, если данные неверны.
+        """
+        async with AsyncSessionLocal() as session:
+            user = await SQLAlchemyUserDatabase(session, User).get_by_email(
+                credentials.username
+            )
+            if user is not None:
+                session.expunge(user)
+        if user is None:
+            await self.password_hasher.hash(credentials.password)
+            return None
+        verified, updated_password_hash = (
+            await self.password_hasher.verify_and_update(
+                credentials.password, user.hashed_password
+            )
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            async with AsyncSessionLocal() as session:
+                user = await SQLAlchemyUserDatabase(session, User).update(
+                    user, {'hashed_password': updated_password_hash}
+                )
+                session.expunge(user)
+        return user
+
+    async def update(
+        self,
+        user_update: UserUpdate,
+        user: User,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        """
+        Обновляет пользователя, хэшируя новый пароль вне event loop.
+
+        Новый пароль передаётся в BaseUserManager уже хэшированным. При
+        jwt_claims_enabled смена пароля и флагов is_active, is_superuser,
+        is_verified увеличивает версию токена пользователя: выпущенные ранее
+        токены отзываются.
+
+        Args:
+            user_update (UserUpdate): Обновляемые поля.
+            user (User): Пользователь.
+            safe (bool): Игнорировать is_superuser и is_verified из запроса.
+            request (Optional[Request]): Запрос FastAPI.
+
+        Returns:
+            User: Обновлённый пользователь.
+
+        Raises:
+            UserAlreadyExists: Если новый email уже занят.
+            InvalidPasswordException: Если новый пароль невалиден.
+        """
+        update_dict = (
+            user_update.create_update_dict()
+            if safe
+            else user_update.create_update_dict_superuser()
+        )
+        validated_update_dict = dict(update_dict)
+        password = validated_update_dict.pop('password', None)
+        if password is not None:
+            await self.validate_password(password, user)
+            validated_update_dict['hashed_password'] = (
+                await self.password_hasher.hash(password)
+            )
+        revoking = settings.jwt_claims_enabled and revokes_tokens(
+            user, update_dict
+        )
+        if revoking:
+            validated_update_dict['token_version'] = user.token_version + 1
+            validated_update_dict['token_version_changed_at'] = datetime.now()
+        updated_user = await self._update(user, validated_update_dict)
+        if revoking:
+            token_revocations.bump(
+                updated_user.id,
+                updated_user.token_version,
+                updated_user.token_version_changed_at,
+            )
+        await self.on_after_update(updated_user, update_dict, request)
+        return updated_user
+
+    async def delete(self, user: User) -> None:
+        """
+        Удаляет пользователя; при jwt_claims_enabled отзывает его токены
+        в этом процессе.
+
+        Args:
+            user (User): Пользователь.
+        """
+        user_id, version = user.id, user.token_version
+        await super().delete(user)
+        if settings.jwt_claims_enabled:
+            token_revocations.bump(user_id, version + 1)
+        invalidate_cached_user(user_id)
+
     async def validate_password(
         self,
         password: str,
@@ -92,6 +527,47 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
         """
         print(f'Пользователь {user.email} зарегистрирован.')
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],
+        request: Optional[Request] = None,
+    ) -> None:
+        """
+        Хук, вызываемый после обновления пользователя (в том числе пароля
+        и флагов is_active/is_superuser): сбрасывает его записи в кэше.
+
+        Args:
+            user (User): Обновлённый пользователь.
+            update_dict (Dict[str, Any]): Обновлённые поля.
+            request (Optional[Request]): Запрос FastAPI.
+        """
+        invalidate_cached_user(user.id)
+
+    async def on_after_reset_password(
+        self, user: User, request: Optional[Request] = None
+    ) -> None:
+        """
+        Хук, вызываемый после сброса пароля: сбрасывает записи пользователя в кэше.
+
+        Args:
+            user (User): Пользователь.
+            request (Optional[Request]): Запрос FastAPI.
+        """
+        invalidate_cached_user(user.id)
+
+    async def on_after_verify(
+        self, user: User, request: Optional[Request] = None
+    ) -> None:
+        """
+        Хук, вызываемый после верификации: сбрасывает записи пользователя в кэше.
+
+        Args:
+            user (User): Пользователь.
+            request (Optional[Request]): Запрос FastAPI.
+        """
+        invalidate_cached_user(user.id)
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     """
@@ -109,5 +585,40 @@ fastapi_users = FastAPIUsers[User, int](
     get_user_manager,
     [auth_backend],
 )
-current_user = fastapi_users.current_user(active=True)
-current_superuser = fastapi_users.current_user(active=True, superuser=True)
+
+
+def claims_user(superuser: bool = False):
+    """
+    Зависимость текущего активного пользователя по флагам из JWT-токена.
+
+    Повторяет проверки fastapi_users.current_user(active=True): 401 без
+    токена или для неактивного пользователя, 403 без прав суперпользователя.
+
+    Args:
+        superuser (bool): Требовать права суперпользователя.
+
+    Returns:
+        Callable: Зависимость FastAPI, возвращающая пользователя.
+    """
+    async def dependency(
+        token: Optional[str] = Depends(bearer_transport.scheme),
+        user_manager: UserManager = Depends(get_user_manager),
+    ) -> User:
+        user = None
+        if token is not None:
+            user = await get_jwt_strategy().read_claims(token, user_manager)
+        if user is None or not user.is_active:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        if superuser and not user.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+        return user
+
+    return dependency
+
+
+if settings.jwt_claims_enabled:
+    current_user = claims_user()
+    current_superuser = claims_user(superuser=True)
+else:
+    current_user = fastapi_users.current_user(active=True)
+    current_superuser = fastapi_users.current_user(active=True, superuser=True)
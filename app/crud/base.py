@@ -2,19 +2,41 @@
 Базовый CRUD-класс для асинхронной работы с моделями SQLAlchemy.
 
 Содержит универсальные методы для получения, создания, обновления и удаления объектов.
+Если БД поддерживает RETURNING (PostgreSQL, SQLite 3.35+, см.
+enable_sqlite_returning), создание и обновление выполняются одним запросом
+INSERT/UPDATE ... RETURNING без повторного SELECT после фиксации транзакции.
 """
 
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.sql.dml import UpdateBase
 from typing import Optional
 
 from app.models import User
+from app.schemas.constants import PaginationConstants
+
+
+def supports_returning(session: AsyncSession) -> bool:
+    """
+    Проверить, поддерживает ли БД сессии INSERT/UPDATE ... RETURNING.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Returns:
+        bool: True, если RETURNING поддерживается.
+    """
+    return session.bind.dialect.full_returning
+
 
 class CRUDBase:
     """
     Базовый класс для CRUD-операций с моделями SQLAlchemy.
     """
+    # Выключается бенчмарком crud_writes для сравнения с ORM-путём.
+    returning_enabled = True
+
     def __init__(self, model):
         """
         Инициализация CRUDBase.
@@ -23,6 +45,56 @@ class CRUDBase:
             model: Класс модели SQLAlchemy.
         """
         self.model = model
+        self.columns = tuple(model.__table__.columns)
+        self.column_keys = frozenset(column.key for column in self.columns)
+
+    async def _execute_returning(
+        self,
+        statement: UpdateBase,
+        session: AsyncSession,
+    ):
+        """
+        Выполнить запрос с RETURNING, зафиксировать транзакцию и вернуть объект.
+
+        Объект собирается из возвращённой строки и добавляется в сессию
+        через merge_loaded, как если бы был загружен запросом.
+
+        Args:
+            statement (UpdateBase): INSERT или UPDATE с RETURNING всех
+                колонок модели.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            Объект модели или None, если запрос не затронул ни одной строки.
+        """
+        result = await session.execute(statement)
+        row = result.first()
+        await session.commit()
+        if row is None:
+            return None
+        return await self.merge_loaded(
+            {column.key: row._mapping[column] for column in self.columns},
+            session,
+        )
+
+    async def merge_loaded(
+        self,
+        values: dict,
+        session: AsyncSession,
+    ):
+        """
+        Добавить в сессию объект, построенный из уже известных значений колонок.
+
+        Args:
+            values (dict): Значения всех колонок объекта, включая ID.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            Объект модели, привязанный к сессии, без запроса к БД.
+        """
+        db_obj = self.model(**values)
+        make_transient_to_detached(db_obj)
+        return await session.merge(db_obj, load=False)
 
     async def get(
         self,
@@ -48,20 +120,68 @@ class CRUDBase:
 
     async def get_multi(
         self,
-        session: AsyncSession
+        session: AsyncSession,
+        limit: Optional[int] = PaginationConstants.DEFAULT_LIMIT,
+        after: Optional[int] = None,
+        as_rows: bool = False,
     ):
         """
-        Получить все объекты модели.
+        Получить объекты модели, упорядоченные по ID (keyset-пагинация).
 
         Args:
             session (AsyncSession): Асинхронная сессия БД.
+            limit (Optional[int]): Максимальное количество объектов;
+                None — без ограничения (только при явном запросе).
+            after (Optional[int]): Вернуть объекты с ID больше этого значения.
+            as_rows (bool): Вернуть строки столбцов модели вместо ORM-объектов
+                (без identity map, для сериализации больших списков).
 
         Returns:
-            Список объектов модели.
+            Список объектов модели или строк Row.
         """
-        db_objs = await session.execute(select(self.model))
+        if as_rows:
+            select_stmt = select(*self.columns)
+        else:
+            select_stmt = select(self.model)
+        select_stmt = select_stmt.order_by(self.model.id)
+        if after is not None:
+            select_stmt = select_stmt.where(self.model.id > after)
+        if limit is not None:
+            select_stmt = select_stmt.limit(limit)
+        db_objs = await session.execute(select_stmt)
+        if as_rows:
+            return db_objs.all()
         return db_objs.scalars().all()
 
+    async def get_page(
+        self,
+        session: AsyncSession,
+        limit: int = PaginationConstants.DEFAULT_LIMIT,
+        after: Optional[int] = None,
+        as_rows: bool = False,
+    ) -> tuple[list, Optional[int]]:
+        """
+        Получить страницу объектов и курсор следующей страницы.
+
+        Запрашивает на один объект больше limit, чтобы узнать, есть ли следующая страница.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия БД.
+            limit (int): Размер страницы.
+            after (Optional[int]): Курсор — ID последнего объекта предыдущей страницы.
+            as_rows (bool): Вернуть строки Row вместо ORM-объектов.
+
+        Returns:
+            tuple[list, Optional[int]]: Объекты страницы и курсор следующей страницы
+                (None, если страница последняя).
+        """
+        db_objs = await self.get_multi(
+            session, limit=limit + 1, after=after, as_rows=as_rows
+        )
+        if len(db_objs) > limit:
+            return db_objs[:limit], db_objs[limit - 1].id
+        return db_objs, None
+
     async def create(
         self,
         obj_in,
@@ -82,6 +202,15 @@ class CRUDBase:
         obj_in_data = obj_in.dict()
         if user is not None:
             obj_in_data['user_id'] = user.id
+        if self.returning_enabled and supports_returning(session):
+            values = {
+                key: value for key, value in obj_in_data.items()
+                if key in self.column_keys
+            }
+            return await self._execute_returning(
+                insert(self.model).values(**values).returning(*self.columns),
+                session,
+            )
         db_obj = self.model(**obj_in_data)
         session.add(db_obj)
         await session.commit()
@@ -103,14 +232,26 @@ class CRUDBase:
             session (AsyncSession): Асинхронная сессия БД.
 
         Returns:
-            Обновлённый объект модели.
+            Обновлённый объект модели или None, если строка уже удалена.
         """
-        obj_data = jsonable_encoder(db_obj)
         update_data = obj_in.dict(exclude_unset=True)
-
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        values = {
+            column.key: update_data[column.key] for column in self.columns
+            if column.key in update_data and not column.primary_key
+        }
+        if not values:
+            return db_obj
+        if self.returning_enabled and supports_returning(session):
+            return await self._execute_returning(
+                update(self.model).where(
+                    self.model.id == db_obj.id
+                ).values(**values).returning(
+                    *self.columns
+                ).execution_options(synchronize_session=False),
+                session,
+            )
+        for field, value in values.items():
+            setattr(db_obj, field, value)
         session.add(db_obj)
         await session.commit()
         await session.refresh(db_obj)
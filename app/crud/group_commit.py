@@ -0,0 +1,288 @@
+"""
+Групповая фиксация (group commit) записей бронирований.
+
+Фоновая задача собирает создания и изменения бронирований от конкурентных
+запросов в течение короткого окна и выполняет их в одной транзакции SQLite
+(BEGIN IMMEDIATE): одна блокировка записи и одна синхронизация с диском
+на весь пакет вместо одной на каждое бронирование.
+"""
+
+import asyncio
+import contextvars
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal, begin_immediate
+from app.crud.base import supports_returning
+from app.crud.interval_index import reservation_index
+from app.crud.reservation import reservation_crud
+from app.models.reservation import Reservation
+from app.models.user import User
+from app.schemas.reservation import ReservationCreate, ReservationUpdate
+
+
+@dataclass
+class PendingWrite:
+    """
+    Запись, ожидающая фиксации в составе пакета.
+
+    statement — условный INSERT или UPDATE из CRUDReservation; future
+    получает ID созданного бронирования, True для изменения или None,
+    если запись отклонена (комнаты нет или интервал занят), либо ошибку
+    БД, если запрос записи завершился ошибкой.
+    """
+    statement: Any
+    is_insert: bool
+    future: asyncio.Future = field(repr=False)
+
+
+class ReservationWriter:
+    """
+    Писатель бронирований с групповой фиксацией.
+
+    Записи пакета проверяются в порядке поступления условными запросами
+    внутри одной транзакции, поэтому каждая следующая видит предыдущие:
+    пересечения проверяются и с БД, и между записями пакета. Каждая запись
+    выполняется в своей точке сохранения (SAVEPOINT): ошибка одной записи
+    откатывает только её.
+
+    Писатель не берёт room_locks: записи, которые проверяют пересечения
+    отдельным запросом (серии и пакеты), выполняются под
+    CRUDReservation.lock_rooms и не пересекаются с транзакцией пакета.
+    """
+    def __init__(self, window_ms: float, max_batch_size: int) -> None:
+        """
+        Инициализация писателя. Фоновая задача запускается при первой записи.
+
+        Args:
+            window_ms (float): Сколько миллисекунд собирать пакет после
+                первой записи.
+            max_batch_size (int): Максимальный размер пакета.
+        """
+        self.window_ms = window_ms
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.writes = 0
+        self.failed = 0
+        self.batch_size_max = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> None:
+        """
+        Запустить фоновую задачу в текущем event loop, если она не запущена.
+
+        Задача создаётся в пустом контексте, чтобы не наследовать
+        contextvars запроса, который её запустил (например, учёт SQL-запросов
+        запроса в метриках).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = contextvars.Context().run(
+                loop.create_task, self._run()
+            )
+
+    async def _submit(self, statement, is_insert: bool):
+        """
+        Поставить запись в очередь и дождаться фиксации её пакета.
+
+        Args:
+            statement: Условный INSERT или UPDATE.
+            is_insert (bool): True для вставки.
+
+        Returns:
+            Результат записи (см. PendingWrite).
+        """
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait(PendingWrite(statement, is_insert, future))
+        return await future
+
+    async def create(
+        self,
+        obj_in: ReservationCreate,
+        session: AsyncSession,
+        user: User,
+    ) -> Optional[Reservation]:
+        """
+        Создать бронирование в составе ближайшего пакета.
+
+        Args:
+            obj_in (ReservationCreate): Данные бронирования.
+            session (AsyncSession): Сессия запроса, в которую добавляется
+                созданный объект.
+            user (User): Пользователь, создающий бронирование.
+
+        Returns:
+            Optional[Reservation]: Созданное бронирование или None, если
+                комнаты нет или интервал занят.
+        """
+        values = {**obj_in.dict(), 'user_id': user.id}
+        reservation_id = await self._submit(
+            reservation_crud.insert_if_free_statement(values), is_insert=True
+        )
+        if reservation_id is None:
+            return None
+        db_obj = await reservation_crud.merge_loaded(
+            {**values, 'id': reservation_id, 'series_id': None}, session
+        )
+        reservation_index.add(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db_obj: Reservation,
+        obj_in: ReservationUpdate,
+        session: AsyncSession,
+    ) -> Optional[Reservation]:
+        """
+        Изменить интервал бронирования в составе ближайшего пакета.
+
+        Args:
+            db_obj (Reservation): Бронирование для изменения.
+            obj_in (ReservationUpdate): Новый интервал.
+            session (AsyncSession): Сессия запроса.
+
+        Returns:
+            Optional[Reservation]: Изменённое бронирование или None, если
+                новый интервал занят.
+        """
+        values = obj_in.dict()
+        updated = await self._submit(
+            reservation_crud.update_if_free_statement(
+                db_obj.id, db_obj.meetingroom_id, values
+            ),
+            is_insert=False,
+        )
+        if not updated:
+            return None
+        current = {
+            column.key: getattr(db_obj, column.key)
+            for column in reservation_crud.columns
+        }
+        db_obj = await reservation_crud.merge_loaded(
+            {**current, **values}, session
+        )
+        reservation_index.discard(db_obj.meetingroom_id, db_obj.id)
+        reservation_index.add(db_obj)
+        return db_obj
+
+    async def _run(self) -> None:
+        """
+        Фоновый цикл: собрать пакет за окно window_ms и зафиксировать его.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._commit(batch)
+
+    async def _commit(self, batch: list[PendingWrite]) -> None:
+        """
+        Выполнить записи пакета в одной транзакции и разрешить их future.
+
+        ID вставленных бронирований возвращаются через RETURNING, если БД
+        его поддерживает. Ошибка запроса записи откатывает её точку
+        сохранения и передаётся только её future. При ошибке самой транзакции (начала или фиксации)
+        все записи пакета получают это исключение.
+
+        Args:
+            batch (list[PendingWrite]): Записи пакета в порядке поступления.
+        """
+        results = []
+        try:
+            async with AsyncSessionLocal() as session:
+                await begin_immediate(session)
+                returning = supports_returning(session)
+                for pending in batch:
+                    returning_id = pending.is_insert and returning
+                    statement = pending.statement
+                    if returning_id:
+                        statement = statement.returning(Reservation.id)
+                    try:
+                        async with session.begin_nested():
+                            result = await session.execute(statement)
+                            if returning_id:
+                                reservation_id = result.scalar()
+                    except SQLAlchemyError as error:
+                        results.append(error)
+                        continue
+                    if returning_id:
+                        results.append(reservation_id)
+                    elif not result.rowcount:
+                        results.append(None)
+                    elif pending.is_insert:
+                        # INSERT ... SELECT не заполняет inserted_primary_key,
+                        # без RETURNING ID берётся из cursor.lastrowid.
+                        results.append(result.lastrowid)
+                    else:
+                        results.append(True)
+                await session.commit()
+        except Exception as error:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(error)
+            return
+        self.batches += 1
+        self.writes += len(batch)
+        self.batch_size_max = max(self.batch_size_max, len(batch))
+        for pending, result in zip(batch, results):
+            if isinstance(result, Exception):
+                self.failed += 1
+                if not pending.future.done():
+                    pending.future.set_exception(result)
+            elif not pending.future.done():
+                pending.future.set_result(result)
+
+    async def stop(self) -> None:
+        """
+        Остановить фоновую задачу.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики групповой фиксации.
+
+        Returns:
+            dict[str, float]: Количество пакетов, записей и записей,
+                завершившихся ошибкой, средний и максимальный размер пакета,
+                длина очереди.
+        """
+        return {
+            'batches': self.batches,
+            'writes': self.writes,
+            'failed': self.failed,
+            'batch_size_mean': self.writes / self.batches if self.batches else 0,
+            'batch_size_max': self.batch_size_max,
+            'queue_size': self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+reservation_writer = ReservationWriter(
+    window_ms=settings.group_commit_window_ms,
+    max_batch_size=settings.group_commit_max_batch_size,
+)
@@ -0,0 +1,299 @@
+"""
+In-memory индекс интервалов бронирований по переговорным комнатам.
+
+Хранит для каждой комнаты отсортированные по началу интервалы бронирований
+и позволяет проверять пересечения за O(log n) без обращения к БД.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+
+class RoomIntervals:
+    """
+    Отсортированный массив непересекающихся интервалов одной комнаты.
+
+    Интервалы полуоткрытые — [начало, окончание): бронирования, которые
+    касаются границами, не пересекаются. Корректные бронирования комнаты не
+    пересекаются, поэтому и начала, и окончания отсортированы, и кандидата на
+    пересечение можно найти бинарным поиском.
+    Если инвариант нарушен (например, в БД уже есть пересекающиеся брони),
+    индекс помечается как неконсистентный и перестаёт отвечать на запросы:
+    ReservationIntervalIndex сбрасывает такую комнату, и при следующем
+    обращении она загружается из БД заново.
+    Бронирования, закончившиеся не позже covers_from, не загружаются: индекс
+    отвечает только для интервалов, начинающихся не раньше covers_from.
+    """
+    def __init__(self, covers_from: Optional[datetime] = None) -> None:
+        """
+        Инициализация пустого набора интервалов.
+
+        Args:
+            covers_from (Optional[datetime]): Начало периода, бронирования
+                которого загружены (None — все бронирования).
+        """
+        self.starts: list[datetime] = []
+        self.ends: list[datetime] = []
+        self.ids: list[int] = []
+        self.consistent = True
+        self.covers_from = covers_from
+
+    def covers(self, from_reserve: datetime) -> bool:
+        """
+        Загружены ли все бронирования, с которыми может пересечься интервал.
+
+        Args:
+            from_reserve (datetime): Начало проверяемого интервала.
+
+        Returns:
+            bool: True, если интервал начинается не раньше covers_from.
+        """
+        return self.covers_from is None or from_reserve >= self.covers_from
+
+    def add(
+        self,
+        reservation_id: int,
+        from_reserve: datetime,
+        to_reserve: datetime,
+    ) -> None:
+        """
+        Добавить интервал бронирования.
+
+        Args:
+            reservation_id (int): ID бронирования.
+            from_reserve (datetime): Начало бронирования.
+            to_reserve (datetime): Окончание бронирования.
+        """
+        position = bisect_left(self.starts, from_reserve)
+        if (
+            position > 0 and self.ends[position - 1] > from_reserve
+        ) or (
+            position < len(self.starts) and self.starts[position] < to_reserve
+        ):
+            self.consistent = False
+        self.starts.insert(position, from_reserve)
+        self.ends.insert(position, to_reserve)
+        self.ids.insert(position, reservation_id)
+
+    def discard(self, reservation_id: int) -> None:
+        """
+        Удалить интервал бронирования, если он есть в индексе.
+
+        Args:
+            reservation_id (int): ID бронирования.
+        """
+        try:
+            position = self.ids.index(reservation_id)
+        except ValueError:
+            return
+        del self.starts[position]
+        del self.ends[position]
+        del self.ids[position]
+
+    def overlaps(
+        self,
+        from_reserve: datetime,
+        to_reserve: datetime,
+        exclude_id: Optional[int] = None,
+    ) -> Optional[bool]:
+        """
+        Проверить, пересекается ли интервал с бронированиями комнаты.
+
+        Args:
+            from_reserve (datetime): Начало проверяемого интервала.
+            to_reserve (datetime): Окончание проверяемого интервала.
+            exclude_id (Optional[int]): ID бронирования, которое не учитывается.
+
+        Returns:
+            Optional[bool]: Результат проверки или None, если индекс
+                неконсистентен или не покрывает начало интервала.
+        """
+        if not self.consistent or not self.covers(from_reserve):
+            return None
+        position = bisect_right(self.ends, from_reserve)
+        while position < len(self.starts) and self.starts[position] < to_reserve:
+            if self.ids[position] != exclude_id:
+                return True
+            position += 1
+        return False
+
+
+class BookedIntervals:
+    """
+    Неизменяемый набор интервалов, отсортированный по началу.
+
+    Хранит префиксный максимум окончаний, поэтому проверка пересечения
+    выполняется за O(log n) даже если интервалы пересекаются между собой.
+    """
+    def __init__(self, intervals: list[tuple[datetime, datetime]]) -> None:
+        """
+        Инициализация набора интервалов.
+
+        Args:
+            intervals (list[tuple[datetime, datetime]]): Пары (начало, окончание).
+        """
+        intervals = sorted(intervals)
+        self.starts = [from_reserve for from_reserve, _ in intervals]
+        self.max_ends: list[datetime] = []
+        for _, to_reserve in intervals:
+            if self.max_ends and self.max_ends[-1] > to_reserve:
+                to_reserve = self.max_ends[-1]
+            self.max_ends.append(to_reserve)
+
+    def overlaps(self, from_reserve: datetime, to_reserve: datetime) -> bool:
+        """
+        Проверить, пересекается ли интервал с каким-либо интервалом набора.
+
+        Args:
+            from_reserve (datetime): Начало проверяемого интервала.
+            to_reserve (datetime): Окончание проверяемого интервала.
+
+        Returns:
+            bool: True, если есть пересечение.
+        """
+        position = bisect_left(self.starts, to_reserve)
+        return position > 0 and self.max_ends[position - 1] > from_reserve
+
+
+def find_free_intervals(
+    busy: Iterable[tuple[datetime, datetime]],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Найти свободные промежутки окна длиной не меньше duration.
+
+    Занятые интервалы должны быть отсортированы по началу; пересекающиеся
+    интервалы допускаются. Проход по ним выполняется один раз. Промежутки
+    начинаются в окончание и заканчиваются в начало соседних бронирований:
+    интервалы полуоткрытые, поэтому промежуток можно забронировать целиком.
+
+    Args:
+        busy (Iterable[tuple[datetime, datetime]]): Занятые интервалы.
+        window_start (datetime): Начало окна поиска.
+        window_end (datetime): Окончание окна поиска.
+        duration (timedelta): Минимальная длина свободного промежутка.
+
+    Returns:
+        list[tuple[datetime, datetime]]: Свободные промежутки по возрастанию.
+    """
+    free = []
+    cursor = window_start
+    for from_reserve, to_reserve in busy:
+        gap_end = min(from_reserve, window_end)
+        if gap_end - cursor >= duration:
+            free.append((cursor, gap_end))
+        if to_reserve > cursor:
+            cursor = to_reserve
+        if cursor >= window_end:
+            return free
+    if window_end - cursor >= duration:
+        free.append((cursor, window_end))
+    return free
+
+
+class ReservationIntervalIndex:
+    """
+    Индекс интервалов бронирований, сгруппированный по ID переговорной комнаты.
+
+    Комнаты загружаются из БД лениво, при первой проверке пересечений.
+    Индекс живёт в памяти процесса, поэтому корректен только тогда, когда все
+    записи бронирований проходят через этот процесс.
+    """
+    def __init__(self) -> None:
+        """
+        Инициализация пустого индекса.
+        """
+        self._rooms: dict[int, RoomIntervals] = {}
+
+    def get(self, meetingroom_id: int) -> Optional[RoomIntervals]:
+        """
+        Получить интервалы комнаты, если они уже загружены.
+
+        Неконсистентные интервалы сбрасываются: вызывающий код получает None
+        и загружает комнату из БД заново.
+
+        Args:
+            meetingroom_id (int): ID переговорной комнаты.
+
+        Returns:
+            Optional[RoomIntervals]: Интервалы комнаты или None.
+        """
+        room_intervals = self._rooms.get(meetingroom_id)
+        if room_intervals is not None and not room_intervals.consistent:
+            del self._rooms[meetingroom_id]
+            return None
+        return room_intervals
+
+    def load(
+        self,
+        meetingroom_id: int,
+        rows: list[tuple[int, datetime, datetime]],
+        covers_from: Optional[datetime] = None,
+    ) -> RoomIntervals:
+        """
+        Заполнить индекс комнаты строками из БД.
+
+        Args:
+            meetingroom_id (int): ID переговорной комнаты.
+            rows (list[tuple[int, datetime, datetime]]): Кортежи (id, начало, окончание).
+            covers_from (Optional[datetime]): Строки содержат все бронирования,
+                заканчивающиеся позже этого момента (None — все бронирования).
+
+        Returns:
+            RoomIntervals: Загруженные интервалы комнаты.
+        """
+        room_intervals = RoomIntervals(covers_from)
+        for reservation_id, from_reserve, to_reserve in sorted(
+            rows, key=lambda row: row[1]
+        ):
+            room_intervals.add(reservation_id, from_reserve, to_reserve)
+        self._rooms[meetingroom_id] = room_intervals
+        return room_intervals
+
+    def add(self, reservation) -> None:
+        """
+        Добавить бронирование в индекс, если его комната уже загружена.
+
+        Args:
+            reservation: Объект бронирования.
+        """
+        room_intervals = self._rooms.get(reservation.meetingroom_id)
+        if room_intervals is not None:
+            room_intervals.add(
+                reservation.id, reservation.from_reserve, reservation.to_reserve
+            )
+
+    def discard(self, meetingroom_id: int, reservation_id: int) -> None:
+        """
+        Удалить бронирование из индекса.
+
+        Args:
+            meetingroom_id (int): ID переговорной комнаты.
+            reservation_id (int): ID бронирования.
+        """
+        room_intervals = self._rooms.get(meetingroom_id)
+        if room_intervals is not None:
+            room_intervals.discard(reservation_id)
+
+    def drop_room(self, meetingroom_id: int) -> None:
+        """
+        Сбросить индекс комнаты (например, после её удаления или при
+        расхождении индекса с БД); при следующем обращении комната
+        загружается из БД заново.
+
+        Args:
+            meetingroom_id (int): ID переговорной комнаты.
+        """
+        self._rooms.pop(meetingroom_id, None)
+
+    def clear(self) -> None:
+        """
+        Полностью очистить индекс.
+        """
+        self._rooms.clear()
+
+
+reservation_index = ReservationIntervalIndex()
@@ -1,20 +1,92 @@
 """
 CRUD-операции для модели MeetingRoom (переговорные комнаты).
 
-Содержит методы для поиска комнаты по имени.
+Содержит методы для поиска комнаты по имени и свободных промежутков во всех комнатах.
 """
 
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import and_, delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.crud.interval_index import find_free_intervals, reservation_index
+from app.crud.room_catalog import room_catalog
 from app.models.meeting_room import MeetingRoom
+from app.models.reservation import Reservation
+from app.models.reservation_series import ReservationSeries
 
 class CRUDMeetingRoom(CRUDBase):
     """
     CRUD-класс для работы с переговорными комнатами.
+
+    Записи сбрасывают кэш каталога комнат room_catalog.
     """
+    async def create(
+        self,
+        obj_in,
+        session: AsyncSession,
+        user=None,
+    ) -> MeetingRoom:
+        """
+        Создать переговорную комнату и сбросить кэш каталога.
+
+        Args:
+            obj_in: Pydantic-схема с данными для создания.
+            session (AsyncSession): Асинхронная сессия БД.
+            user: Не используется.
+
+        Returns:
+            MeetingRoom: Созданная комната.
+        """
+        db_obj = await super().create(obj_in, session, user)
+        room_catalog.invalidate()
+        return db_obj
+
+    async def update(
+        self,
+        db_obj: MeetingRoom,
+        obj_in,
+        session: AsyncSession,
+    ) -> Optional[MeetingRoom]:
+        """
+        Обновить переговорную комнату и сбросить кэш каталога.
+
+        Args:
+            db_obj (MeetingRoom): Комната для обновления.
+            obj_in: Pydantic-схема с обновлёнными данными.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            Optional[MeetingRoom]: Обновлённая комната или None, если она
+                уже удалена.
+        """
+        db_obj = await super().update(db_obj, obj_in, session)
+        room_catalog.invalidate()
+        return db_obj
+
+    async def room_exists(
+        self,
+        room_id: int,
+        session: AsyncSession,
+    ) -> bool:
+        """
+        Проверить существование комнаты запросом EXISTS, не загружая её.
+
+        Args:
+            room_id (int): ID комнаты.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            bool: True, если комната существует.
+        """
+        room_exists = await session.execute(
+            select(exists().where(MeetingRoom.id == room_id))
+        )
+        return room_exists.scalar()
+
     async def get_room_id_by_name(
         self,
         room_name: str,
@@ -35,7 +107,121 @@ class CRUDMeetingRoom(CRUDBase):
                 MeetingRoom.name == room_name
             )
         )
-        db_room_id = db_room_id.scalars().first()
-        return db_room_id
+        return db_room_id.scalars().first()
+
+    async def get_existing_ids(
+        self,
+        room_ids: set[int],
+        session: AsyncSession,
+    ) -> set[int]:
+        """
+        Получить ID существующих комнат из переданного набора одним запросом.
+
+        Args:
+            room_ids (set[int]): Проверяемые ID комнат.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            set[int]: ID комнат, которые есть в БД.
+        """
+        db_room_ids = await session.execute(
+            select(MeetingRoom.id).where(
+                MeetingRoom.id.in_(room_ids)
+            )
+        )
+        return set(db_room_ids.scalars().all())
+
+    async def get_availability(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta,
+        session: AsyncSession,
+    ) -> list[dict]:
+        """
+        Найти свободные промежутки всех комнат в окне одним запросом.
+
+        Комнаты соединяются с бронированиями окна через LEFT JOIN, строки
+        упорядочены по комнате и началу брони, поэтому свободные промежутки
+        каждой комнаты находятся одним проходом.
+
+        Args:
+            window_start (datetime): Начало окна поиска.
+            window_end (datetime): Окончание окна поиска.
+            duration (timedelta): Минимальная длина свободного промежутка.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            list[dict]: Комнаты, в которых есть подходящие свободные промежутки.
+        """
+        rows = await session.execute(
+            select(
+                MeetingRoom.id,
+                MeetingRoom.name,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).outerjoin(
+                Reservation,
+                and_(
+                    Reservation.meetingroom_id == MeetingRoom.id,
+                    Reservation.to_reserve > window_start,
+                    Reservation.from_reserve < window_end
+                )
+            ).order_by(MeetingRoom.id, Reservation.from_reserve)
+        )
+        availability = []
+        for (room_id, room_name), room_rows in groupby(rows, key=itemgetter(0, 1)):
+            free_intervals = find_free_intervals(
+                (
+                    (from_reserve, to_reserve)
+                    for _, _, from_reserve, to_reserve in room_rows
+                    if from_reserve is not None
+                ),
+                window_start,
+                window_end,
+                duration,
+            )
+            if free_intervals:
+                availability.append({
+                    'meetingroom_id': room_id,
+                    'name': room_name,
+                    'free_intervals': [
+                        {'start': start, 'end': end}
+                        for start, end in free_intervals
+                    ],
+                })
+        return availability
+
+    async def remove(
+        self,
+        db_obj: MeetingRoom,
+        session: AsyncSession,
+    ) -> MeetingRoom:
+        """
+        Удалить переговорную комнату, сбросить индекс её бронирований и кэш каталога.
+
+        Бронирования и серии комнаты удаляются двумя запросами DELETE ... WHERE
+        meetingroom_id = ? в той же транзакции, без загрузки в сессию
+        (связи комнаты объявлены с passive_deletes). Внешние ключи объявлены
+        с ON DELETE CASCADE, но SQLite применяет их только при PRAGMA
+        foreign_keys=ON, поэтому удаление выполняется явно.
+
+        Args:
+            db_obj (MeetingRoom): Комната для удаления.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            MeetingRoom: Удалённая комната.
+        """
+        for model in (Reservation, ReservationSeries):
+            await session.execute(
+                delete(model).where(
+                    model.meetingroom_id == db_obj.id
+                ).execution_options(synchronize_session=False)
+            )
+        db_obj = await super().remove(db_obj, session)
+        reservation_index.drop_room(db_obj.id)
+        room_catalog.invalidate()
+        return db_obj
 
 meeting_room_crud = CRUDMeetingRoom(MeetingRoom)
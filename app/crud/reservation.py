@@ -5,19 +5,548 @@ CRUD-операции для модели Reservation (бронирование
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    and_, exists, func, insert, literal, select, tuple_, update
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Insert, Update
 
-from app.crud.base import CRUDBase
+from app.core.config import settings
+from app.core.db import begin_immediate
+from app.crud.base import CRUDBase, supports_returning
+from app.crud.interval_index import (
+    BookedIntervals, RoomIntervals, reservation_index
+)
+from app.crud.meeting_room import meeting_room_crud
+from app.models.meeting_room import MeetingRoom
 from app.models.reservation import Reservation
+from app.models.reservation_series import ReservationSeries
 from app.models.user import User
+from app.schemas.constants import ReservationExportConstants
+from app.schemas.reservation import (
+    ReservationBatchStatus, ReservationCreate, ReservationOrder
+)
+
+# Строк в одном многострочном INSERT: 150 строк по 6 колонок укладываются
+# в лимит 999 параметров старых версий SQLite.
+INSERT_CHUNK_SIZE = 150
+EXPORT_COLUMNS = (
+    Reservation.id,
+    Reservation.from_reserve,
+    Reservation.to_reserve,
+    Reservation.meetingroom_id,
+    Reservation.user_id,
+    Reservation.series_id,
+)
+USER_RESERVATION_COLUMNS = (
+    Reservation.id,
+    Reservation.from_reserve,
+    Reservation.to_reserve,
+    Reservation.meetingroom_id,
+    Reservation.series_id,
+)
 
 class CRUDReservation(CRUDBase):
     """
     CRUD-класс для работы с бронированиями переговорных комнат.
+
+    При включённой настройке reservation_index_enabled поддерживает в актуальном
+    состоянии in-memory индекс интервалов бронирований по комнатам.
     """
+    async def create(
+        self,
+        obj_in,
+        session: AsyncSession,
+        user: Optional[User] = None
+    ) -> Reservation:
+        """
+        Создать бронирование и добавить его в индекс интервалов.
+
+        Args:
+            obj_in: Pydantic-схема с данными для создания.
+            session (AsyncSession): Асинхронная сессия БД.
+            user (Optional[User]): Пользователь, создающий бронирование.
+
+        Returns:
+            Reservation: Созданное бронирование.
+        """
+        db_obj = await super().create(obj_in, session, user)
+        reservation_index.add(db_obj)
+        return db_obj
+
+    async def create_if_free(
+        self,
+        obj_in: ReservationCreate,
+        session: AsyncSession,
+        user: User,
+    ) -> Optional[Reservation]:
+        """
+        Атомарно создать бронирование, если комната существует и свободна.
+
+        Проверка комнаты, проверка пересечений и вставка выполняются одним
+        запросом INSERT ... SELECT ... WHERE EXISTS(комната) AND NOT EXISTS
+        (пересечение). В SQLite запрос выполняется в транзакции BEGIN IMMEDIATE,
+        поэтому два конкурентных запроса не могут занять один и тот же интервал;
+        в других СУБД перед вставкой блокируется строка комнаты.
+
+        Args:
+            obj_in (ReservationCreate): Данные бронирования.
+            session (AsyncSession): Асинхронная сессия БД.
+            user (User): Пользователь, создающий бронирование.
+
+        Returns:
+            Optional[Reservation]: Созданное бронирование или None, если
+                комнаты нет или интервал занят.
+        """
+        values = {**obj_in.dict(), 'user_id': user.id}
+        room_intervals = None
+        if settings.reservation_index_enabled:
+            room_intervals = reservation_index.get(obj_in.meetingroom_id)
+            if room_intervals is not None and room_intervals.overlaps(
+                obj_in.from_reserve, obj_in.to_reserve
+            ):
+                return None
+        statement = self.insert_if_free_statement(values)
+        await self.lock_rooms([obj_in.meetingroom_id], session)
+        if session.bind.dialect.name == 'sqlite':
+            result = await session.execute(statement)
+            reservation_id = result.lastrowid if result.rowcount else None
+        else:
+            result = await session.execute(statement.returning(Reservation.id))
+            reservation_id = result.scalar()
+        await session.commit()
+        if reservation_id is None:
+            if room_intervals is not None:
+                # Индекс считал интервал свободным, а БД отклонила вставку:
+                # индекс отстал от БД и загрузится заново.
+                reservation_index.drop_room(obj_in.meetingroom_id)
+            return None
+        db_obj = await self.merge_loaded(
+            {**values, 'id': reservation_id, 'series_id': None}, session
+        )
+        reservation_index.add(db_obj)
+        return db_obj
+
+    async def lock_rooms(
+        self,
+        room_ids: Iterable[int],
+        session: AsyncSession,
+    ) -> None:
+        """
+        Заблокировать запись бронирований комнат до конца транзакции.
+
+        В SQLite начинает транзакцию BEGIN IMMEDIATE, в других СУБД блокирует
+        строки комнат (SELECT ... FOR UPDATE). Проверка пересечений и запись
+        после вызова не пересекаются с записями других запросов и процессов,
+        в том числе с групповой фиксацией, которая не берёт room_locks.
+
+        Args:
+            room_ids (Iterable[int]): ID комнат.
+            session (AsyncSession): Асинхронная сессия БД.
+        """
+        if session.bind.dialect.name == 'sqlite':
+            await begin_immediate(session)
+            return
+        await session.execute(
+            select(MeetingRoom.id).where(
+                MeetingRoom.id.in_(set(room_ids))
+            ).order_by(MeetingRoom.id).with_for_update()
+        )
+
+    def insert_if_free_statement(self, values: dict) -> Insert:
+        """
+        Запрос вставки бронирования, если комната существует и свободна.
+
+        Args:
+            values (dict): Значения колонок бронирования без ID.
+
+        Returns:
+            Insert: INSERT ... SELECT ... WHERE EXISTS(комната)
+                AND NOT EXISTS(пересечение).
+        """
+        table = Reservation.__table__
+        return insert(Reservation).from_select(
+            list(values),
+            select(
+                *(literal(value, table.c[key].type) for key, value in values.items())
+            ).where(
+                exists().where(MeetingRoom.id == values['meetingroom_id']),
+                ~exists().where(*self._intersection_conditions(
+                    values['from_reserve'],
+                    values['to_reserve'],
+                    values['meetingroom_id'],
+                )),
+            )
+        )
+
+    def update_if_free_statement(
+        self,
+        reservation_id: int,
+        meetingroom_id: int,
+        values: dict,
+    ) -> Update:
+        """
+        Запрос изменения бронирования, если новый интервал свободен.
+
+        Args:
+            reservation_id (int): ID бронирования.
+            meetingroom_id (int): ID комнаты бронирования.
+            values (dict): Новые значения from_reserve и to_reserve.
+
+        Returns:
+            Update: UPDATE ... WHERE id = :id AND NOT EXISTS(пересечение).
+        """
+        other = aliased(Reservation)
+        return update(Reservation).where(
+            Reservation.id == reservation_id,
+            ~exists().where(*self._intersection_conditions(
+                values['from_reserve'],
+                values['to_reserve'],
+                meetingroom_id,
+                reservation_id,
+                model=other,
+            )),
+        ).values(**values).execution_options(synchronize_session=False)
+
+    async def update(
+        self,
+        db_obj: Reservation,
+        obj_in,
+        session: AsyncSession,
+    ) -> Optional[Reservation]:
+        """
+        Обновить бронирование и его интервал в индексе.
+
+        Args:
+            db_obj (Reservation): Бронирование для обновления.
+            obj_in: Pydantic-схема с обновлёнными данными.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            Optional[Reservation]: Обновлённое бронирование или None, если
+                оно уже удалено.
+        """
+        meetingroom_id, reservation_id = db_obj.meetingroom_id, db_obj.id
+        db_obj = await super().update(db_obj, obj_in, session)
+        reservation_index.discard(meetingroom_id, reservation_id)
+        if db_obj is not None:
+            reservation_index.add(db_obj)
+        return db_obj
+
+    async def remove(
+        self,
+        db_obj: Reservation,
+        session: AsyncSession,
+    ) -> Reservation:
+        """
+        Удалить бронирование и его интервал из индекса.
+
+        Args:
+            db_obj (Reservation): Бронирование для удаления.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            Reservation: Удалённое бронирование.
+        """
+        db_obj = await super().remove(db_obj, session)
+        reservation_index.discard(db_obj.meetingroom_id, db_obj.id)
+        return db_obj
+
+    async def create_batch(
+        self,
+        reservations: list[ReservationCreate],
+        session: AsyncSession,
+        user: User,
+    ) -> list[tuple[ReservationBatchStatus, Optional[Reservation]]]:
+        """
+        Создать пакет бронирований в одной транзакции.
+
+        Существование комнат проверяется после lock_rooms, в той же
+        транзакции, что и вставка: комната, удалённая до проверки, не получит
+        бронирований. Бронирования несуществующих комнат пропускаются,
+        остальные создаются через bulk_create с проверкой пересечений с БД
+        и внутри пакета.
+
+        Args:
+            reservations (list[ReservationCreate]): Бронирования для создания.
+            session (AsyncSession): Асинхронная сессия БД.
+            user (User): Пользователь, создающий бронирования.
+
+        Returns:
+            list[tuple[ReservationBatchStatus, Optional[Reservation]]]:
+                Статус и созданное бронирование для каждого элемента пакета.
+        """
+        room_ids = {reservation.meetingroom_id for reservation in reservations}
+        await self.lock_rooms(room_ids, session)
+        existing_room_ids = await meeting_room_crud.get_existing_ids(
+            room_ids, session
+        )
+        positions = [
+            position for position, reservation in enumerate(reservations)
+            if reservation.meetingroom_id in existing_room_ids
+        ]
+        created = await self.bulk_create(
+            [
+                {**reservations[position].dict(), 'user_id': user.id}
+                for position in positions
+            ],
+            session
+        )
+        results = [
+            (ReservationBatchStatus.ROOM_NOT_FOUND, None)
+        ] * len(reservations)
+        for position, db_obj in zip(positions, created):
+            results[position] = (
+                (ReservationBatchStatus.CREATED, db_obj) if db_obj is not None
+                else (ReservationBatchStatus.CONFLICT, None)
+            )
+        return results
+
+    async def bulk_create(
+        self,
+        objs_in_data: list[dict],
+        session: AsyncSession,
+    ) -> list[Optional[Reservation]]:
+        """
+        Создать бронирования одним executemany, пропустив конфликтующие.
+
+        Проверка пересечений и вставка выполняются под блокировкой записи
+        комнат (lock_rooms); транзакция фиксируется, даже если вставлять
+        нечего.
+
+        Args:
+            objs_in_data (list[dict]): Данные бронирований (поля модели).
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            list[Optional[Reservation]]: Созданные бронирования в порядке входных
+                данных; None для бронирований с пересечениями.
+        """
+        if not objs_in_data:
+            await session.commit()
+            return []
+        await self.lock_rooms(
+            (obj_in_data['meetingroom_id'] for obj_in_data in objs_in_data),
+            session,
+        )
+        conflicts = await self.find_conflicts(objs_in_data, session)
+        accepted = [
+            position for position, conflict in enumerate(conflicts)
+            if not conflict
+        ]
+        created = [None] * len(objs_in_data)
+        db_objs = await self.insert_many(
+            [objs_in_data[position] for position in accepted], session
+        )
+        for position, db_obj in zip(accepted, db_objs):
+            created[position] = db_obj
+        return created
+
+    async def create_series(
+        self,
+        obj_in: ReservationCreate,
+        session: AsyncSession,
+        user: User,
+    ) -> list[Reservation]:
+        """
+        Создать серию повторяющихся бронирований и все её вхождения.
+
+        Серия и вхождения записываются в одной транзакции: вхождения
+        вставляются одним executemany. Проверку пересечений серии вызывающий
+        код выполняет после lock_rooms, в той же транзакции.
+
+        Args:
+            obj_in (ReservationCreate): Данные бронирования с правилом повторения.
+            session (AsyncSession): Асинхронная сессия БД.
+            user (User): Пользователь, создающий серию.
+
+        Returns:
+            list[Reservation]: Вхождения серии в хронологическом порядке.
+        """
+        series = ReservationSeries(
+            **obj_in.recurrence.dict(),
+            meetingroom_id=obj_in.meetingroom_id,
+            user_id=user.id,
+        )
+        session.add(series)
+        await session.flush()
+        return await self.insert_many(
+            [
+                {**occurrence, 'user_id': user.id, 'series_id': series.id}
+                for occurrence in self.series_occurrences(obj_in)
+            ],
+            session
+        )
+
+    def series_occurrences(self, obj_in: ReservationCreate) -> list[dict]:
+        """
+        Развернуть бронирование с правилом повторения во вхождения.
+
+        Args:
+            obj_in (ReservationCreate): Данные бронирования с правилом повторения.
+
+        Returns:
+            list[dict]: Данные вхождений (комната, начало, окончание).
+        """
+        return [
+            {
+                'meetingroom_id': obj_in.meetingroom_id,
+                'from_reserve': from_reserve,
+                'to_reserve': to_reserve,
+            }
+            for from_reserve, to_reserve in obj_in.recurrence.expand(
+                obj_in.from_reserve, obj_in.to_reserve
+            )
+        ]
+
+    async def find_conflicts(
+        self,
+        objs_in_data: list[dict],
+        session: AsyncSession,
+    ) -> list[bool]:
+        """
+        Найти бронирования пакета, пересекающиеся с БД или друг с другом.
+
+        Пересечения с БД ищутся одним диапазонным запросом на все комнаты пакета,
+        пересечения внутри пакета — проходом по бронированиям, отсортированным
+        по комнате и началу: из двух пересекающихся конфликтным считается более позднее.
+
+        Args:
+            objs_in_data (list[dict]): Данные бронирований (поля модели).
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            list[bool]: Признак конфликта для каждого бронирования пакета.
+        """
+        if not objs_in_data:
+            return []
+        booked = await self._get_booked_intervals(objs_in_data, session)
+        conflicts = [False] * len(objs_in_data)
+        last_to_reserve = {}
+        for position in sorted(
+            range(len(objs_in_data)),
+            key=lambda position: (
+                objs_in_data[position]['meetingroom_id'],
+                objs_in_data[position]['from_reserve'],
+            )
+        ):
+            obj_in_data = objs_in_data[position]
+            meetingroom_id = obj_in_data['meetingroom_id']
+            room_booked = booked.get(meetingroom_id)
+            if (
+                room_booked is not None and room_booked.overlaps(
+                    obj_in_data['from_reserve'], obj_in_data['to_reserve']
+                )
+            ) or (
+                meetingroom_id in last_to_reserve
+                and obj_in_data['from_reserve'] < last_to_reserve[meetingroom_id]
+            ):
+                conflicts[position] = True
+                continue
+            last_to_reserve[meetingroom_id] = obj_in_data['to_reserve']
+        return conflicts
+
+    async def insert_many(
+        self,
+        objs_in_data: list[dict],
+        session: AsyncSession,
+    ) -> list[Reservation]:
+        """
+        Вставить бронирования и закоммитить транзакцию.
+
+        Если БД поддерживает RETURNING, бронирования вставляются многострочными
+        INSERT ... RETURNING по INSERT_CHUNK_SIZE строк. Строки одного INSERT
+        получают ID по порядку VALUES, а RETURNING может вернуть их в любом
+        порядке, поэтому возвращённые строки сопоставляются с входными данными
+        по возрастанию ID. Без RETURNING каждое бронирование вставляется
+        отдельным запросом, ID берётся из inserted_primary_key.
+
+        Args:
+            objs_in_data (list[dict]): Данные бронирований без пересечений.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            list[Reservation]: Созданные бронирования в порядке входных данных.
+        """
+        rows = [
+            {
+                key: value for key, value in obj_in_data.items()
+                if key in self.column_keys
+            }
+            for obj_in_data in objs_in_data
+        ]
+        values = []
+        if rows and supports_returning(session):
+            for chunk_start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                result = await session.execute(
+                    insert(Reservation).values(
+                        rows[chunk_start:chunk_start + INSERT_CHUNK_SIZE]
+                    ).returning(*self.columns)
+                )
+                values.extend(
+                    {column.key: row._mapping[column] for column in self.columns}
+                    for row in sorted(result, key=lambda row: row.id)
+                )
+        else:
+            for row in rows:
+                result = await session.execute(insert(Reservation).values(**row))
+                values.append({
+                    **dict.fromkeys(self.column_keys),
+                    **row,
+                    'id': result.inserted_primary_key[0],
+                })
+        await session.commit()
+        db_objs = [await self.merge_loaded(value, session) for value in values]
+        for db_obj in db_objs:
+            reservation_index.add(db_obj)
+        return db_objs
+
+    async def _get_booked_intervals(
+        self,
+        objs_in_data: list[dict],
+        session: AsyncSession,
+    ) -> dict[int, BookedIntervals]:
+        """
+        Загрузить одним запросом занятые интервалы комнат в окне пакета.
+
+        Args:
+            objs_in_data (list[dict]): Данные бронирований пакета.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            dict[int, BookedIntervals]: Занятые интервалы по ID комнаты.
+        """
+        rows = await session.execute(
+            select(
+                Reservation.meetingroom_id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).where(
+                Reservation.meetingroom_id.in_(
+                    {obj_in_data['meetingroom_id'] for obj_in_data in objs_in_data}
+                ),
+                Reservation.to_reserve > min(
+                    obj_in_data['from_reserve'] for obj_in_data in objs_in_data
+                ),
+                Reservation.from_reserve < max(
+                    obj_in_data['to_reserve'] for obj_in_data in objs_in_data
+                )
+            )
+        )
+        intervals = {}
+        for meetingroom_id, from_reserve, to_reserve in rows:
+            intervals.setdefault(meetingroom_id, []).append(
+                (from_reserve, to_reserve)
+            )
+        return {
+            meetingroom_id: BookedIntervals(room_intervals)
+            for meetingroom_id, room_intervals in intervals.items()
+        }
+
     async def get_reservations_at_the_same_time(
         self,
         *,
@@ -43,8 +572,8 @@ class CRUDReservation(CRUDBase):
         select_stmt = select(Reservation).where(
             Reservation.meetingroom_id == meetingroom_id,
             and_(
-                from_reserve <= Reservation.to_reserve,
-                to_reserve >= Reservation.from_reserve
+                from_reserve < Reservation.to_reserve,
+                to_reserve > Reservation.from_reserve
             )
         )
         if reservation_id is not None:
@@ -55,50 +584,299 @@ class CRUDReservation(CRUDBase):
         reservations = reservations.scalars().all()
         return reservations
 
-    async def get_future_reservations_for_room(
+    async def has_reservations_at_the_same_time(
         self,
-        room_id: int,
+        *,
+        from_reserve: datetime,
+        to_reserve: datetime,
+        meetingroom_id: int,
+        reservation_id: Optional[int] = None,
         session: AsyncSession,
-    ) -> list[Reservation]:
+    ) -> bool:
         """
-        Получить все будущие бронирования для переговорной комнаты.
+        Проверить, есть ли бронирования, пересекающиеся по времени и комнате.
+
+        Сначала использует in-memory индекс интервалов (если он включён):
+        холодная, сброшенная после расхождения с БД или загруженная с более
+        поздней границы комната загружается заново, а если и загруженные
+        интервалы неконсистентны, выполняется запрос EXISTS к БД.
 
         Args:
-            room_id (int): ID переговорной комнаты.
+            from_reserve (datetime): Начало нового бронирования.
+            to_reserve (datetime): Конец нового бронирования.
+            meetingroom_id (int): ID переговорной комнаты.
+            reservation_id (Optional[int]): Исключить бронирование с этим ID (например, при обновлении).
             session (AsyncSession): Асинхронная сессия БД.
 
         Returns:
-            list[Reservation]: Список будущих бронирований.
+            bool: True, если есть пересекающиеся бронирования.
         """
-        reservations = await session.execute(
-            select(Reservation).where(
-                Reservation.meetingroom_id == room_id,
-                Reservation.to_reserve > datetime.now()
+        if settings.reservation_index_enabled:
+            room_intervals = reservation_index.get(meetingroom_id)
+            if room_intervals is None or not room_intervals.covers(from_reserve):
+                room_intervals = await self._load_room_intervals(
+                    meetingroom_id, from_reserve, session
+                )
+            intersects = room_intervals.overlaps(
+                from_reserve, to_reserve, exclude_id=reservation_id
             )
+            if intersects is not None:
+                return intersects
+        conditions = self._intersection_conditions(
+            from_reserve, to_reserve, meetingroom_id, reservation_id
         )
-        reservations = reservations.scalars().all()
-        return reservations
+        intersects = await session.execute(select(exists().where(*conditions)))
+        return intersects.scalar()
+
+    @staticmethod
+    def _intersection_conditions(
+        from_reserve: datetime,
+        to_reserve: datetime,
+        meetingroom_id: int,
+        reservation_id: Optional[int] = None,
+        model=Reservation,
+    ) -> list:
+        """
+        Условия пересечения бронирований комнаты с интервалом.
+
+        Интервалы полуоткрытые: бронирования, которые касаются границами
+        (одно заканчивается, когда начинается другое), не пересекаются.
+
+        Args:
+            from_reserve (datetime): Начало интервала.
+            to_reserve (datetime): Конец интервала.
+            meetingroom_id (int): ID переговорной комнаты.
+            reservation_id (Optional[int]): Исключить бронирование с этим ID.
+            model: Модель или её псевдоним (для подзапроса внутри UPDATE).
+
+        Returns:
+            list: Условия для WHERE.
+        """
+        conditions = [
+            model.meetingroom_id == meetingroom_id,
+            from_reserve < model.to_reserve,
+            to_reserve > model.from_reserve,
+        ]
+        if reservation_id is not None:
+            conditions.append(model.id != reservation_id)
+        return conditions
+
+    async def _load_room_intervals(
+        self,
+        meetingroom_id: int,
+        from_reserve: datetime,
+        session: AsyncSession,
+    ) -> RoomIntervals:
+        """
+        Загрузить в индекс интервалы бронирований комнаты, заканчивающихся
+        позже начала проверяемого интервала.
+
+        Более ранние бронирования не могут пересечься ни с ним, ни с более
+        поздними интервалами; для интервала, начинающегося раньше, комната
+        загружается заново.
+
+        Args:
+            meetingroom_id (int): ID переговорной комнаты.
+            from_reserve (datetime): Начало проверяемого интервала.
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            RoomIntervals: Интервалы бронирований комнаты.
+        """
+        rows = await session.execute(
+            select(
+                Reservation.id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).where(
+                Reservation.meetingroom_id == meetingroom_id,
+                Reservation.to_reserve > from_reserve
+            )
+        )
+        return reservation_index.load(meetingroom_id, rows.all(), from_reserve)
+
+    async def get_room_schedule(
+        self,
+        room_id: int,
+        session: AsyncSession,
+        from_reserve: datetime,
+        to_reserve: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Row]]:
+        """
+        Получить бронирования комнаты в окне, упорядоченные по началу.
+
+        Проверка существования комнаты и выборка выполняются одним запросом:
+        комната соединяется (LEFT JOIN) с бронированиями окна, поэтому комната
+        без бронирований даёт одну строку без бронирования, а отсутствующая —
+        ни одной строки.
+
+        Диапазон задаётся по началу бронирования и использует индекс
+        (meetingroom_id, from_reserve, to_reserve). Так как бронирования одной
+        комнаты не пересекаются, окно может задеть только одно бронирование,
+        начавшееся до from_reserve, — последнее из них; его начало находится
+        подзапросом max() по тому же индексу и служит нижней границей диапазона.
+
+        Args:
+            room_id (int): ID переговорной комнаты.
+            session (AsyncSession): Асинхронная сессия БД.
+            from_reserve (datetime): Бронирования, заканчивающиеся позже.
+            to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше;
+                None — без ограничения.
+            limit (Optional[int]): Максимальное количество бронирований.
+
+        Returns:
+            Optional[list[Row]]: Строки столбцов бронирований окна или None,
+                если комнаты нет.
+        """
+        started_before = aliased(Reservation)
+        lower_bound = select(func.max(started_before.from_reserve)).where(
+            started_before.meetingroom_id == room_id,
+            started_before.from_reserve <= from_reserve,
+        ).scalar_subquery()
+        window = [
+            Reservation.meetingroom_id == MeetingRoom.id,
+            Reservation.from_reserve >= func.coalesce(lower_bound, from_reserve),
+            Reservation.to_reserve > from_reserve,
+        ]
+        if to_reserve is not None:
+            window.append(Reservation.from_reserve < to_reserve)
+        select_stmt = select(
+            MeetingRoom.id.label('room_id'), *self.columns
+        ).select_from(MeetingRoom).outerjoin(
+            Reservation, and_(*window)
+        ).where(
+            MeetingRoom.id == room_id
+        ).order_by(Reservation.from_reserve)
+        if limit is not None:
+            select_stmt = select_stmt.limit(limit)
+        rows = (await session.execute(select_stmt)).all()
+        if not rows:
+            return None
+        return [row for row in rows if row.id is not None]
 
     async def get_by_user(
         self,
         session: AsyncSession,
-        user: User
-    ) -> list[Reservation]:
+        user: User,
+        from_reserve: Optional[datetime] = None,
+        to_reserve: Optional[datetime] = None,
+        upcoming_only: bool = False,
+        order: ReservationOrder = ReservationOrder.ASC,
+        limit: Optional[int] = None,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> list[Row]:
+        """
+        Получить бронирования пользователя, упорядоченные по (from_reserve, id).
+
+        Возвращает строки USER_RESERVATION_COLUMNS без ORM-объектов.
+        Фильтр по окончанию использует индекс (user_id, to_reserve), порядок
+        и курсор — индекс (user_id, from_reserve).
+
+        Args:
+            session (AsyncSession): Асинхронная сессия БД.
+            user (User): Пользователь.
+            from_reserve (Optional[datetime]): Бронирования, заканчивающиеся позже.
+            to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше.
+            upcoming_only (bool): Только ещё не закончившиеся бронирования.
+            order (ReservationOrder): Порядок сортировки по началу.
+            limit (Optional[int]): Максимальное количество строк.
+            after (Optional[tuple[datetime, int]]): Курсор — (from_reserve, id)
+                последнего бронирования предыдущей страницы.
+
+        Returns:
+            list[Row]: Строки бронирований.
+        """
+        if upcoming_only:
+            now = datetime.now()
+            from_reserve = max(from_reserve, now) if from_reserve else now
+        conditions = [Reservation.user_id == user.id]
+        if from_reserve is not None:
+            conditions.append(Reservation.to_reserve > from_reserve)
+        if to_reserve is not None:
+            conditions.append(Reservation.from_reserve < to_reserve)
+        key = tuple_(Reservation.from_reserve, Reservation.id)
+        if order == ReservationOrder.DESC:
+            if after is not None:
+                conditions.append(key < after)
+            ordering = (Reservation.from_reserve.desc(), Reservation.id.desc())
+        else:
+            if after is not None:
+                conditions.append(key > after)
+            ordering = (Reservation.from_reserve, Reservation.id)
+        select_stmt = select(*USER_RESERVATION_COLUMNS).where(
+            *conditions
+        ).order_by(*ordering)
+        if limit is not None:
+            select_stmt = select_stmt.limit(limit)
+        rows = await session.execute(select_stmt)
+        return rows.all()
+
+    async def get_user_page(
+        self,
+        session: AsyncSession,
+        user: User,
+        limit: int,
+        **filters,
+    ) -> tuple[list[Row], Optional[tuple[datetime, int]]]:
         """
-        Получить все бронирования пользователя.
+        Получить страницу бронирований пользователя и курсор следующей.
 
         Args:
             session (AsyncSession): Асинхронная сессия БД.
             user (User): Пользователь.
+            limit (int): Размер страницы.
+            **filters: Фильтры, порядок и курсор get_by_user.
 
         Returns:
-            list[Reservation]: Список бронирований пользователя.
+            tuple[list[Row], Optional[tuple[datetime, int]]]: Строки страницы
+                и курсор следующей (None, если страница последняя).
+        """
+        rows = await self.get_by_user(session, user, limit=limit + 1, **filters)
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            return rows[:limit], (last.from_reserve, last.id)
+        return rows, None
+
+    async def stream_export_rows(
+        self,
+        session: AsyncSession,
+        from_reserve: Optional[datetime] = None,
+        to_reserve: Optional[datetime] = None,
+        meetingroom_id: Optional[int] = None,
+    ) -> AsyncIterator[list[Row]]:
         """
-        reservations = await session.execute(
-            select(Reservation).where(
-                Reservation.user_id == user.id
+        Потоково читать строки бронирований для выгрузки.
+
+        Использует серверный курсор (stream с yield_per): в памяти одновременно
+        находится не больше YIELD_PER строк, ORM-объекты не создаются.
+        Окно полуоткрытое, как и интервалы бронирований: бронирование,
+        только касающееся границы окна, не выгружается.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия БД.
+            from_reserve (Optional[datetime]): Бронирования, заканчивающиеся позже.
+            to_reserve (Optional[datetime]): Бронирования, начинающиеся раньше.
+            meetingroom_id (Optional[int]): ID переговорной комнаты.
+
+        Yields:
+            list[Row]: Очередная партия строк из EXPORT_COLUMNS.
+        """
+        select_stmt = select(*EXPORT_COLUMNS).order_by(Reservation.id)
+        if from_reserve is not None:
+            select_stmt = select_stmt.where(Reservation.to_reserve > from_reserve)
+        if to_reserve is not None:
+            select_stmt = select_stmt.where(Reservation.from_reserve < to_reserve)
+        if meetingroom_id is not None:
+            select_stmt = select_stmt.where(
+                Reservation.meetingroom_id == meetingroom_id
+            )
+        result = await session.stream(
+            select_stmt.execution_options(
+                yield_per=ReservationExportConstants.YIELD_PER
             )
         )
-        return reservations.scalars().all()
+        async for partition in result.partitions():
+            yield partition
 
 reservation_crud = CRUDReservation(Reservation)
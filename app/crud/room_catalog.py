@@ -0,0 +1,132 @@
+"""
+In-process кэш каталога переговорных комнат.
+
+Хранит все комнаты и уже сериализованные страницы GET /meeting_rooms/ вместе
+с ETag. Сбрасывается при создании, изменении и удалении комнат, а также по TTL.
+Каталог, прочитанный из реплики вскоре после сброса, не кэшируется: реплика
+могла ещё не получить изменение, и устаревший список отдавался бы до
+истечения TTL.
+
+Кэш используется только для ответа со списком комнат. Проверки записей
+(существование комнаты, уникальность имени) читают БД: комнату мог создать,
+переименовать или удалить другой процесс приложения, и кэш этого процесса
+до истечения TTL ответил бы неверно.
+"""
+
+import hashlib
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import read_router
+from app.core.serialization import dumps, trusted_items
+from app.models.meeting_room import MeetingRoom
+from app.schemas.meeting_room import MeetingRoomDB
+
+MAX_CACHED_PAGES = 256
+
+
+class RoomCatalog:
+    """
+    Каталог комнат и закэшированные ответы со списком комнат.
+    """
+    def __init__(self, ttl_seconds: float) -> None:
+        """
+        Инициализация пустого каталога.
+
+        Args:
+            ttl_seconds (float): Время жизни загруженного каталога в секундах.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._rooms: Optional[list[dict]] = None
+        self._pages: dict[tuple, tuple[bytes, str]] = {}
+        self._expires_at = 0.0
+        self._generation = 0
+        self._invalidated_at = float('-inf')
+
+    async def _get_rooms(self, session: AsyncSession) -> list[dict]:
+        """
+        Получить комнаты, при необходимости загрузив их из БД одним запросом.
+
+        Если во время загрузки каталог был сброшен записью или загружен из
+        реплики, которая может ещё не содержать последний сброс, загруженные
+        данные возвращаются, но не кэшируются.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия БД.
+
+        Returns:
+            list[dict]: Комнаты, упорядоченные по ID.
+        """
+        if self._rooms is None or self._expires_at < time.monotonic():
+            generation = self._generation
+            rows = await session.execute(
+                select(
+                    MeetingRoom.id, MeetingRoom.name, MeetingRoom.description
+                ).order_by(MeetingRoom.id)
+            )
+            rooms = [dict(row._mapping) for row in rows]
+            if generation != self._generation or (
+                session.info.get('replica')
+                and time.monotonic() - self._invalidated_at
+                < read_router.max_staleness
+            ):
+                return rooms
+            self._pages = {}
+            self._rooms = rooms
+            self._expires_at = time.monotonic() + self.ttl_seconds
+        return self._rooms
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        limit: Optional[int],
+        after: Optional[int],
+    ) -> tuple[bytes, str]:
+        """
+        Получить сериализованную страницу списка комнат и её ETag.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия БД.
+            limit (Optional[int]): Размер страницы; None — все комнаты.
+            after (Optional[int]): Курсор — ID последней комнаты предыдущей страницы.
+
+        Returns:
+            tuple[bytes, str]: Тело ответа JSON и ETag.
+        """
+        rooms = await self._get_rooms(session)
+        cacheable = rooms is self._rooms
+        key = (limit, after)
+        if not cacheable or key not in self._pages:
+            if len(self._pages) >= MAX_CACHED_PAGES:
+                self._pages = {}
+            if after is not None:
+                rooms = [room for room in rooms if room['id'] > after]
+            next_cursor = None
+            if limit is not None and len(rooms) > limit:
+                rooms = rooms[:limit]
+                next_cursor = rooms[-1]['id']
+            page = {'items': trusted_items(MeetingRoomDB, rooms, exclude_none=True)}
+            if next_cursor is not None:
+                page['next_cursor'] = next_cursor
+            body = dumps(page)
+            page = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+            if not cacheable:
+                return page
+            self._pages[key] = page
+        return self._pages[key]
+
+    def invalidate(self) -> None:
+        """
+        Сбросить каталог и закэшированные страницы.
+        """
+        self._generation += 1
+        self._invalidated_at = time.monotonic()
+        self._rooms = None
+        self._pages = {}
+
+
+room_catalog = RoomCatalog(ttl_seconds=settings.room_catalog_ttl_seconds)
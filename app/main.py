@@ -6,7 +6,17 @@ from fastapi import FastAPI
 
 from app.api.routers import main_router
 from app.core.config import settings
+from app.core.db import (
+    ReadYourWritesMiddleware, engine, read_engine, read_router
+)
 from app.core.init_db import create_first_superuser
+from app.core.events import schedule_events
+from app.core.locks import room_locks
+from app.core import profiling
+from app.core.metrics import MetricsMiddleware, instrument_engine, metrics
+from app.core.passwords import password_hasher
+from app.core.user import token_revocations, user_cache
+from app.crud.group_commit import reservation_writer
 
 app = FastAPI(
     title=settings.app_title,
@@ -14,9 +24,75 @@ app = FastAPI(
 )
 app.include_router(main_router)
 
+if read_router.enabled:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine)
+    if read_router.enabled:
+        instrument_engine(read_engine, 'replica')
+        metrics.register_stats(
+            'read_router', read_router.stats, 'Маршрутизация чтений',
+            counters=(
+                'replica_reads', 'primary_reads', 'check_errors',
+                'heartbeat_errors',
+            ),
+        )
+    metrics.register_stats(
+        'room_locks', room_locks.stats, 'Блокировки записей по комнатам',
+        counters=('acquisitions', 'contended'),
+    )
+    metrics.register_stats(
+        'group_commit', reservation_writer.stats, 'Групповая фиксация бронирований',
+        counters=('batches', 'writes', 'failed'),
+    )
+    metrics.register_stats(
+        'user_cache', user_cache.stats, 'Кэш аутентифицированных пользователей',
+        counters=('hits', 'misses'),
+    )
+    metrics.register_stats(
+        'token_revocations', token_revocations.stats, 'Отзыв JWT-токенов',
+        counters=('refreshes', 'refresh_errors'),
+    )
+    metrics.register_stats(
+        'schedule_events', schedule_events.stats, 'События расписания комнат',
+        counters=('published', 'dropped'),
+    )
+    metrics.register_stats(
+        'password_hashing', password_hasher.stats, 'Хэширование паролей',
+        counters=('operations',),
+    )
+
+if settings.sql_profiling_enabled:
+    app.add_middleware(profiling.ProfilingMiddleware)
+    profiling.instrument_engine(engine)
+    if read_router.enabled:
+        profiling.instrument_engine(read_engine)
+
 @app.on_event('startup')
 async def startup() -> None:
     """
-    Создаёт первого суперпользователя при запуске приложения, если указаны данные в настройках.
+    Создаёт первого суперпользователя при запуске приложения, если указаны
+    данные в настройках, запускает перечитывание версий отозванных токенов
+    (при jwt_claims_enabled), измерение задержки реплики и запись отметки
+    времени для неё.
     """
     await create_first_superuser()
+    if settings.jwt_claims_enabled:
+        await token_revocations.start()
+    read_router.start()
+
+
+@app.on_event('shutdown')
+async def shutdown() -> None:
+    """
+    Останавливает фоновые задачи групповой фиксации бронирований,
+    перечитывания версий токенов и измерения задержки реплики, пул
+    хэширования паролей и завершает потоки событий расписания.
+    """
+    schedule_events.close()
+    await reservation_writer.stop()
+    await token_revocations.stop()
+    await read_router.stop()
+    password_hasher.shutdown()
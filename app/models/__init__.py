@@ -4,4 +4,5 @@
 
 from .meeting_room import MeetingRoom
 from .reservation import Reservation
+from .reservation_series import ReservationSeries
 from .user import User
@@ -5,3 +5,9 @@ class MeetingRoomModelConstants(SchemaBaseConstants):
     Константы для модели MeetingRoom.
     Наследует базовые ограничения схем, чтобы использовать единое значение длины имени.
     """
+
+class ReservationSeriesModelConstants:
+    """
+    Константы для модели ReservationSeries.
+    """
+    MAX_FREQUENCY_LENGTH: int = 10
@@ -16,7 +16,13 @@ class MeetingRoom(Base):
         name (str): Название комнаты.
         description (str): Описание комнаты.
         reservations: Связанные бронирования.
+        reservation_series: Связанные серии бронирований.
     """
     name = Column(String(MeetingRoomModelConstants.MAX_NAME_LENGTH), unique=True, nullable=False)
     description = Column(Text)
-    reservations = relationship('Reservation', cascade='delete')
+    reservations = relationship(
+        'Reservation', cascade='delete', passive_deletes=True
+    )
+    reservation_series = relationship(
+        'ReservationSeries', cascade='delete', passive_deletes=True
+    )
@@ -2,7 +2,7 @@
 SQLAlchemy-модель для хранения бронирований переговорных комнат.
 """
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
 
 from app.core.db import Base
 
@@ -15,14 +15,53 @@ class Reservation(Base):
         to_reserve (datetime): Время окончания бронирования.
         meetingroom_id (int): ID переговорной комнаты.
         user_id (int): ID пользователя.
+        series_id (int): ID серии повторяющихся бронирований.
+
+    Индексы покрывают поиск пересечений и расписания комнаты
+    и выборку бронирований пользователя.
     """
+    __table_args__ = (
+        Index(
+            'ix_reservation_meetingroom_id_from_reserve_to_reserve',
+            'meetingroom_id', 'from_reserve', 'to_reserve'
+        ),
+        Index(
+            'ix_reservation_meetingroom_id_to_reserve',
+            'meetingroom_id', 'to_reserve'
+        ),
+        Index(
+            'ix_reservation_user_id_from_reserve',
+            'user_id', 'from_reserve'
+        ),
+        Index(
+            'ix_reservation_user_id_to_reserve',
+            'user_id', 'to_reserve'
+        ),
+    )
+
     from_reserve = Column(DateTime)
     to_reserve = Column(DateTime)
-    meetingroom_id = Column(Integer, ForeignKey('meetingroom.id'))
+    meetingroom_id = Column(
+        Integer,
+        ForeignKey(
+            'meetingroom.id',
+            name='fk_reservation_meetingroom_id_meetingroom',
+            ondelete='CASCADE'
+        )
+    )
     user_id = Column(
         Integer,
         ForeignKey('user.id', name='fk_reservation_user_id_user')
     )
+    series_id = Column(
+        Integer,
+        ForeignKey(
+            'reservationseries.id',
+            name='fk_reservation_series_id_reservationseries',
+            ondelete='CASCADE'
+        ),
+        index=True
+    )
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,46 @@
+"""
+SQLAlchemy-модель серии повторяющихся бронирований.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from app.core.db import Base
+from app.models.constants import ReservationSeriesModelConstants
+
+
+class ReservationSeries(Base):
+    """
+    Модель серии повторяющихся бронирований.
+
+    Атрибуты:
+        frequency (str): Частота повторения (daily, weekly).
+        interval (int): Шаг повторения в единицах частоты.
+        until (datetime): Крайняя дата начала вхождения.
+        count (int): Количество вхождений.
+        meetingroom_id (int): ID переговорной комнаты.
+        user_id (int): ID пользователя.
+        reservations: Бронирования (вхождения) серии.
+    """
+    frequency = Column(
+        String(ReservationSeriesModelConstants.MAX_FREQUENCY_LENGTH),
+        nullable=False
+    )
+    interval = Column(Integer, nullable=False)
+    until = Column(DateTime)
+    count = Column(Integer)
+    meetingroom_id = Column(
+        Integer,
+        ForeignKey(
+            'meetingroom.id',
+            name='fk_reservationseries_meetingroom_id_meetingroom',
+            ondelete='CASCADE'
+        )
+    )
+    user_id = Column(
+        Integer,
+        ForeignKey('user.id', name='fk_reservationseries_user_id_user')
+    )
+    reservations = relationship(
+        'Reservation', cascade='delete', passive_deletes=True
+    )
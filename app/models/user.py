@@ -3,11 +3,19 @@ SQLAlchemy-модель пользователя для FastAPI Users.
 """
 
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable
+from sqlalchemy import Column, DateTime, Integer
 
 from app.core.db import Base
 
 class User(SQLAlchemyBaseUserTable[int], Base):
     """
     Модель пользователя для FastAPI Users.
+
+    token_version записывается в выпускаемые JWT-токены. При
+    jwt_claims_enabled она увеличивается при смене пароля, блокировке
+    и изменении прав: токены с меньшей версией считаются отозванными.
+    token_version_changed_at — время последнего увеличения версии: по нему
+    перечитываются только версии, увеличенные не раньше срока жизни токена.
     """
-    pass
+    token_version = Column(Integer, nullable=False, default=0, server_default='0')
+    token_version_changed_at = Column(DateTime, index=True)
@@ -30,6 +30,9 @@ class ReservationMessages:
     """
     FROM_LESS_THAN_NOW: str = 'Время начала бронирования не может быть меньше текущего времени'
     FROM_MORE_THAN_TO: str = 'Время начала бронирования не может быть больше времени окончания'
+    UNTIL_OR_COUNT: str = 'Для повторения нужно указать ровно одно из полей until или count'
+    OCCURRENCES_OUT_OF_RANGE: str = 'Серия должна содержать от 1 до {max_occurrences} вхождений'
+    DURATION_NOT_LESS_THAN_STEP: str = 'Длительность бронирования должна быть меньше шага повторения'
 
 class ReservationTimeDefaults:
     """
@@ -38,4 +41,42 @@ class ReservationTimeDefaults:
     TO_HOURS_SHIFT — смещение окончания (часы).
     """
     FROM_MINUTES_SHIFT: int = 10
-    TO_HOURS_SHIFT: int = 1 
\ No newline at end of file
+    TO_HOURS_SHIFT: int = 1
+
+class ReservationBatchConstants:
+    """
+    Ограничения пакетного создания бронирований.
+    MAX_ITEMS — максимальное количество бронирований в одном запросе.
+    """
+    MAX_ITEMS: int = 1000
+
+class ReservationRecurrenceConstants:
+    """
+    Ограничения повторяющихся бронирований.
+    MAX_OCCURRENCES — максимальное количество вхождений в серии.
+    """
+    MAX_OCCURRENCES: int = 366
+
+class MeetingRoomAvailabilityConstants:
+    """
+    Ограничения поиска свободных комнат.
+    MAX_WINDOW_DAYS — максимальная длина окна поиска (дни).
+    """
+    MAX_WINDOW_DAYS: int = 31
+
+class PaginationConstants:
+    """
+    Параметры keyset-пагинации списков.
+    DEFAULT_LIMIT — размер страницы по умолчанию.
+    MAX_LIMIT — максимальный размер страницы.
+    """
+    DEFAULT_LIMIT: int = 100
+    MAX_LIMIT: int = 1000
+
+class ReservationExportConstants:
+    """
+    Параметры потоковой выгрузки бронирований.
+    YIELD_PER — количество строк, читаемых из курсора БД за раз
+    и отправляемых клиенту одним фрагментом.
+    """
+    YIELD_PER: int = 1000
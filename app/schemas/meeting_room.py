@@ -2,6 +2,7 @@
 Pydantic-схемы для работы с переговорными комнатами.
 """
 
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, validator
@@ -82,3 +83,39 @@ class MeetingRoomDB(MeetingRoomCreate):
 
     class Config:
         orm_mode = True
+
+
+class FreeInterval(BaseModel):
+    """
+    Свободный промежуток в расписании комнаты.
+
+    Attributes:
+        start (datetime): Начало промежутка.
+        end (datetime): Окончание промежутка.
+    """
+    start: datetime
+    end: datetime
+
+class MeetingRoomAvailability(BaseModel):
+    """
+    Свободные промежутки переговорной комнаты.
+
+    Attributes:
+        meetingroom_id (int): ID комнаты.
+        name (str): Название комнаты.
+        free_intervals (list[FreeInterval]): Свободные промежутки по возрастанию.
+    """
+    meetingroom_id: int
+    name: str
+    free_intervals: list[FreeInterval]
+
+class MeetingRoomPage(BaseModel):
+    """
+    Страница списка переговорных комнат.
+
+    Attributes:
+        items (list[MeetingRoomDB]): Комнаты страницы.
+        next_cursor (Optional[int]): Значение after для следующей страницы.
+    """
+    items: list[MeetingRoomDB]
+    next_cursor: Optional[int]
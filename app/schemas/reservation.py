@@ -3,10 +3,16 @@ Pydantic-схемы для работы с бронированиями пере
 """
 
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Extra, Field, root_validator, validator
-from app.schemas.constants import ReservationMessages, ReservationTimeDefaults
+from pydantic import BaseModel, Extra, Field, conlist, root_validator, validator
+from app.schemas.constants import (
+    ReservationBatchConstants,
+    ReservationMessages,
+    ReservationRecurrenceConstants,
+    ReservationTimeDefaults
+)
 
 FROM_TIME = (
     datetime.now() + timedelta(minutes=ReservationTimeDefaults.FROM_MINUTES_SHIFT)
@@ -77,14 +83,138 @@ class ReservationUpdate(ReservationBase):
         return values
 
 
+class RecurrenceFrequency(str, Enum):
+    """
+    Частота повторения бронирования.
+    """
+    DAILY = 'daily'
+    WEEKLY = 'weekly'
+
+
+class ReservationRecurrence(BaseModel):
+    """
+    Правило повторения бронирования.
+
+    Attributes:
+        frequency (RecurrenceFrequency): Частота повторения.
+        interval (int): Шаг повторения в единицах частоты (каждые N дней/недель).
+        until (Optional[datetime]): Крайнее время начала вхождения.
+        count (Optional[int]): Количество вхождений.
+    """
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1)
+    until: Optional[datetime]
+    count: Optional[int] = Field(None, ge=1)
+
+    class Config:
+        extra = Extra.forbid
+
+    @root_validator(skip_on_failure=True)
+    def check_until_or_count(cls, values: dict) -> dict:
+        """
+        Проверяет, что указано ровно одно из полей until и count.
+
+        Args:
+            values (dict): Значения полей.
+
+        Returns:
+            dict: Проверенные значения.
+
+        Raises:
+            ValueError: Если указаны оба поля или ни одного.
+        """
+        if (values['until'] is None) == (values['count'] is None):
+            raise ValueError(ReservationMessages.UNTIL_OR_COUNT)
+        return values
+
+    @property
+    def step(self) -> timedelta:
+        """
+        Шаг между началами соседних вхождений.
+
+        Returns:
+            timedelta: Шаг повторения.
+        """
+        days = 7 if self.frequency == RecurrenceFrequency.WEEKLY else 1
+        return timedelta(days=days * self.interval)
+
+    def occurrences_count(self, from_reserve: datetime) -> int:
+        """
+        Количество вхождений серии, начинающейся в from_reserve.
+
+        Args:
+            from_reserve (datetime): Начало первого вхождения.
+
+        Returns:
+            int: Количество вхождений.
+        """
+        if self.count is not None:
+            return self.count
+        return (self.until - from_reserve) // self.step + 1
+
+    def expand(
+        self,
+        from_reserve: datetime,
+        to_reserve: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Развернуть серию во вхождения за один проход.
+
+        Args:
+            from_reserve (datetime): Начало первого вхождения.
+            to_reserve (datetime): Окончание первого вхождения.
+
+        Returns:
+            list[tuple[datetime, datetime]]: Пары (начало, окончание) вхождений.
+        """
+        step = self.step
+        duration = to_reserve - from_reserve
+        starts = [
+            from_reserve + step * number
+            for number in range(self.occurrences_count(from_reserve))
+        ]
+        return [(start, start + duration) for start in starts]
+
+
 class ReservationCreate(ReservationUpdate):
     """
     Схема создания бронирования.
 
     Attributes:
         meetingroom_id (int): ID переговорной комнаты.
+        recurrence (Optional[ReservationRecurrence]): Правило повторения;
+            не входит в dict(), чтобы не попадать в поля модели Reservation.
     """
     meetingroom_id: int
+    recurrence: Optional[ReservationRecurrence] = Field(None, exclude=True)
+
+    @root_validator(skip_on_failure=True)
+    def check_recurrence(cls, values: dict) -> dict:
+        """
+        Проверяет, что серия не пересекается сама с собой и не слишком длинная.
+
+        Args:
+            values (dict): Значения полей.
+
+        Returns:
+            dict: Проверенные значения.
+
+        Raises:
+            ValueError: Если вхождения пересекаются или их количество вне допустимого.
+        """
+        recurrence = values.get('recurrence')
+        if recurrence is None:
+            return values
+        if values['to_reserve'] - values['from_reserve'] >= recurrence.step:
+            raise ValueError(ReservationMessages.DURATION_NOT_LESS_THAN_STEP)
+        occurrences_count = recurrence.occurrences_count(values['from_reserve'])
+        if not 1 <= occurrences_count <= ReservationRecurrenceConstants.MAX_OCCURRENCES:
+            raise ValueError(
+                ReservationMessages.OCCURRENCES_OUT_OF_RANGE.format(
+                    max_occurrences=ReservationRecurrenceConstants.MAX_OCCURRENCES
+                )
+            )
+        return values
 
 
 class ReservationDB(ReservationBase):
@@ -95,10 +225,116 @@ class ReservationDB(ReservationBase):
         id (int): ID бронирования.
         meetingroom_id (int): ID переговорной комнаты.
         user_id (Optional[int]): ID пользователя.
+        series_id (Optional[int]): ID серии повторяющихся бронирований.
     """
     id: int
     meetingroom_id: int
     user_id: Optional[int]
+    series_id: Optional[int]
 
     class Config:
         orm_mode = True
+
+
+RESERVATION_PUBLIC_EXCLUDE = {'user_id'}
+
+
+class ReservationPage(BaseModel):
+    """
+    Страница списка бронирований.
+
+    Attributes:
+        items (list[ReservationDB]): Бронирования страницы.
+        next_cursor (Optional[int]): Значение after для следующей страницы.
+    """
+    items: list[ReservationDB]
+    next_cursor: Optional[int]
+
+
+class ReservationOrder(str, Enum):
+    """
+    Порядок сортировки бронирований по времени начала.
+    """
+    ASC = 'asc'
+    DESC = 'desc'
+
+
+class UserReservationPage(BaseModel):
+    """
+    Страница бронирований текущего пользователя.
+
+    Attributes:
+        items (list[ReservationDB]): Бронирования страницы.
+        next_cursor (Optional[str]): Значение after для следующей страницы.
+    """
+    items: list[ReservationDB]
+    next_cursor: Optional[str]
+
+
+def encode_reservation_cursor(from_reserve: datetime, reservation_id: int) -> str:
+    """
+    Закодировать курсор keyset-пагинации по (from_reserve, id).
+
+    Args:
+        from_reserve (datetime): Начало последнего бронирования страницы.
+        reservation_id (int): ID последнего бронирования страницы.
+
+    Returns:
+        str: Курсор вида «<ISO 8601>_<id>».
+    """
+    return f'{from_reserve.isoformat()}_{reservation_id}'
+
+
+def decode_reservation_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Разобрать курсор keyset-пагинации по (from_reserve, id).
+
+    Args:
+        cursor (str): Курсор из encode_reservation_cursor.
+
+    Returns:
+        tuple[datetime, int]: Начало и ID последнего бронирования страницы.
+
+    Raises:
+        ValueError: Если курсор некорректен.
+    """
+    from_reserve, _, reservation_id = cursor.rpartition('_')
+    return datetime.fromisoformat(from_reserve), int(reservation_id)
+
+
+class ReservationExportFormat(str, Enum):
+    """
+    Формат потоковой выгрузки бронирований.
+    """
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+ReservationBatchCreate = conlist(
+    ReservationCreate,
+    min_items=1,
+    max_items=ReservationBatchConstants.MAX_ITEMS
+)
+
+
+class ReservationBatchStatus(str, Enum):
+    """
+    Результат обработки одного бронирования из пакета.
+    """
+    CREATED = 'created'
+    CONFLICT = 'conflict'
+    ROOM_NOT_FOUND = 'room_not_found'
+
+
+class ReservationBatchItem(BaseModel):
+    """
+    Отчёт по одному бронированию из пакета.
+
+    Attributes:
+        index (int): Позиция бронирования в запросе.
+        status (ReservationBatchStatus): Результат обработки.
+        reservation (Optional[ReservationDB]): Созданное бронирование.
+    """
+    index: int
+    status: ReservationBatchStatus
+    reservation: Optional[ReservationDB]
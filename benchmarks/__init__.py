@@ -0,0 +1,6 @@
+"""
+Бенчмарки сервиса бронирования переговорных комнат.
+
+Каждый модуль запускается как `python -m benchmarks.<имя>` из корня репозитория
+и работает со своей временной SQLite-базой.
+"""
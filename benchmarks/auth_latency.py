@@ -0,0 +1,132 @@
+"""
+Бенчмарк задержки аутентифицированных запросов.
+
+Сравнивает три способа получить текущего пользователя по JWT:
+    БД на каждый запрос — CachedJWTStrategy с отключённым кэшем;
+    кэш пользователей — CachedJWTStrategy с кэшем (по умолчанию);
+    флаги в токене — ClaimsJWTStrategy, доступ решается по is_active
+        и is_superuser из токена без запроса к БД.
+
+Замеряются GET /reservations/ (current_superuser) и
+GET /reservations/my_reservations (current_user) на почти пустой базе,
+чтобы в задержке преобладала аутентификация; для каждого режима выводится
+и количество SQL-запросов на HTTP-запрос.
+
+Запуск: python -m benchmarks.auth_latency --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import event, update
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, summarize
+)
+from benchmarks.load_test import login, seed_database
+from app.core.base import Base
+from app.core.config import settings
+from app.core.db import engine
+from app.core.user import (
+    claims_user, current_superuser, current_user, user_cache
+)
+from app.main import app
+
+ENDPOINTS = {
+    'current_superuser': ('/reservations/', None),
+    'current_user': ('/reservations/my_reservations', {'limit': 1}),
+}
+
+
+async def measure_mode(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    mode: str,
+) -> dict[str, dict[str, float]]:
+    """
+    Замерить задержку запросов в одном режиме аутентификации.
+
+    Args:
+        client (httpx.AsyncClient): Клиент.
+        args (argparse.Namespace): Параметры бенчмарка.
+        mode (str): Название режима (для отчёта).
+
+    Returns:
+        dict[str, dict[str, float]]: Перцентили задержки и число
+            SQL-запросов на HTTP-запрос по эндпоинтам.
+    """
+    response = await login(client, 1)
+    response.raise_for_status()
+    headers = {'Authorization': f'Bearer {response.json()["access_token"]}'}
+    statements = []
+
+    def count(*_) -> None:
+        statements.append(None)
+
+    results = {}
+    for name, (url, params) in ENDPOINTS.items():
+        for _ in range(args.warmup):
+            (await client.get(url, params=params, headers=headers)).raise_for_status()
+        event.listen(engine.sync_engine, 'before_cursor_execute', count)
+        timings = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            response = await client.get(url, params=params, headers=headers)
+            timings.append(time.perf_counter() - started)
+            response.raise_for_status()
+        event.remove(engine.sync_engine, 'before_cursor_execute', count)
+        stats = summarize(timings)
+        results[f'{mode}: {name}'] = {
+            'p50_ms': stats['p50_ms'],
+            'p99_ms': stats['p99_ms'],
+            'sql_per_request': len(statements) / args.requests,
+        }
+        statements.clear()
+    return results
+
+
+async def main() -> None:
+    """
+    Сравнить задержку запросов с запросом пользователя к БД и без него.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=50)
+    args = parser.parse_args()
+    args.users, args.rooms, args.reservations = 1, 1, 1
+
+    seed_database(args, datetime.now() + timedelta(days=1))
+    sync_engine = create_sync_engine(database_path('app'))
+    with sync_engine.begin() as connection:
+        connection.execute(
+            update(Base.metadata.tables['user']).values(is_superuser=True)
+        )
+    sync_engine.dispose()
+
+    results = {}
+    cache_ttl = user_cache.ttl_seconds
+    await app.router.startup()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url='http://auth-latency'
+    ) as client:
+        settings.jwt_claims_enabled = False
+        user_cache.ttl_seconds = 0
+        results.update(await measure_mode(client, args, 'БД на каждый запрос'))
+        user_cache.ttl_seconds = cache_ttl
+        results.update(await measure_mode(client, args, 'кэш пользователей'))
+        settings.jwt_claims_enabled = True
+        app.dependency_overrides[current_user] = claims_user()
+        app.dependency_overrides[current_superuser] = claims_user(superuser=True)
+        results.update(await measure_mode(client, args, 'флаги в токене'))
+    await app.router.shutdown()
+    await engine.dispose()
+    print_report(
+        f'{args.requests} последовательных запросов на эндпоинт', results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,167 @@
+"""
+Общие утилиты бенчмарков: временная БД, наполнение данными и замер времени.
+
+Модуль подменяет DATABASE_URL на временную SQLite-базу, поэтому должен
+импортироваться раньше любых модулей приложения.
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+BENCHMARK_DIR = tempfile.mkdtemp(prefix='room_reservation_bench_')
+os.environ['DATABASE_URL'] = 'sqlite+aiosqlite:///{}'.format(
+    os.path.join(BENCHMARK_DIR, 'app.db')
+)
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.engine import Connection, Engine  # noqa: E402
+
+from app.core.base import Base  # noqa: E402
+
+SLOT_DURATION = timedelta(hours=1)
+SLOT_STEP = timedelta(hours=1, minutes=30)
+
+
+def database_path(name: str) -> str:
+    """
+    Путь к файлу временной базы бенчмарка.
+
+    Args:
+        name (str): Имя базы без расширения.
+
+    Returns:
+        str: Абсолютный путь к файлу базы.
+    """
+    return os.path.join(BENCHMARK_DIR, f'{name}.db')
+
+
+def create_sync_engine(path: str) -> Engine:
+    """
+    Создать синхронный движок SQLite со схемой приложения.
+
+    Args:
+        path (str): Путь к файлу базы.
+
+    Returns:
+        Engine: Движок SQLAlchemy.
+    """
+    engine = create_engine(f'sqlite:///{path}', future=True)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def seed(
+    connection: Connection,
+    rooms: int,
+    users: int,
+    reservations_per_room: int,
+    start: datetime,
+) -> None:
+    """
+    Наполнить базу комнатами, пользователями и непересекающимися бронированиями.
+
+    Бронирования каждой комнаты идут подряд с шагом SLOT_STEP начиная со start.
+
+    Args:
+        connection (Connection): Соединение с базой.
+        rooms (int): Количество комнат.
+        users (int): Количество пользователей.
+        reservations_per_room (int): Количество бронирований на комнату.
+        start (datetime): Начало первого бронирования.
+    """
+    tables = Base.metadata.tables
+    connection.execute(
+        tables['meetingroom'].insert(),
+        [{'id': room_id, 'name': f'Room {room_id}'} for room_id in range(1, rooms + 1)]
+    )
+    connection.execute(
+        tables['user'].insert(),
+        [
+            {
+                'id': user_id,
+                'email': f'user{user_id}@example.com',
+                'hashed_password': '',
+                'is_active': True,
+                'is_superuser': False,
+                'is_verified': False,
+            }
+            for user_id in range(1, users + 1)
+        ]
+    )
+    for room_id in range(1, rooms + 1):
+        connection.execute(
+            tables['reservation'].insert(),
+            [
+                {
+                    'meetingroom_id': room_id,
+                    'user_id': (room_id * reservations_per_room + slot) % users + 1,
+                    'from_reserve': start + slot * SLOT_STEP,
+                    'to_reserve': start + slot * SLOT_STEP + SLOT_DURATION,
+                }
+                for slot in range(reservations_per_room)
+            ]
+        )
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    """
+    Посчитать статистику по замерам времени.
+
+    Args:
+        timings (list[float]): Замеры в секундах.
+
+    Returns:
+        dict[str, float]: Среднее, p50, p95, p99 и максимум в миллисекундах.
+    """
+    ordered = sorted(timings)
+
+    def percentile(share: float) -> float:
+        return ordered[min(len(ordered) - 1, int(share * len(ordered)))] * 1000
+
+    return {
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    """
+    Выполнить функцию repeat раз и вернуть статистику времени.
+
+    Args:
+        func (Callable[[], object]): Замеряемая функция.
+        repeat (int): Количество повторов.
+
+    Returns:
+        dict[str, float]: Статистика времени в миллисекундах.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return summarize(timings)
+
+
+def print_report(title: str, rows: dict[str, dict[str, float]]) -> None:
+    """
+    Вывести таблицу результатов бенчмарка.
+
+    Args:
+        title (str): Заголовок таблицы.
+        rows (dict[str, dict[str, float]]): Статистика по сценариям.
+    """
+    print(f'\n{title}')
+    for name, stats in rows.items():
+        values = '  '.join(
+            f'{key}={value:.3f}' if isinstance(value, float) else f'{key}={value}'
+            for key, value in stats.items()
+        )
+        print(f'  {name:<40} {values}')
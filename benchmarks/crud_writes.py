@@ -0,0 +1,145 @@
+"""
+Микробенчмарк пути записи CRUDBase.
+
+Сравнивает создание и обновление комнат и бронирований через ORM
+(commit + refresh, два запроса на запись) и через INSERT/UPDATE ... RETURNING
+(один запрос). Помимо времени считает количество SQL-запросов на операцию.
+
+Запуск: python -m benchmarks.crud_writes --operations 2000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.db import create_engine
+from app.crud.meeting_room import meeting_room_crud
+from app.crud.reservation import reservation_crud
+from app.schemas.meeting_room import MeetingRoomCreate, MeetingRoomUpdate
+from app.schemas.reservation import ReservationCreate, ReservationUpdate
+
+ROOMS = 10
+
+
+async def run(name: str, returning: bool, operations: int) -> dict:
+    """
+    Выполнить создание и обновление комнат и бронирований на отдельной базе.
+
+    Args:
+        name (str): Имя базы.
+        returning (bool): Использовать ли путь с RETURNING.
+        operations (int): Количество операций каждого вида.
+
+    Returns:
+        dict: Статистика по каждому виду операций.
+    """
+    path = database_path(name)
+    sync_engine = create_sync_engine(path)
+    with sync_engine.begin() as connection:
+        seed(connection, ROOMS, 1, 0, start=datetime.now())
+    sync_engine.dispose()
+
+    engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    statements = []
+    event.listen(
+        engine.sync_engine, 'before_cursor_execute',
+        lambda *args: statements.append(1)
+    )
+    # Без expire_on_commit объекты, созданные ранее, не перечитываются
+    # перед обновлением, и замеряется только сам путь записи.
+    session_factory = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    user = SimpleNamespace(id=1)
+    start = datetime.now().replace(microsecond=0) + timedelta(days=365)
+    for crud in (meeting_room_crud, reservation_crud):
+        crud.returning_enabled = returning
+
+    async def timed(operation, session: AsyncSession) -> dict:
+        timings = []
+        statements.clear()
+        for number in range(operations):
+            started = time.perf_counter()
+            await operation(number, session)
+            timings.append(time.perf_counter() - started)
+        return {
+            **summarize(timings),
+            'queries_per_op': len(statements) / operations,
+        }
+
+    rooms, reservations = [], []
+
+    async def create_room(number: int, session: AsyncSession) -> None:
+        rooms.append(await meeting_room_crud.create(
+            MeetingRoomCreate(name=f'{name} {number}'), session
+        ))
+
+    async def update_room(number: int, session: AsyncSession) -> None:
+        await meeting_room_crud.update(
+            rooms[number], MeetingRoomUpdate(description=f'#{number}'), session
+        )
+
+    async def create_reservation(number: int, session: AsyncSession) -> None:
+        from_reserve = start + timedelta(hours=2 * number)
+        reservations.append(await reservation_crud.create(
+            ReservationCreate(
+                meetingroom_id=number % ROOMS + 1,
+                from_reserve=from_reserve,
+                to_reserve=from_reserve + timedelta(hours=1),
+            ),
+            session,
+            user,
+        ))
+
+    async def update_reservation(number: int, session: AsyncSession) -> None:
+        from_reserve = start + timedelta(hours=2 * number)
+        await reservation_crud.update(
+            reservations[number],
+            ReservationUpdate(
+                from_reserve=from_reserve,
+                to_reserve=from_reserve + timedelta(minutes=90),
+            ),
+            session,
+        )
+
+    async with session_factory() as session:
+        results = {
+            f'{name}: create room': await timed(create_room, session),
+            f'{name}: update room': await timed(update_room, session),
+            f'{name}: create reservation': await timed(
+                create_reservation, session
+            ),
+            f'{name}: update reservation': await timed(
+                update_reservation, session
+            ),
+        }
+    await engine.dispose()
+    return results
+
+
+async def main() -> None:
+    """
+    Запустить микробенчмарк пути записи.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--operations', type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {
+        **await run('orm', False, args.operations),
+        **await run('returning', True, args.operations),
+    }
+    print_report(f'{args.operations} операций каждого вида', results)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""
+Бенчмарк групповой фиксации бронирований.
+
+Конкурентные задачи создают непересекающиеся бронирования через
+CRUDReservation.create_if_free (транзакция на каждое бронирование) и через
+ReservationWriter (одна транзакция на пакет). Работает на базе приложения
+(AsyncSessionLocal), которую benchmarks.common подменяет временной.
+
+Запуск: python -m benchmarks.group_commit --workers 64 --operations 4000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.db import AsyncSessionLocal, engine
+from app.crud.group_commit import ReservationWriter
+from app.crud.reservation import reservation_crud
+from app.schemas.reservation import ReservationCreate
+
+ROOMS = 50
+
+
+async def run(create, start: datetime, args: argparse.Namespace) -> dict:
+    """
+    Создать бронирования конкурентными задачами.
+
+    Args:
+        create: Корутина создания (obj_in, session, user).
+        start (datetime): Начало первого бронирования сценария.
+        args (argparse.Namespace): Параметры бенчмарка.
+
+    Returns:
+        dict: Пропускная способность, задержки и количество отказов.
+    """
+    user = SimpleNamespace(id=1)
+    operations = iter(range(args.operations))
+    timings = []
+    rejected = 0
+
+    async def worker() -> None:
+        nonlocal rejected
+        for number in operations:
+            from_reserve = start + timedelta(hours=number // ROOMS)
+            reservation = ReservationCreate(
+                meetingroom_id=number % ROOMS + 1,
+                from_reserve=from_reserve,
+                to_reserve=from_reserve + timedelta(minutes=30),
+            )
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as session:
+                if await create(reservation, session, user) is None:
+                    rejected += 1
+            timings.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.workers)))
+    elapsed = time.perf_counter() - started
+    return {
+        'writes_per_s': args.operations / elapsed,
+        'p50_ms': summarize(timings)['p50_ms'],
+        'p99_ms': summarize(timings)['p99_ms'],
+        'rejected': rejected,
+    }
+
+
+async def main() -> None:
+    """
+    Сравнить создание бронирований без групповой фиксации и с ней.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=64)
+    parser.add_argument('--operations', type=int, default=4000)
+    parser.add_argument('--window-ms', type=float, default=2)
+    parser.add_argument('--max-batch-size', type=int, default=100)
+    args = parser.parse_args()
+
+    sync_engine = create_sync_engine(database_path('app'))
+    with sync_engine.begin() as connection:
+        seed(connection, ROOMS, 1, 0, start=datetime.now())
+    sync_engine.dispose()
+
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    writer = ReservationWriter(args.window_ms, args.max_batch_size)
+    results = {
+        'create_if_free': await run(reservation_crud.create_if_free, start, args),
+        'group commit': await run(
+            writer.create, start + timedelta(days=365), args
+        ),
+    }
+    results['group commit'].update(
+        batch_size_mean=writer.stats()['batch_size_mean'],
+        batch_size_max=writer.stats()['batch_size_max'],
+    )
+    await writer.stop()
+    await engine.dispose()
+    print_report(
+        f'{args.workers} писателей, {args.operations} бронирований, '
+        f'окно {args.window_ms} мс',
+        results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
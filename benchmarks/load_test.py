@@ -0,0 +1,327 @@
+"""
+Нагрузочный тест API внутри процесса.
+
+Наполняет временную базу приложения пользователями, комнатами
+и бронированиями и нагружает app.main.app конкурентным асинхронным
+клиентом httpx через ASGI-транспорт, без сети и отдельного сервера.
+Для каждого сценария считает пропускную способность, перцентили задержки
+и коды ответов; результаты сохраняются в JSON вместе с коммитом, чтобы
+сравнивать их между коммитами (--baseline).
+
+Сценарии:
+    rooms_list — GET /meeting_rooms/;
+    room_schedule — GET /meeting_rooms/{id}/reservations;
+    create_conflicts — POST /reservations/, часть интервалов занята (422);
+    my_reservations — GET /reservations/my_reservations;
+    login — POST /auth/jwt/login.
+
+Запуск: python -m benchmarks.load_test --requests 500 --concurrency 32
+    --output load.json [--baseline load_before.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import httpx
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import update
+
+from benchmarks.common import (
+    SLOT_STEP, create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.base import Base
+from app.core.db import engine
+from app.main import app
+
+PASSWORD = 'load-test-password'
+SCENARIOS = (
+    'rooms_list',
+    'room_schedule',
+    'create_conflicts',
+    'my_reservations',
+    'login',
+)
+
+Request = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def seed_database(args: argparse.Namespace, start: datetime) -> None:
+    """
+    Наполнить базу приложения данными для нагрузочного теста.
+
+    У всех пользователей одинаковый пароль PASSWORD.
+
+    Args:
+        args (argparse.Namespace): Параметры теста.
+        start (datetime): Начало первого бронирования каждой комнаты.
+    """
+    sync_engine = create_sync_engine(database_path('app'))
+    with sync_engine.begin() as connection:
+        seed(connection, args.rooms, args.users, args.reservations, start)
+        connection.execute(
+            update(Base.metadata.tables['user']).values(
+                hashed_password=PasswordHelper().hash(PASSWORD)
+            )
+        )
+    sync_engine.dispose()
+
+
+async def login(client: httpx.AsyncClient, user_id: int) -> httpx.Response:
+    """
+    Войти пользователем, созданным seed.
+
+    Args:
+        client (httpx.AsyncClient): Клиент.
+        user_id (int): ID пользователя.
+
+    Returns:
+        httpx.Response: Ответ с JWT-токеном.
+    """
+    return await client.post(
+        '/auth/jwt/login',
+        data={'username': f'user{user_id}@example.com', 'password': PASSWORD},
+    )
+
+
+def build_scenarios(
+    args: argparse.Namespace,
+    start: datetime,
+    tokens: list[dict[str, str]],
+) -> dict[str, Request]:
+    """
+    Построить запросы сценариев.
+
+    Новые бронирования create_conflicts выбираются на сетке SLOT_STEP:
+    первая половина интервалов совпадает с бронированиями из seed, вторая
+    свободна до первого занятия.
+
+    Args:
+        args (argparse.Namespace): Параметры теста.
+        start (datetime): Начало первого бронирования каждой комнаты.
+        tokens (list[dict[str, str]]): Заголовки авторизации пользователей.
+
+    Returns:
+        dict[str, Request]: Функции запроса по именам сценариев.
+    """
+    first_slot = args.reservations // 2
+    schedule_from = (start + first_slot * SLOT_STEP).isoformat()
+
+    async def rooms_list(client, rng):
+        return await client.get('/meeting_rooms/')
+
+    async def room_schedule(client, rng):
+        return await client.get(
+            f'/meeting_rooms/{rng.randint(1, args.rooms)}/reservations',
+            params={'from': schedule_from},
+        )
+
+    async def create_conflicts(client, rng):
+        slot = rng.randrange(first_slot, first_slot + args.reservations)
+        from_reserve = start + slot * SLOT_STEP
+        return await client.post(
+            '/reservations/',
+            json={
+                'meetingroom_id': rng.randint(1, args.rooms),
+                'from_reserve': from_reserve.isoformat(),
+                'to_reserve': (from_reserve + timedelta(hours=1)).isoformat(),
+            },
+            headers=rng.choice(tokens),
+        )
+
+    async def my_reservations(client, rng):
+        return await client.get(
+            '/reservations/my_reservations', headers=rng.choice(tokens)
+        )
+
+    async def login_scenario(client, rng):
+        return await login(client, rng.randint(1, args.users))
+
+    return {
+        'rooms_list': rooms_list,
+        'room_schedule': room_schedule,
+        'create_conflicts': create_conflicts,
+        'my_reservations': my_reservations,
+        'login': login_scenario,
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    request: Request,
+    args: argparse.Namespace,
+    seed_value: int,
+) -> dict:
+    """
+    Выполнить запросы сценария конкурентными задачами.
+
+    Args:
+        client (httpx.AsyncClient): Клиент.
+        request (Request): Функция запроса.
+        args (argparse.Namespace): Параметры теста.
+        seed_value (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        dict: Пропускная способность, перцентили задержки и коды ответов.
+    """
+    requests = iter(range(args.requests))
+    timings = []
+    statuses = Counter()
+
+    async def worker(rng: random.Random) -> None:
+        for _ in requests:
+            started = time.perf_counter()
+            try:
+                response = await request(client, rng)
+                statuses[response.status_code] += 1
+            except Exception as error:
+                statuses[type(error).__name__] += 1
+            timings.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        worker(random.Random(seed_value + number))
+        for number in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    stats = summarize(timings)
+    return {
+        'requests': args.requests,
+        'rps': args.requests / elapsed,
+        'p50_ms': stats['p50_ms'],
+        'p95_ms': stats['p95_ms'],
+        'p99_ms': stats['p99_ms'],
+        'max_ms': stats['max_ms'],
+        'statuses': {str(code): count for code, count in sorted(
+            statuses.items(), key=lambda item: str(item[0])
+        )},
+    }
+
+
+def git_commit() -> str:
+    """
+    Текущий коммит репозитория.
+
+    Returns:
+        str: Хэш коммита или пустая строка вне git.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def compare(results: dict, baseline_path: str) -> dict[str, dict[str, float]]:
+    """
+    Сравнить результаты с сохранёнными ранее.
+
+    Args:
+        results (dict): Результаты сценариев.
+        baseline_path (str): Путь к JSON с результатами другого коммита.
+
+    Returns:
+        dict[str, dict[str, float]]: Отношения текущих значений к базовым
+            по сценариям, присутствующим в обоих прогонах.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)['scenarios']
+    return {
+        name: {
+            key: stats[key] / baseline[name][key]
+            for key in ('rps', 'p50_ms', 'p95_ms', 'p99_ms')
+            if baseline[name][key]
+        }
+        for name, stats in results.items() if name in baseline
+    }
+
+
+async def main() -> None:
+    """
+    Запустить нагрузочный тест и сохранить результаты.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--rooms', type=int, default=20)
+    parser.add_argument('--reservations', type=int, default=500,
+                        help='бронирований на комнату')
+    parser.add_argument('--requests', type=int, default=500,
+                        help='запросов на сценарий')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS,
+                        default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='load_test.json')
+    parser.add_argument('--baseline')
+    args = parser.parse_args()
+
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1) - (
+        args.reservations // 2 * SLOT_STEP
+    )
+    seed_database(args, start)
+
+    transport = httpx.ASGITransport(app=app)
+    await app.router.startup()
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://load-test'
+    ) as client:
+        tokens = []
+        for user_id in range(1, args.users + 1):
+            response = await login(client, user_id)
+            response.raise_for_status()
+            tokens.append({
+                'Authorization': f'Bearer {response.json()["access_token"]}'
+            })
+        requests = build_scenarios(args, start, tokens)
+        results = {}
+        for number, name in enumerate(args.scenarios):
+            results[name] = await run_scenario(
+                client, requests[name], args, args.seed + number * 1000
+            )
+    await app.router.shutdown()
+    await engine.dispose()
+
+    report = {
+        'commit': git_commit(),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'parameters': {
+            key: value for key, value in vars(args).items()
+            if key not in ('output', 'baseline')
+        },
+        'scenarios': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print_report(
+        f'{args.concurrency} клиентов, {args.requests} запросов на сценарий '
+        f'(коммит {report["commit"] or "?"})',
+        {
+            name: {
+                key: value for key, value in stats.items()
+                if key not in ('requests', 'statuses')
+            }
+            for name, stats in results.items()
+        }
+    )
+    for name, stats in results.items():
+        print(f'  {name:<40} statuses={stats["statuses"]}')
+    if args.baseline:
+        print_report(
+            f'Отношение к {args.baseline} (rps > 1 и *_ms < 1 — улучшение)',
+            compare(results, args.baseline)
+        )
+    print(f'\nРезультаты сохранены в {args.output}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+"""
+Бенчмарк задержки запросов во время волны входов.
+
+Фоновые клиенты непрерывно запрашивают расписание комнат, а в середине
+замера одновременно приходит волна входов POST /auth/jwt/login. Сравнивает
+хэширование паролей прямо в event loop (PasswordHasher с workers=0,
+прежнее поведение) с пулом потоков: p99 фоновых запросов во время волны
+должен оставаться близким к замеру без входов.
+
+Запуск: python -m benchmarks.login_burst --logins 32 --workers 1
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.common import SLOT_STEP, print_report, summarize
+from benchmarks.load_test import login, seed_database
+from app.core.db import engine
+from app.core.passwords import PasswordHasher
+from app.core.user import UserManager
+from app.main import app
+
+
+async def run(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    start: datetime,
+    logins: int,
+) -> dict:
+    """
+    Нагрузить расписание комнат и выполнить волну входов.
+
+    Args:
+        client (httpx.AsyncClient): Клиент.
+        args (argparse.Namespace): Параметры бенчмарка.
+        start (datetime): Начало бронирований из seed.
+        logins (int): Количество одновременных входов (0 — без волны).
+
+    Returns:
+        dict: Перцентили фоновых запросов во время волны и длительность волны.
+    """
+    schedule_from = (start + args.reservations // 2 * SLOT_STEP).isoformat()
+    timings = []
+    window = {}
+    running = True
+
+    async def background(rng: random.Random) -> None:
+        while running:
+            started = time.perf_counter()
+            await client.get(
+                f'/meeting_rooms/{rng.randint(1, args.rooms)}/reservations',
+                params={'from': schedule_from, 'limit': 10},
+            )
+            timings.append((started, time.perf_counter() - started))
+
+    async def burst() -> None:
+        await asyncio.sleep(args.warmup)
+        window['start'] = time.perf_counter()
+        responses = await asyncio.gather(*(
+            login(client, number % args.users + 1) for number in range(logins)
+        ))
+        window['end'] = time.perf_counter()
+        assert all(response.status_code == 200 for response in responses)
+
+    clients = [
+        asyncio.create_task(background(random.Random(number)))
+        for number in range(args.clients)
+    ]
+    if logins:
+        await burst()
+    else:
+        await asyncio.sleep(args.warmup)
+        window['start'] = time.perf_counter()
+        await asyncio.sleep(args.warmup)
+        window['end'] = time.perf_counter()
+    running = False
+    await asyncio.gather(*clients)
+    during = [
+        elapsed for started, elapsed in timings
+        if window['start'] <= started <= window['end']
+    ]
+    stats = summarize(during)
+    return {
+        'requests': len(during),
+        'p50_ms': stats['p50_ms'],
+        'p99_ms': stats['p99_ms'],
+        'max_ms': stats['max_ms'],
+        'burst_s': window['end'] - window['start'],
+    }
+
+
+async def main() -> None:
+    """
+    Сравнить задержку фоновых запросов без входов и во время волны входов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=16)
+    parser.add_argument('--rooms', type=int, default=10)
+    parser.add_argument('--reservations', type=int, default=200)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=32)
+    parser.add_argument(
+        '--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1)
+    )
+    parser.add_argument('--warmup', type=float, default=1.0)
+    args = parser.parse_args()
+
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1) - (
+        args.reservations // 2 * SLOT_STEP
+    )
+    seed_database(args, start)
+    results = {}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url='http://login-burst'
+    ) as client:
+        results['без входов'] = await run(client, args, start, 0)
+        for name, hasher in (
+            ('bcrypt в event loop', PasswordHasher(0, 1)),
+            (
+                f'пул из {args.workers} потоков',
+                PasswordHasher(args.workers, args.workers),
+            ),
+        ):
+            UserManager.password_hasher = hasher
+            results[name] = await run(client, args, start, args.logins)
+            hasher.shutdown()
+    await engine.dispose()
+    print_report(
+        f'{args.clients} фоновых клиентов, волна из {args.logins} входов '
+        '(перцентили фоновых запросов во время волны)',
+        results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
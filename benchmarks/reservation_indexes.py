@@ -0,0 +1,132 @@
+"""
+Бенчмарк индексов таблицы reservation.
+
+Наполняет базу бронированиями и сравнивает планы и время выполнения
+запросов CRUDReservation без составных индексов и с ними.
+
+Запуск: python -m benchmarks.reservation_indexes --rooms 200 --per-room 1500
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import aliased
+
+from benchmarks.common import (
+    create_sync_engine, database_path, measure, print_report, seed
+)
+from app.models import Reservation
+
+
+def build_queries(rooms: int, now: datetime) -> dict:
+    """
+    Построить запросы, повторяющие запросы CRUDReservation.
+
+    Args:
+        rooms (int): Количество комнат в базе.
+        now (datetime): Текущее время для выборки будущих бронирований.
+
+    Returns:
+        dict: Запросы по имени сценария.
+    """
+    room_id = rooms // 2
+    from_reserve = now + timedelta(days=3)
+    to_reserve = from_reserve + timedelta(hours=2)
+    started_before = aliased(Reservation)
+    return {
+        'get_reservations_at_the_same_time': select(Reservation.id).where(
+            Reservation.meetingroom_id == room_id,
+            and_(
+                from_reserve < Reservation.to_reserve,
+                to_reserve > Reservation.from_reserve
+            )
+        ),
+        'get_room_schedule': select(Reservation.id).where(
+            Reservation.meetingroom_id == room_id,
+            Reservation.from_reserve >= func.coalesce(
+                select(func.max(started_before.from_reserve)).where(
+                    started_before.meetingroom_id == room_id,
+                    started_before.from_reserve <= now,
+                ).scalar_subquery(),
+                now
+            ),
+            Reservation.to_reserve > now,
+            Reservation.from_reserve < now + timedelta(days=7),
+        ).order_by(Reservation.from_reserve).limit(100),
+        'get_by_user': select(Reservation.id).where(
+            Reservation.user_id == 7
+        ),
+    }
+
+
+def explain(connection, stmt) -> str:
+    """
+    Получить план выполнения запроса SQLite.
+
+    Args:
+        connection: Соединение с базой.
+        stmt: Запрос SQLAlchemy.
+
+    Returns:
+        str: Строки плана, объединённые через «; ».
+    """
+    compiled = stmt.compile(dialect=connection.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', params)
+    return '; '.join(row[-1] for row in plan)
+
+
+def run(connection, queries: dict, repeat: int) -> dict:
+    """
+    Замерить запросы и собрать их планы.
+
+    Args:
+        connection: Соединение с базой.
+        queries (dict): Запросы по имени сценария.
+        repeat (int): Количество повторов каждого запроса.
+
+    Returns:
+        dict: Статистика и план по сценариям.
+    """
+    results = {}
+    for name, stmt in queries.items():
+        stats = measure(lambda: connection.execute(stmt).all(), repeat)
+        stats['plan'] = explain(connection, stmt)
+        results[name] = stats
+    return results
+
+
+def main() -> None:
+    """
+    Запустить бенчмарк индексов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rooms', type=int, default=200)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--per-room', type=int, default=1500)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    now = datetime.now()
+    engine = create_sync_engine(database_path('reservation_indexes'))
+    with engine.begin() as connection:
+        seed(
+            connection, args.rooms, args.users, args.per_room,
+            start=now - timedelta(days=args.per_room // 32)
+        )
+    queries = build_queries(args.rooms, now)
+    indexes = Reservation.__table__.indexes
+    with engine.begin() as connection:
+        for index in indexes:
+            index.drop(connection)
+        connection.exec_driver_sql('ANALYZE')
+        print_report('Без индексов', run(connection, queries, args.repeat))
+        for index in indexes:
+            index.create(connection)
+        connection.exec_driver_sql('ANALYZE')
+        print_report('С индексами', run(connection, queries, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
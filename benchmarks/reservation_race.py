@@ -0,0 +1,188 @@
+"""
+Стресс-тест конкурентного создания бронирований.
+
+Множество задач одновременно пытаются забронировать одни и те же интервалы
+небольшого числа комнат. Сравнивает прежний путь «проверка пересечений, затем
+вставка» с атомарным CRUDReservation.create_if_free и после каждого сценария
+считает двойные бронирования в БД. Для create_if_free их должно быть 0.
+
+Запуск: python -m benchmarks.reservation_race --workers 32 --attempts 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, sessionmaker
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.db import create_engine
+from app.crud.reservation import reservation_crud
+from app.models import Reservation
+from app.schemas.reservation import ReservationCreate
+
+ROOMS = 4
+SLOTS = 20
+
+
+async def check_then_insert(
+    reservation: ReservationCreate,
+    session: AsyncSession,
+    user: SimpleNamespace,
+) -> bool:
+    """
+    Прежний путь: отдельная проверка пересечений и отдельная вставка.
+
+    Args:
+        reservation (ReservationCreate): Бронирование.
+        session (AsyncSession): Асинхронная сессия БД.
+        user (SimpleNamespace): Пользователь.
+
+    Returns:
+        bool: True, если бронирование создано.
+    """
+    if await reservation_crud.has_reservations_at_the_same_time(
+        **reservation.dict(), session=session
+    ):
+        return False
+    await reservation_crud.create(reservation, session, user)
+    return True
+
+
+async def insert_if_free(
+    reservation: ReservationCreate,
+    session: AsyncSession,
+    user: SimpleNamespace,
+) -> bool:
+    """
+    Атомарный путь create_if_free.
+
+    Args:
+        reservation (ReservationCreate): Бронирование.
+        session (AsyncSession): Асинхронная сессия БД.
+        user (SimpleNamespace): Пользователь.
+
+    Returns:
+        bool: True, если бронирование создано.
+    """
+    return await reservation_crud.create_if_free(
+        reservation, session, user
+    ) is not None
+
+
+async def count_double_bookings(session: AsyncSession) -> int:
+    """
+    Посчитать пары пересекающихся бронирований одной комнаты.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД.
+
+    Returns:
+        int: Количество пар.
+    """
+    other = aliased(Reservation)
+    result = await session.execute(
+        select(func.count()).select_from(Reservation).join(
+            other,
+            and_(
+                other.meetingroom_id == Reservation.meetingroom_id,
+                other.id > Reservation.id,
+                other.from_reserve < Reservation.to_reserve,
+                other.to_reserve > Reservation.from_reserve,
+            )
+        )
+    )
+    return result.scalar()
+
+
+async def run(name: str, create, args: argparse.Namespace) -> dict:
+    """
+    Запустить конкурентных писателей на отдельной базе.
+
+    Args:
+        name (str): Имя сценария и базы.
+        create: Функция создания бронирования.
+        args (argparse.Namespace): Параметры теста.
+
+    Returns:
+        dict: Созданные и отклонённые бронирования, ошибки, двойные
+            бронирования, пропускная способность и задержки.
+    """
+    path = database_path(name)
+    sync_engine = create_sync_engine(path)
+    with sync_engine.begin() as connection:
+        seed(connection, ROOMS, 1, 0, start=datetime.now())
+    sync_engine.dispose()
+    engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    session_factory = sessionmaker(engine, class_=AsyncSession)
+    user = SimpleNamespace(id=1)
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    stats = {'created': 0, 'rejected': 0, 'errors': 0, 'timings': []}
+
+    async def worker() -> None:
+        for _ in range(args.attempts):
+            slot = random.randrange(SLOTS)
+            from_reserve = start + timedelta(minutes=30 * slot)
+            reservation = ReservationCreate(
+                meetingroom_id=random.randint(1, ROOMS),
+                from_reserve=from_reserve,
+                to_reserve=from_reserve + timedelta(minutes=45),
+            )
+            started = time.perf_counter()
+            try:
+                async with session_factory() as session:
+                    created = await create(reservation, session, user)
+            except OperationalError:
+                stats['errors'] += 1
+                continue
+            stats['timings'].append(time.perf_counter() - started)
+            stats['created' if created else 'rejected'] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.workers)))
+    elapsed = time.perf_counter() - started
+    async with session_factory() as session:
+        double_bookings = await count_double_bookings(session)
+    await engine.dispose()
+    return {
+        'created': stats['created'],
+        'rejected': stats['rejected'],
+        'errors': stats['errors'],
+        'double_bookings': double_bookings,
+        'requests_per_s': len(stats['timings']) / elapsed,
+        'p95_ms': summarize(stats['timings'] or [0.0])['p95_ms'],
+    }
+
+
+async def main() -> None:
+    """
+    Запустить стресс-тест и завершиться с ошибкой при двойных бронированиях.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--attempts', type=int, default=50)
+    args = parser.parse_args()
+
+    results = {
+        'check then insert': await run('race_check', check_then_insert, args),
+        'create_if_free': await run('race_atomic', insert_if_free, args),
+    }
+    print_report(
+        f'{args.workers} писателей по {args.attempts} попыток, '
+        f'{ROOMS} комнаты, {SLOTS} слотов',
+        results
+    )
+    if results['create_if_free']['double_bookings']:
+        raise SystemExit('create_if_free допустил двойное бронирование')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
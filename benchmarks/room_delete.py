@@ -0,0 +1,108 @@
+"""
+Бенчмарк удаления переговорной комнаты с большой историей бронирований.
+
+Сравнивает прежнее ORM-каскадное удаление (загрузка всех бронирований
+комнаты в сессию и DELETE на каждую строку) с CRUDMeetingRoom.remove,
+который удаляет бронирования и серии комнаты запросами DELETE ... WHERE.
+
+Запуск: python -m benchmarks.room_delete --reservations 100000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import create_sync_engine, database_path, print_report, seed
+from app.core.db import create_engine
+from app.crud.meeting_room import meeting_room_crud
+from app.models import MeetingRoom, Reservation
+
+ROOMS = 2
+
+
+async def orm_cascade_remove(room: MeetingRoom, session: AsyncSession) -> None:
+    """
+    Прежний путь: ORM загружает бронирования комнаты и удаляет их по одному.
+
+    Args:
+        room (MeetingRoom): Комната.
+        session (AsyncSession): Асинхронная сессия БД.
+    """
+    reservations = await session.execute(
+        select(Reservation).where(Reservation.meetingroom_id == room.id)
+    )
+    for reservation in reservations.scalars():
+        await session.delete(reservation)
+    await session.delete(room)
+    await session.commit()
+
+
+async def run(name: str, remove, reservations: int) -> dict:
+    """
+    Удалить комнату с заданным количеством бронирований.
+
+    Args:
+        name (str): Имя сценария и базы.
+        remove: Корутина удаления (room, session).
+        reservations (int): Количество бронирований комнаты.
+
+    Returns:
+        dict: Время удаления и количество оставшихся бронирований.
+    """
+    path = database_path(name)
+    sync_engine = create_sync_engine(path)
+    with sync_engine.begin() as connection:
+        seed(
+            connection, ROOMS, 10, reservations,
+            start=datetime.now() - timedelta(days=3650)
+        )
+    sync_engine.dispose()
+    engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    session_factory = sessionmaker(engine, class_=AsyncSession)
+    async with session_factory() as session:
+        room = await session.get(MeetingRoom, 1)
+        started = time.perf_counter()
+        await remove(room, session)
+        elapsed = time.perf_counter() - started
+        left = await session.execute(
+            select(Reservation.meetingroom_id, func.count()).group_by(
+                Reservation.meetingroom_id
+            )
+        )
+        left = dict(left.all())
+    await engine.dispose()
+    return {
+        'seconds': elapsed,
+        'left_in_room': left.get(1, 0),
+        'left_in_other_room': left.get(2, 0),
+    }
+
+
+async def main() -> None:
+    """
+    Запустить бенчмарк удаления комнаты.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--reservations', type=int, default=100000)
+    args = parser.parse_args()
+
+    results = {
+        'ORM cascade': await run(
+            'room_delete_orm', orm_cascade_remove, args.reservations
+        ),
+        'bulk DELETE': await run(
+            'room_delete_bulk', meeting_room_crud.remove, args.reservations
+        ),
+    }
+    print_report(
+        f'Удаление комнаты с {args.reservations} бронированиями', results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Бенчмарк масштабирования записей с блокировками по комнатам.
+
+Конкурентные задачи выполняют «проверку пересечений, затем вставку» под
+KeyedLockManager, распределяя записи по разному числу комнат. Записи в одну
+комнату сериализуются, в разные — идут параллельно, поэтому пропускная
+способность растёт с числом комнат. Параметр --io-latency-ms добавляет
+задержку внутри критической секции, имитируя сетевую СУБД.
+
+Запуск: python -m benchmarks.room_locks --workers 32 --operations 1600
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import create_sync_engine, database_path, print_report, seed
+from app.core.db import create_engine
+from app.core.locks import KeyedLockManager
+from app.crud.reservation import reservation_crud
+from app.schemas.reservation import ReservationCreate
+
+ROOM_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+async def run(rooms: int, args: argparse.Namespace) -> dict:
+    """
+    Выполнить записи, распределённые по заданному числу комнат.
+
+    Args:
+        rooms (int): Количество комнат.
+        args (argparse.Namespace): Параметры бенчмарка.
+
+    Returns:
+        dict: Пропускная способность и метрики блокировок.
+    """
+    path = database_path(f'room_locks_{rooms}')
+    sync_engine = create_sync_engine(path)
+    with sync_engine.begin() as connection:
+        seed(connection, rooms, 1, 0, start=datetime.now())
+    sync_engine.dispose()
+    engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    session_factory = sessionmaker(engine, class_=AsyncSession)
+    locks = KeyedLockManager()
+    user = SimpleNamespace(id=1)
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    operations = iter(range(args.operations))
+
+    async def worker() -> None:
+        for number in operations:
+            from_reserve = start + timedelta(hours=number)
+            reservation = ReservationCreate(
+                meetingroom_id=number % rooms + 1,
+                from_reserve=from_reserve,
+                to_reserve=from_reserve + timedelta(minutes=30),
+            )
+            async with locks.hold(reservation.meetingroom_id):
+                async with session_factory() as session:
+                    if await reservation_crud.has_reservations_at_the_same_time(
+                        **reservation.dict(), session=session
+                    ):
+                        continue
+                    await asyncio.sleep(args.io_latency_ms / 1000)
+                    await reservation_crud.create(reservation, session, user)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.workers)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    stats = locks.stats()
+    return {
+        'writes_per_s': args.operations / elapsed,
+        'wait_mean_ms': stats['wait_seconds_total'] / stats['acquisitions'] * 1000,
+        'wait_max_ms': stats['wait_seconds_max'] * 1000,
+        'queue_depth_max': stats['queue_depth_max'],
+        'contended': stats['contended'],
+    }
+
+
+async def main() -> None:
+    """
+    Запустить бенчмарк для разного числа комнат.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--operations', type=int, default=1600)
+    parser.add_argument('--io-latency-ms', type=float, default=2)
+    args = parser.parse_args()
+
+    results = {
+        f'{rooms} комнат': await run(rooms, args) for rooms in ROOM_COUNTS
+    }
+    print_report(
+        f'{args.workers} писателей, {args.operations} записей, '
+        f'задержка {args.io_latency_ms} мс',
+        results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,161 @@
+"""
+Бенчмарк сериализации больших списков бронирований.
+
+Сравнивает прежний путь FastAPI (ORM-объекты, валидация ReservationDB
+в orm_mode, jsonable_encoder и json.dumps) с быстрым путём (строки столбцов,
+словари без валидации и orjson) на ответе из 10 000 бронирований.
+Время выборки из БД и сериализации замеряется отдельно.
+
+Запуск: python -m benchmarks.serialization --rows 10000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.db import create_engine
+from app.core.serialization import json_response, trusted_items
+from app.crud.reservation import reservation_crud
+from app.models import Reservation
+from app.schemas.reservation import RESERVATION_PUBLIC_EXCLUDE, ReservationDB
+
+RESPONSE_FIELD = create_response_field(
+    name='response', type_=list[ReservationDB]
+)
+
+
+async def orm_query(session: AsyncSession, rows: int) -> list:
+    """
+    Выбрать бронирования ORM-объектами.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД.
+        rows (int): Количество бронирований.
+
+    Returns:
+        list: ORM-объекты Reservation.
+    """
+    result = await session.execute(
+        select(Reservation).order_by(Reservation.id).limit(rows)
+    )
+    return result.scalars().all()
+
+
+async def orm_serialize(reservations: list) -> bytes:
+    """
+    Сериализовать ответ так, как FastAPI делает это для response_model.
+
+    Args:
+        reservations (list): ORM-объекты Reservation.
+
+    Returns:
+        bytes: Тело ответа.
+    """
+    content = await serialize_response(
+        field=RESPONSE_FIELD,
+        response_content=reservations,
+        exclude=RESERVATION_PUBLIC_EXCLUDE,
+    )
+    return JSONResponse(content).body
+
+
+async def rows_query(session: AsyncSession, rows: int) -> list:
+    """
+    Выбрать бронирования строками столбцов.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД.
+        rows (int): Количество бронирований.
+
+    Returns:
+        list: Строки Row.
+    """
+    return await reservation_crud.get_multi(session, limit=rows, as_rows=True)
+
+
+async def rows_serialize(reservations: list) -> bytes:
+    """
+    Сериализовать ответ быстрым путём.
+
+    Args:
+        reservations (list): Строки Row.
+
+    Returns:
+        bytes: Тело ответа.
+    """
+    return json_response(trusted_items(
+        ReservationDB, reservations, exclude=RESERVATION_PUBLIC_EXCLUDE
+    )).body
+
+
+async def run(session_factory, query, serialize, args) -> dict:
+    """
+    Замерить выборку и сериализацию ответа.
+
+    Args:
+        session_factory: Фабрика асинхронных сессий.
+        query: Корутина выборки (session, rows).
+        serialize: Корутина сериализации списка в байты.
+        args (argparse.Namespace): Параметры бенчмарка.
+
+    Returns:
+        dict: Медианы времени выборки, сериализации и всего ответа, размер тела.
+    """
+    query_timings, serialize_timings, total_timings = [], [], []
+    for _ in range(args.repeat):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            reservations = await query(session, args.rows)
+            queried = time.perf_counter()
+            body = await serialize(reservations)
+            finished = time.perf_counter()
+        query_timings.append(queried - started)
+        serialize_timings.append(finished - queried)
+        total_timings.append(finished - started)
+    return {
+        'query_ms': summarize(query_timings)['p50_ms'],
+        'serialize_ms': summarize(serialize_timings)['p50_ms'],
+        'total_ms': summarize(total_timings)['p50_ms'],
+        'bytes': len(body),
+    }
+
+
+async def main() -> None:
+    """
+    Сравнить прежнюю и быструю сериализацию списка бронирований.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    path = database_path('serialization')
+    sync_engine = create_sync_engine(path)
+    with sync_engine.begin() as connection:
+        seed(connection, 1, 10, args.rows, start=datetime.now())
+    sync_engine.dispose()
+    engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    session_factory = sessionmaker(engine, class_=AsyncSession)
+
+    orm = await run(session_factory, orm_query, orm_serialize, args)
+    fast = await run(session_factory, rows_query, rows_serialize, args)
+    await engine.dispose()
+    print_report(
+        f'Ответ из {args.rows} бронирований, медиана {args.repeat} повторов',
+        {'ORM + Pydantic + json': orm, 'строки + orjson': fast},
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
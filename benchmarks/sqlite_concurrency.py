@@ -0,0 +1,160 @@
+"""
+Бенчмарк конкурентных чтений и записей SQLite.
+
+Сравнивает движок по умолчанию (create_async_engine без параметров: NullPool,
+журнал отката) с движком приложения (пул соединений и PRAGMA из настроек).
+
+Запуск: python -m benchmarks.sqlite_concurrency --readers 16 --writers 4 --duration 5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from benchmarks.common import (
+    create_sync_engine, database_path, print_report, seed, summarize
+)
+from app.core.db import create_engine
+from app.models import Reservation
+
+ROOMS = 50
+
+
+async def reader(engine: AsyncEngine, deadline: float, stats: dict) -> None:
+    """
+    Читать количество бронирований случайной комнаты до истечения времени.
+
+    Args:
+        engine (AsyncEngine): Движок.
+        deadline (float): Момент окончания по time.perf_counter().
+        stats (dict): Накопитель результатов.
+    """
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(
+                    select(func.count()).select_from(Reservation).where(
+                        Reservation.meetingroom_id == random.randint(1, ROOMS)
+                    )
+                )
+        except OperationalError:
+            stats['errors'] += 1
+            continue
+        stats['reads'].append(time.perf_counter() - started)
+
+
+async def writer(
+    engine: AsyncEngine,
+    deadline: float,
+    stats: dict,
+    start: datetime,
+) -> None:
+    """
+    Вставлять бронирования по одному в отдельной транзакции до истечения времени.
+
+    Args:
+        engine (AsyncEngine): Движок.
+        deadline (float): Момент окончания по time.perf_counter().
+        stats (dict): Накопитель результатов.
+        start (datetime): Время, после которого создаются бронирования.
+    """
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        from_reserve = start + timedelta(minutes=random.randint(0, 10 ** 6))
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    insert(Reservation).values(
+                        meetingroom_id=random.randint(1, ROOMS),
+                        user_id=1,
+                        from_reserve=from_reserve,
+                        to_reserve=from_reserve + timedelta(minutes=30),
+                    )
+                )
+        except OperationalError:
+            stats['errors'] += 1
+            continue
+        stats['writes'].append(time.perf_counter() - started)
+
+
+async def run(engine: AsyncEngine, args: argparse.Namespace) -> dict:
+    """
+    Запустить читателей и писателей на одном движке.
+
+    Args:
+        engine (AsyncEngine): Движок.
+        args (argparse.Namespace): Параметры бенчмарка.
+
+    Returns:
+        dict: Пропускная способность, задержки и количество ошибок.
+    """
+    stats = {'reads': [], 'writes': [], 'errors': 0}
+    deadline = time.perf_counter() + args.duration
+    start = datetime.now() + timedelta(days=365)
+    await asyncio.gather(
+        *(reader(engine, deadline, stats) for _ in range(args.readers)),
+        *(writer(engine, deadline, stats, start) for _ in range(args.writers)),
+    )
+    await engine.dispose()
+    return {
+        'reads_per_s': len(stats['reads']) / args.duration,
+        'writes_per_s': len(stats['writes']) / args.duration,
+        'read_p95_ms': summarize(stats['reads'] or [0.0])['p95_ms'],
+        'write_p95_ms': summarize(stats['writes'] or [0.0])['p95_ms'],
+        'errors': stats['errors'],
+    }
+
+
+def prepare(name: str, per_room: int) -> str:
+    """
+    Создать и наполнить отдельную базу для сценария.
+
+    Args:
+        name (str): Имя базы.
+        per_room (int): Количество бронирований на комнату.
+
+    Returns:
+        str: Строка подключения aiosqlite к базе.
+    """
+    path = database_path(name)
+    engine = create_sync_engine(path)
+    with engine.begin() as connection:
+        seed(connection, ROOMS, 10, per_room, start=datetime.now())
+    engine.dispose()
+    return f'sqlite+aiosqlite:///{path}'
+
+
+async def main() -> None:
+    """
+    Запустить бенчмарк конкурентного доступа.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=16)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--per-room', type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {
+        'default engine': await run(
+            create_async_engine(prepare('sqlite_default', args.per_room)), args
+        ),
+        'tuned engine': await run(
+            create_engine(prepare('sqlite_tuned', args.per_room)), args
+        ),
+    }
+    print_report(
+        f'{args.readers} читателей, {args.writers} писателей, {args.duration} с',
+        results
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
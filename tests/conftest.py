@@ -0,0 +1,222 @@
+"""
+Общие фикстуры тестов: временная SQLite-база и HTTP-клиент приложения.
+
+Модуль подменяет DATABASE_URL на временную базу до импорта модулей
+приложения, поэтому тесты не трогают fastapi.db.
+"""
+
+import asyncio
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix='room_reservation_test_')
+DATABASE_PATH = os.path.join(TEST_DIR, 'app.db')
+os.environ['DATABASE_URL'] = f'sqlite+aiosqlite:///{DATABASE_PATH}'
+
+from datetime import datetime, timedelta  # noqa: E402
+from typing import AsyncIterator  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import (  # noqa: E402
+    and_, create_engine, func, select, text, update
+)
+from sqlalchemy.orm import aliased  # noqa: E402
+
+from app.core.base import Base  # noqa: E402
+from app.core.db import AsyncSessionLocal, engine  # noqa: E402
+from app.core.user import token_revocations, user_cache  # noqa: E402
+from app.crud.interval_index import reservation_index  # noqa: E402
+from app.crud.room_catalog import room_catalog  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Reservation, User  # noqa: E402
+
+TEST_PASSWORD = 'test-password'
+POOL_WARMUP_CONNECTIONS = 8
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """
+    Асинхронные тесты выполняются только в asyncio.
+    """
+    return 'asyncio'
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    """
+    Пустая база со схемой приложения и сброшенные in-memory индексы и кэши.
+    """
+    sync_engine = create_engine(f'sqlite:///{DATABASE_PATH}', future=True)
+    Base.metadata.drop_all(sync_engine)
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+    reservation_index.clear()
+    room_catalog.invalidate()
+    user_cache.clear()
+    token_revocations.versions.clear()
+    token_revocations.changed_at.clear()
+    yield
+    reservation_index.clear()
+    room_catalog.invalidate()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(database) -> AsyncIterator:
+    """
+    Асинхронная сессия тестовой базы.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+async def client(database) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    HTTP-клиент, вызывающий приложение напрямую через ASGI.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def count_double_bookings() -> int:
+    """
+    Посчитать пары пересекающихся бронирований одной комнаты.
+    """
+    other = aliased(Reservation)
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(func.count()).select_from(Reservation).join(
+                other,
+                and_(
+                    other.meetingroom_id == Reservation.meetingroom_id,
+                    other.id > Reservation.id,
+                    other.from_reserve < Reservation.to_reserve,
+                    other.to_reserve > Reservation.from_reserve,
+                )
+            )
+        )
+    return result.scalar()
+
+
+@pytest.fixture
+async def warm_pool(database) -> None:
+    """
+    Открыть соединения пула заранее.
+
+    Первые соединения открываются по очереди, и запросы, ждущие их,
+    выполнились бы последовательно, не конкурируя друг с другом.
+    """
+    async def checkout() -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(text('SELECT 1'))
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(checkout() for _ in range(POOL_WARMUP_CONNECTIONS)))
+
+
+@pytest.fixture
+def tomorrow() -> datetime:
+    """
+    Начало завтрашнего дня (бронировать можно только будущее время).
+    """
+    return datetime.now().replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ) + timedelta(days=1)
+
+
+def reservation_json(
+    room_id: int,
+    from_reserve: datetime,
+    to_reserve: datetime,
+    **fields,
+) -> dict:
+    """
+    Тело запроса на создание бронирования.
+
+    Args:
+        room_id (int): ID комнаты.
+        from_reserve (datetime): Начало бронирования.
+        to_reserve (datetime): Окончание бронирования.
+        **fields: Дополнительные поля (например, recurrence).
+
+    Returns:
+        dict: JSON-тело запроса.
+    """
+    return {
+        'meetingroom_id': room_id,
+        'from_reserve': from_reserve.isoformat(),
+        'to_reserve': to_reserve.isoformat(),
+        **fields,
+    }
+
+
+async def create_room(name: str = 'Room') -> int:
+    """
+    Создать переговорную комнату напрямую в БД.
+
+    Args:
+        name (str): Имя комнаты.
+
+    Returns:
+        int: ID комнаты.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            Base.metadata.tables['meetingroom'].insert().values(name=name)
+        )
+        await session.commit()
+    room_catalog.invalidate()
+    return result.inserted_primary_key[0]
+
+
+async def auth_headers(
+    client: httpx.AsyncClient,
+    email: str = 'user@example.com',
+) -> dict[str, str]:
+    """
+    Зарегистрировать пользователя и получить заголовок с его токеном.
+
+    Args:
+        client (httpx.AsyncClient): Клиент приложения.
+        email (str): Email пользователя.
+
+    Returns:
+        dict[str, str]: Заголовок Authorization.
+    """
+    response = await client.post(
+        '/auth/register', json={'email': email, 'password': TEST_PASSWORD}
+    )
+    response.raise_for_status()
+    response = await client.post(
+        '/auth/jwt/login', data={'username': email, 'password': TEST_PASSWORD}
+    )
+    response.raise_for_status()
+    return {'Authorization': f'Bearer {response.json()["access_token"]}'}
+
+
+async def superuser_headers(
+    client: httpx.AsyncClient,
+    email: str = 'admin@example.com',
+) -> dict[str, str]:
+    """
+    Зарегистрировать суперпользователя и получить заголовок с его токеном.
+
+    Args:
+        client (httpx.AsyncClient): Клиент приложения.
+        email (str): Email суперпользователя.
+
+    Returns:
+        dict[str, str]: Заголовок Authorization.
+    """
+    headers = await auth_headers(client, email)
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.email == email).values(is_superuser=True)
+        )
+        await session.commit()
+    return headers
@@ -0,0 +1,120 @@
+"""
+Тесты входа пользователя: сессия запроса, обновление хэша пароля
+и отзыв токенов.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.constants import JWTConstants
+from app.core.user import UserManager, token_revocations
+from app.models import MeetingRoom, User
+from tests.conftest import TEST_PASSWORD, auth_headers, create_room
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = 'user@example.com'
+
+
+def credentials(password: str = TEST_PASSWORD) -> OAuth2PasswordRequestForm:
+    """
+    Форма входа тестового пользователя.
+    """
+    return OAuth2PasswordRequestForm(
+        username=EMAIL, password=password, scope=''
+    )
+
+
+async def test_authenticate_keeps_request_session(client, session):
+    await auth_headers(client, EMAIL)
+    room = await session.get(MeetingRoom, await create_room())
+    manager = UserManager(SQLAlchemyUserDatabase(session, User))
+
+    user = await manager.authenticate(credentials())
+
+    assert user is not None and user.email == EMAIL
+    assert room in session
+    assert user not in session
+    assert await manager.authenticate(credentials('wrong-password')) is None
+
+
+async def test_authenticate_saves_updated_hash(client, session, monkeypatch):
+    await auth_headers(client, EMAIL)
+    manager = UserManager(SQLAlchemyUserDatabase(session, User))
+    new_hash = await manager.password_hasher.hash(TEST_PASSWORD)
+
+    async def verify_and_update(plain_password, hashed_password):
+        return True, new_hash
+
+    monkeypatch.setattr(
+        manager.password_hasher, 'verify_and_update', verify_and_update
+    )
+    user = await manager.authenticate(credentials())
+
+    assert user.hashed_password == new_hash
+    stored = await session.scalar(
+        select(User.hashed_password).where(User.email == EMAIL)
+    )
+    assert stored == new_hash
+
+
+async def change_password(client, headers) -> int:
+    """
+    Сменить пароль текущего пользователя и проверить старый токен.
+
+    Returns:
+        int: Код ответа на запрос со старым токеном.
+    """
+    response = await client.patch(
+        '/users/me', headers=headers, json={'password': 'new-password'}
+    )
+    response.raise_for_status()
+    response = await client.get('/users/me', headers=headers)
+    return response.status_code
+
+
+async def test_password_change_keeps_tokens_by_default(client):
+    headers = await auth_headers(client, EMAIL)
+
+    assert await change_password(client, headers) == 200
+
+
+async def test_password_change_revokes_tokens_with_claims(client, monkeypatch):
+    monkeypatch.setattr(settings, 'jwt_claims_enabled', True)
+    headers = await auth_headers(client, EMAIL)
+
+    assert await change_password(client, headers) == 401
+
+
+async def test_refresh_loads_only_bumps_within_token_lifetime(
+    client, session, monkeypatch
+):
+    monkeypatch.setattr(settings, 'jwt_claims_enabled', True)
+    headers = await auth_headers(client, EMAIL)
+    await change_password(client, headers)
+    user_id = (await session.execute(
+        select(User.id).where(User.email == EMAIL)
+    )).scalar_one()
+    token_revocations.versions.clear()
+    token_revocations.changed_at.clear()
+
+    await token_revocations.refresh()
+    assert token_revocations.versions == {user_id: 1}
+
+    expired = datetime.now() - timedelta(
+        seconds=JWTConstants.LIFETIME_SECONDS + 1
+    )
+    await session.execute(
+        update(User).where(User.id == user_id).values(
+            token_version_changed_at=expired
+        )
+    )
+    await session.commit()
+    token_revocations.changed_at[user_id] = expired
+    await token_revocations.refresh()
+    assert token_revocations.versions == {}
@@ -0,0 +1,85 @@
+"""
+Тесты поиска свободных промежутков и бронирования найденных промежутков.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import settings
+from tests.conftest import auth_headers, create_room, reservation_json
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize('index_enabled', [False, True])
+async def test_returned_free_interval_can_be_booked(
+    client, monkeypatch, tomorrow, index_enabled
+):
+    monkeypatch.setattr(settings, 'reservation_index_enabled', index_enabled)
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    hour = timedelta(hours=1)
+    for start in (10, 13):
+        response = await client.post(
+            '/reservations/',
+            json=reservation_json(
+                room_id, tomorrow + start * hour, tomorrow + (start + 1) * hour
+            ),
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+
+    response = await client.get('/meeting_rooms/availability', params={
+        'from': (tomorrow + 9 * hour).isoformat(),
+        'to': (tomorrow + 18 * hour).isoformat(),
+        'duration': 60,
+    })
+    assert response.status_code == 200, response.text
+    [room] = response.json()
+    free_intervals = room['free_intervals']
+    assert [interval['start'][11:16] for interval in free_intervals] == [
+        '09:00', '11:00', '14:00'
+    ]
+
+    for interval in free_intervals:
+        response = await client.post(
+            '/reservations/',
+            json={
+                'meetingroom_id': room_id,
+                'from_reserve': interval['start'],
+                'to_reserve': interval['end'],
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id,
+            tomorrow + 10 * hour + timedelta(minutes=59),
+            tomorrow + 11 * hour + timedelta(minutes=1),
+        ),
+        headers=headers,
+    )
+    assert response.status_code == 422
+
+
+async def test_batch_accepts_touching_reservations(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    hour = timedelta(hours=1)
+    response = await client.post(
+        '/reservations/batch',
+        json=[
+            reservation_json(room_id, tomorrow + 10 * hour, tomorrow + 11 * hour),
+            reservation_json(room_id, tomorrow + 11 * hour, tomorrow + 12 * hour),
+            reservation_json(room_id, tomorrow + 11 * hour, tomorrow + 13 * hour),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert [item['status'] for item in response.json()] == [
+        'created', 'created', 'conflict'
+    ]
@@ -0,0 +1,143 @@
+"""
+Тесты пакетного создания бронирований POST /reservations/batch.
+"""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.db import AsyncSessionLocal
+from app.crud.meeting_room import meeting_room_crud
+from app.crud.reservation import INSERT_CHUNK_SIZE, reservation_crud
+from app.models import MeetingRoom, Reservation
+from app.schemas.reservation import ReservationCreate
+from tests.conftest import (
+    auth_headers, count_double_bookings, create_room, reservation_json
+)
+
+pytestmark = pytest.mark.anyio
+ROUNDS = 10
+
+
+async def test_batch_reports_created_conflict_and_missing_room(
+    client, tomorrow
+):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    other_room_id = await create_room('Other')
+    response = await client.post(
+        '/reservations/',
+        headers=headers,
+        json=reservation_json(
+            room_id, tomorrow.replace(hour=9), tomorrow.replace(hour=10)
+        ),
+    )
+    response.raise_for_status()
+    batch = [
+        reservation_json(
+            room_id, tomorrow.replace(hour=10), tomorrow.replace(hour=11)
+        ),
+        reservation_json(
+            room_id, tomorrow.replace(hour=9), tomorrow.replace(hour=11)
+        ),
+        reservation_json(
+            other_room_id, tomorrow.replace(hour=9), tomorrow.replace(hour=10)
+        ),
+        reservation_json(
+            other_room_id, tomorrow.replace(hour=9, minute=30),
+            tomorrow.replace(hour=12),
+        ),
+        reservation_json(
+            other_room_id + 1, tomorrow.replace(hour=9),
+            tomorrow.replace(hour=10),
+        ),
+    ]
+
+    response = await client.post(
+        '/reservations/batch', headers=headers, json=batch
+    )
+
+    assert response.status_code == 200
+    items = response.json()
+    assert [item['index'] for item in items] == list(range(len(batch)))
+    assert [item['status'] for item in items] == [
+        'created', 'conflict', 'created', 'conflict', 'room_not_found'
+    ]
+    for item, body in zip(items, batch):
+        if item['status'] == 'created':
+            reservation = item['reservation']
+            assert reservation['meetingroom_id'] == body['meetingroom_id']
+            assert reservation['from_reserve'] == body['from_reserve']
+            assert reservation['to_reserve'] == body['to_reserve']
+        else:
+            assert item['reservation'] is None
+    async with AsyncSessionLocal() as session:
+        assert await session.scalar(
+            select(func.count()).select_from(Reservation)
+        ) == 3
+
+
+async def test_batch_returns_ids_of_its_rows(session, tomorrow):
+    room_id = await create_room()
+    count = 2 * INSERT_CHUNK_SIZE + 1
+    reservations = [
+        ReservationCreate(
+            meetingroom_id=room_id,
+            from_reserve=tomorrow + timedelta(hours=2 * number),
+            to_reserve=tomorrow + timedelta(hours=2 * number + 1),
+        )
+        for number in reversed(range(count))
+    ]
+
+    results = await reservation_crud.create_batch(
+        reservations, session, SimpleNamespace(id=1)
+    )
+
+    rows = await session.execute(
+        select(Reservation.id, Reservation.from_reserve)
+    )
+    stored = dict(rows.all())
+    assert len(stored) == count
+    for reservation, (status, db_obj) in zip(reservations, results):
+        assert status == 'created'
+        assert stored[db_obj.id] == reservation.from_reserve
+
+
+async def test_batch_does_not_book_room_deleted_concurrently(
+    warm_pool, tomorrow
+):
+    for _ in range(ROUNDS):
+        room_id = await create_room(f'Room {_}')
+        reservations = [
+            ReservationCreate(
+                meetingroom_id=room_id,
+                from_reserve=tomorrow + timedelta(hours=hour),
+                to_reserve=tomorrow + timedelta(hours=hour + 1),
+            )
+            for hour in range(3)
+        ]
+
+        async def create_batch():
+            async with AsyncSessionLocal() as session:
+                await reservation_crud.create_batch(
+                    reservations, session, SimpleNamespace(id=1)
+                )
+
+        async def remove_room():
+            async with AsyncSessionLocal() as session:
+                room = await session.get(MeetingRoom, room_id)
+                await meeting_room_crud.remove(room, session)
+
+        await asyncio.gather(create_batch(), remove_room())
+
+    async with AsyncSessionLocal() as session:
+        orphans = await session.scalar(
+            select(func.count()).select_from(Reservation).where(
+                ~Reservation.meetingroom_id.in_(select(MeetingRoom.id))
+            )
+        )
+    assert orphans == 0
+    assert await count_double_bookings() == 0
@@ -0,0 +1,209 @@
+"""
+Тесты конкурентных записей бронирований в один и тот же интервал.
+
+Запросы выполняются одновременно через asyncio.gather: из конкурирующих
+за интервал записей должна пройти ровно одна, двойных бронирований в БД
+быть не должно. Блокировки room_locks сериализуют только записи в одну
+комнату.
+"""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.db import AsyncSessionLocal
+from app.core.locks import KeyedLockManager
+from app.crud.reservation import reservation_crud
+from app.schemas.reservation import ReservationCreate
+from tests.conftest import (
+    auth_headers, count_double_bookings, create_room, reservation_json
+)
+
+pytestmark = pytest.mark.anyio
+WRITERS = 8
+HOLD_SECONDS = 0.05
+
+
+class ConcurrencyProbe:
+    """
+    Счётчик одновременно выполняющихся участков кода.
+    """
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def enter(self) -> None:
+        """
+        Отметить вход в участок и задержаться в нём, давая другим
+        задачам шанс войти параллельно.
+        """
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(HOLD_SECONDS)
+        self.active -= 1
+
+
+async def test_create_if_free_creates_one_of_concurrent(warm_pool, tomorrow):
+    room_id = await create_room()
+    reservation = ReservationCreate(
+        meetingroom_id=room_id,
+        from_reserve=tomorrow + timedelta(hours=10),
+        to_reserve=tomorrow + timedelta(hours=11),
+    )
+
+    async def create():
+        async with AsyncSessionLocal() as session:
+            return await reservation_crud.create_if_free(
+                reservation, session, SimpleNamespace(id=1)
+            )
+
+    created = await asyncio.gather(*(create() for _ in range(WRITERS)))
+
+    assert sum(db_obj is not None for db_obj in created) == 1
+    assert await count_double_bookings() == 0
+
+
+async def test_concurrent_creates_of_one_slot(client, warm_pool, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    body = reservation_json(
+        room_id, tomorrow + timedelta(hours=10), tomorrow + timedelta(hours=11)
+    )
+
+    responses = await asyncio.gather(*(
+        client.post('/reservations/', json=body, headers=headers)
+        for _ in range(2)
+    ))
+
+    assert sorted(response.status_code for response in responses) == [200, 422]
+    assert await count_double_bookings() == 0
+
+
+async def test_concurrent_series_of_one_slot(client, warm_pool, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    recurrence = {'frequency': 'daily', 'count': 5}
+
+    responses = await asyncio.gather(*(
+        client.post(
+            '/reservations/',
+            json=reservation_json(
+                room_id,
+                tomorrow + timedelta(hours=10, minutes=15 * offset),
+                tomorrow + timedelta(hours=11, minutes=15 * offset),
+                recurrence=recurrence,
+            ),
+            headers=headers,
+        )
+        for offset in range(2)
+    ))
+
+    assert sorted(response.status_code for response in responses) == [200, 422]
+    assert await count_double_bookings() == 0
+
+
+async def test_concurrent_updates_to_one_slot(client, warm_pool, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    reservation_ids = []
+    for hour in (8, 9):
+        response = await client.post(
+            '/reservations/',
+            json=reservation_json(
+                room_id,
+                tomorrow + timedelta(hours=hour),
+                tomorrow + timedelta(hours=hour, minutes=30),
+            ),
+            headers=headers,
+        )
+        reservation_ids.append(response.json()['id'])
+    body = {
+        'from_reserve': (tomorrow + timedelta(hours=10)).isoformat(),
+        'to_reserve': (tomorrow + timedelta(hours=11)).isoformat(),
+    }
+
+    responses = await asyncio.gather(*(
+        client.patch(
+            f'/reservations/{reservation_id}', json=body, headers=headers
+        )
+        for reservation_id in reservation_ids
+    ))
+
+    assert sorted(response.status_code for response in responses) == [200, 422]
+    assert await count_double_bookings() == 0
+
+
+@pytest.mark.parametrize('same_room, max_active', [
+    (True, 1),
+    (False, WRITERS),
+])
+async def test_room_locks_serialize_only_one_room(same_room, max_active):
+    locks = KeyedLockManager()
+    probe = ConcurrencyProbe()
+
+    async def write(room_id: int) -> None:
+        async with locks.hold(room_id):
+            await probe.enter()
+
+    await asyncio.gather(*(
+        write(1 if same_room else room_id) for room_id in range(WRITERS)
+    ))
+
+    assert probe.max_active == max_active
+    assert locks.stats()['contended'] == (WRITERS - 1 if same_room else 0)
+    assert locks.stats()['queue_depth'] == 0
+
+
+async def test_room_locks_with_overlapping_keys_do_not_deadlock():
+    locks = KeyedLockManager()
+    probe = ConcurrencyProbe()
+
+    async def write(*room_ids: int) -> None:
+        async with locks.hold(*room_ids):
+            await probe.enter()
+
+    await asyncio.wait_for(asyncio.gather(
+        write(1, 2), write(2, 1), write(2, 3), write(3, 1)
+    ), timeout=1)
+
+    assert probe.max_active == 1
+
+
+@pytest.mark.parametrize('same_room, max_active', [
+    (True, 1),
+    (False, WRITERS),
+])
+async def test_reservation_writes_lock_only_their_room(
+    client, warm_pool, tomorrow, monkeypatch, same_room, max_active
+):
+    headers = await auth_headers(client)
+    room_ids = [await create_room(f'Room {number}') for number in range(WRITERS)]
+    probe = ConcurrencyProbe()
+    create_if_free = reservation_crud.create_if_free
+
+    async def probed_create_if_free(*args, **kwargs):
+        await probe.enter()
+        return await create_if_free(*args, **kwargs)
+
+    monkeypatch.setattr(
+        reservation_crud, 'create_if_free', probed_create_if_free
+    )
+
+    responses = await asyncio.gather(*(
+        client.post(
+            '/reservations/',
+            json=reservation_json(
+                room_ids[0] if same_room else room_id,
+                tomorrow + timedelta(hours=number),
+                tomorrow + timedelta(hours=number + 1),
+            ),
+            headers=headers,
+        )
+        for number, room_id in enumerate(room_ids)
+    ))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert probe.max_active == max_active
+    assert await count_double_bookings() == 0
@@ -0,0 +1,98 @@
+"""
+Тесты записи одним запросом INSERT/UPDATE ... RETURNING.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, event, select
+
+from app.core.db import engine
+from app.crud.meeting_room import meeting_room_crud
+from app.crud.reservation import reservation_crud
+from app.models import MeetingRoom, Reservation
+from app.schemas.meeting_room import MeetingRoomCreate, MeetingRoomUpdate
+from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from tests.conftest import create_room
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def statements():
+    """
+    SQL-запросы, выполненные движком приложения во время теста.
+    """
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(engine.sync_engine, 'before_cursor_execute', record)
+
+
+async def test_create_room_is_one_returning_insert(session, statements):
+    room = await meeting_room_crud.create(
+        MeetingRoomCreate(name='Room', description='Big'), session
+    )
+
+    [statement] = statements
+    assert statement.startswith('INSERT') and 'RETURNING' in statement
+    stored = await session.execute(
+        select(MeetingRoom.name, MeetingRoom.description)
+    )
+    assert stored.one() == ('Room', 'Big')
+    assert (room.name, room.description) == ('Room', 'Big')
+    assert room in session
+
+
+async def test_update_reservation_is_one_returning_update(
+    session, statements, tomorrow
+):
+    room_id = await create_room()
+    reservation = await reservation_crud.create(
+        ReservationCreate(
+            meetingroom_id=room_id,
+            from_reserve=tomorrow.replace(hour=9),
+            to_reserve=tomorrow.replace(hour=10),
+        ),
+        session,
+        SimpleNamespace(id=1),
+    )
+    assert reservation.from_reserve == tomorrow.replace(hour=9)
+    statements.clear()
+
+    updated = await reservation_crud.update(
+        reservation,
+        ReservationUpdate(
+            from_reserve=tomorrow.replace(hour=11),
+            to_reserve=tomorrow.replace(hour=12),
+        ),
+        session,
+    )
+
+    [statement] = statements
+    assert statement.startswith('UPDATE') and 'RETURNING' in statement
+    assert (updated.id, updated.meetingroom_id, updated.user_id) == (
+        reservation.id, room_id, 1
+    )
+    assert updated.to_reserve - updated.from_reserve == timedelta(hours=1)
+    stored = await session.execute(
+        select(Reservation.from_reserve).where(Reservation.id == updated.id)
+    )
+    assert stored.scalar() == tomorrow.replace(hour=11)
+
+
+async def test_update_of_deleted_row_returns_none(session):
+    room = await meeting_room_crud.create(MeetingRoomCreate(name='Room'), session)
+    await session.execute(delete(MeetingRoom).where(MeetingRoom.id == room.id))
+    await session.commit()
+
+    updated = await meeting_room_crud.update(
+        room, MeetingRoomUpdate(description='Gone'), session
+    )
+
+    assert updated is None
@@ -0,0 +1,71 @@
+"""
+Тесты настройки движка: PRAGMA SQLite и параметры пула соединений.
+"""
+
+import os
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.db import (
+    InstrumentedQueuePool, create_engine, engine, get_engine_options
+)
+from tests.conftest import TEST_DIR
+
+pytestmark = pytest.mark.anyio
+
+PRAGMA_VALUES = {
+    'journal_mode': 'wal',
+    'synchronous': 1,
+    'busy_timeout': 5000,
+    'cache_size': -64000,
+    'mmap_size': 268435456,
+    'temp_store': 2,
+}
+
+
+async def read_pragmas(async_engine) -> dict[str, object]:
+    """
+    Прочитать PRAGMA из нового соединения движка.
+    """
+    async with async_engine.connect() as connection:
+        return {
+            name: (await connection.exec_driver_sql(f'PRAGMA {name}')).scalar()
+            for name in PRAGMA_VALUES
+        }
+
+
+async def test_pragmas_applied_on_connect(database):
+    assert await read_pragmas(engine) == PRAGMA_VALUES
+
+
+async def test_pragmas_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'sqlite_synchronous', 'FULL')
+    monkeypatch.setattr(settings, 'sqlite_busy_timeout_ms', 1234)
+    path = os.path.join(TEST_DIR, 'pragmas.db')
+    async_engine = create_engine(f'sqlite+aiosqlite:///{path}')
+    try:
+        pragmas = await read_pragmas(async_engine)
+    finally:
+        await async_engine.dispose()
+
+    assert pragmas['synchronous'] == 2
+    assert pragmas['busy_timeout'] == 1234
+
+
+def test_file_sqlite_uses_pool_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'database_pool_size', 3)
+
+    options = get_engine_options('sqlite+aiosqlite:///file.db')
+
+    assert options['poolclass'] is InstrumentedQueuePool
+    assert options['pool_size'] == 3
+
+
+def test_file_sqlite_without_pool_size_uses_null_pool(monkeypatch):
+    monkeypatch.setattr(settings, 'database_pool_size', 0)
+
+    options = get_engine_options('sqlite+aiosqlite:///file.db')
+
+    assert options['poolclass'] is NullPool
@@ -0,0 +1,87 @@
+"""
+Тесты событий расписания: одно событие на запись и удаление комнаты.
+"""
+
+import json
+
+import pytest
+
+from app.api.constants import ScheduleEventType
+from app.core.events import schedule_events
+from tests.conftest import (
+    auth_headers, create_room, reservation_json, superuser_headers
+)
+
+pytestmark = pytest.mark.anyio
+
+SERIES_LENGTH = 2 * schedule_events.queue_size
+
+
+def parse_frame(frame: bytes) -> tuple[str, dict]:
+    """
+    Тип и данные события из фрагмента text/event-stream.
+    """
+    fields = dict(
+        line.split(': ', 1) for line in frame.decode().strip().split('\n')
+    )
+    return fields['event'], json.loads(fields['data'])
+
+
+def drain(subscriber) -> list[bytes]:
+    """
+    Забрать все фрагменты из очереди подписчика.
+    """
+    frames = []
+    while not subscriber.queue.empty():
+        frames.append(subscriber.queue.get_nowait())
+    return frames
+
+
+async def test_series_is_one_event(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    other_room_id = await create_room('Other')
+    room = schedule_events.subscribe(room_id)
+    other_room = schedule_events.subscribe(other_room_id)
+    all_rooms = schedule_events.subscribe(None)
+    try:
+        response = await client.post(
+            '/reservations/',
+            headers=headers,
+            json=reservation_json(
+                room_id,
+                tomorrow.replace(hour=9),
+                tomorrow.replace(hour=10),
+                recurrence={'frequency': 'daily', 'count': SERIES_LENGTH},
+            ),
+        )
+        assert response.status_code == 200
+
+        for subscriber in (room, all_rooms):
+            assert not subscriber.dropped
+            [frame] = drain(subscriber)
+            event_type, data = parse_frame(frame)
+            assert event_type == ScheduleEventType.RESERVATION_CREATED
+            assert len(data['reservations']) == SERIES_LENGTH
+        assert drain(other_room) == []
+    finally:
+        for subscriber in (room, other_room, all_rooms):
+            schedule_events.unsubscribe(subscriber)
+
+
+async def test_room_delete_publishes_event(client):
+    headers = await superuser_headers(client)
+    room_id = await create_room()
+    subscriber = schedule_events.subscribe(room_id)
+    try:
+        response = await client.delete(
+            f'/meeting_rooms/{room_id}', headers=headers
+        )
+        assert response.status_code == 200
+
+        [frame] = drain(subscriber)
+        assert parse_frame(frame) == (
+            ScheduleEventType.MEETING_ROOM_DELETED, {'meetingroom_id': room_id}
+        )
+    finally:
+        schedule_events.unsubscribe(subscriber)
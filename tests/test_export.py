@@ -0,0 +1,88 @@
+"""
+Тесты потоковой выгрузки бронирований в NDJSON и CSV.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from tests.conftest import create_room, reservation_json, superuser_headers
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def reservations(client, tomorrow) -> tuple[dict, list[dict]]:
+    """
+    Заголовок суперпользователя и три бронирования подряд: 9–10, 10–11, 11–12.
+    """
+    headers = await superuser_headers(client)
+    room_id = await create_room()
+    created = []
+    for hour in (9, 10, 11):
+        response = await client.post(
+            '/reservations/',
+            headers=headers,
+            json=reservation_json(
+                room_id,
+                tomorrow.replace(hour=hour),
+                tomorrow.replace(hour=hour + 1),
+            ),
+        )
+        response.raise_for_status()
+        created.append(response.json())
+    return headers, created
+
+
+async def test_ndjson_export(client, reservations):
+    headers, created = reservations
+
+    response = await client.get(
+        '/reservations/export', headers=headers, params={'format': 'ndjson'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['id'] for row in rows] == [item['id'] for item in created]
+    assert rows[0]['from_reserve'] == created[0]['from_reserve']
+    assert rows[0]['series_id'] is None
+    assert set(rows[0]) == {
+        'id', 'from_reserve', 'to_reserve', 'meetingroom_id', 'user_id',
+        'series_id',
+    }
+
+
+async def test_csv_export(client, reservations):
+    headers, created = reservations
+
+    response = await client.get(
+        '/reservations/export', headers=headers, params={'format': 'csv'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/csv')
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row['id']) for row in rows] == [item['id'] for item in created]
+    assert rows[1]['to_reserve'] == created[1]['to_reserve']
+    assert rows[1]['series_id'] == ''
+
+
+async def test_export_window_excludes_touching_reservations(
+    client, reservations, tomorrow
+):
+    headers, created = reservations
+
+    response = await client.get(
+        '/reservations/export',
+        headers=headers,
+        params={
+            'from': tomorrow.replace(hour=10).isoformat(),
+            'to': tomorrow.replace(hour=11).isoformat(),
+        },
+    )
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['id'] for row in rows] == [created[1]['id']]
@@ -0,0 +1,144 @@
+"""
+Тесты групповой фиксации записей бронирований.
+"""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.db import engine
+from app.crud.group_commit import reservation_writer
+from app.models import Reservation
+from app.schemas.reservation import ReservationCreate
+from tests.conftest import (
+    auth_headers, count_double_bookings, create_room, reservation_json
+)
+
+pytestmark = pytest.mark.anyio
+ROUNDS = 10
+
+
+@pytest.fixture
+async def group_commit(monkeypatch, warm_pool):
+    """
+    Включить групповую фиксацию и остановить писателя после теста.
+    """
+    monkeypatch.setattr(settings, 'group_commit_enabled', True)
+    yield
+    await reservation_writer.stop()
+
+
+@pytest.mark.parametrize('kind', ['series', 'batch'])
+async def test_series_and_batch_race_group_committed_creates(
+    client, group_commit, tomorrow, kind
+):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    for week in range(ROUNDS):
+        slots = [
+            (tomorrow + timedelta(weeks=week, days=day, hours=10),
+             tomorrow + timedelta(weeks=week, days=day, hours=11))
+            for day in range(5)
+        ]
+        if kind == 'series':
+            bulk = client.post(
+                '/reservations/',
+                json=reservation_json(
+                    room_id, *slots[0],
+                    recurrence={'frequency': 'daily', 'count': len(slots)},
+                ),
+                headers=headers,
+            )
+        else:
+            bulk = client.post(
+                '/reservations/batch',
+                json=[reservation_json(room_id, *slot) for slot in slots],
+                headers=headers,
+            )
+
+        responses = await asyncio.gather(bulk, *(
+            client.post(
+                '/reservations/',
+                json=reservation_json(room_id, *slot),
+                headers=headers,
+            )
+            for slot in slots
+        ))
+
+        assert all(response.status_code in (200, 422) for response in responses)
+    assert await count_double_bookings() == 0
+
+
+async def test_failed_write_does_not_fail_its_batch(
+    session, group_commit, tomorrow
+):
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [{
+        'id': 1,
+        'meetingroom_id': room_id,
+        'from_reserve': tomorrow,
+        'to_reserve': tomorrow + timedelta(hours=1),
+    }])
+    await session.commit()
+    duplicate_id = insert(Reservation).values(
+        id=1,
+        meetingroom_id=room_id,
+        from_reserve=tomorrow + timedelta(hours=5),
+        to_reserve=tomorrow + timedelta(hours=6),
+    )
+
+    async def create(hour: int):
+        return await reservation_writer.create(
+            ReservationCreate(
+                meetingroom_id=room_id,
+                from_reserve=tomorrow + timedelta(hours=hour),
+                to_reserve=tomorrow + timedelta(hours=hour + 1),
+            ),
+            session,
+            SimpleNamespace(id=1),
+        )
+
+    results = await asyncio.gather(
+        create(2),
+        reservation_writer._submit(duplicate_id, is_insert=True),
+        create(3),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], IntegrityError)
+    assert results[0] is not None and results[2] is not None
+    assert reservation_writer.stats()['failed'] == 1
+
+
+@pytest.mark.parametrize('returning', [True, False])
+async def test_group_committed_creates_return_inserted_ids(
+    session, group_commit, tomorrow, monkeypatch, returning
+):
+    monkeypatch.setattr(engine.dialect, 'full_returning', returning)
+    room_id = await create_room()
+
+    async def create(hour: int):
+        return await reservation_writer.create(
+            ReservationCreate(
+                meetingroom_id=room_id,
+                from_reserve=tomorrow + timedelta(hours=hour),
+                to_reserve=tomorrow + timedelta(hours=hour + 1),
+            ),
+            session,
+            SimpleNamespace(id=1),
+        )
+
+    created = await asyncio.gather(create(2), create(2), create(4))
+
+    assert created[1] is None
+    rows = await session.execute(
+        select(Reservation.id, Reservation.from_reserve).order_by(Reservation.id)
+    )
+    assert [(db_obj.id, db_obj.from_reserve) for db_obj in (
+        created[0], created[2]
+    )] == list(rows)
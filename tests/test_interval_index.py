@@ -0,0 +1,149 @@
+"""
+Тесты in-memory индекса интервалов бронирований.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.crud.interval_index import (
+    BookedIntervals, ReservationIntervalIndex, reservation_index
+)
+from app.crud.reservation import reservation_crud
+from app.models import Reservation
+from app.schemas.reservation import ReservationCreate
+from tests.conftest import create_room
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def index_enabled(monkeypatch) -> None:
+    """
+    Включить проверку пересечений по индексу.
+    """
+    monkeypatch.setattr(settings, 'reservation_index_enabled', True)
+
+
+def test_inconsistent_room_is_dropped(tomorrow):
+    index = ReservationIntervalIndex()
+    room_intervals = index.load(1, [(1, tomorrow, tomorrow + timedelta(hours=2))])
+    room_intervals.add(2, tomorrow + timedelta(hours=1), tomorrow + timedelta(hours=3))
+
+    assert room_intervals.overlaps(tomorrow, tomorrow) is None
+    assert index.get(1) is None
+    assert index.get(1) is None
+
+
+async def test_inconsistent_room_reloads_from_db(index_enabled, session, tomorrow):
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [{
+        'meetingroom_id': room_id,
+        'from_reserve': tomorrow,
+        'to_reserve': tomorrow + timedelta(hours=1),
+    }])
+    await session.commit()
+    check = dict(
+        meetingroom_id=room_id,
+        from_reserve=tomorrow + timedelta(hours=2),
+        to_reserve=tomorrow + timedelta(hours=3),
+        session=session,
+    )
+    assert not await reservation_crud.has_reservations_at_the_same_time(
+        **{**check, 'from_reserve': tomorrow - timedelta(hours=1),
+           'to_reserve': tomorrow}
+    )
+    reservation_index.get(room_id).add(
+        -1, tomorrow + timedelta(minutes=30), tomorrow + timedelta(hours=4)
+    )
+
+    assert not await reservation_crud.has_reservations_at_the_same_time(**check)
+    room_intervals = reservation_index.get(room_id)
+    assert room_intervals is not None and room_intervals.consistent
+    assert -1 not in room_intervals.ids
+
+
+async def test_stale_room_reloads_after_rejected_insert(
+    index_enabled, session, tomorrow
+):
+    room_id = await create_room()
+    values = dict(
+        meetingroom_id=room_id,
+        from_reserve=tomorrow + timedelta(hours=1),
+        to_reserve=tomorrow + timedelta(hours=2),
+    )
+    assert not await reservation_crud.has_reservations_at_the_same_time(
+        **values, session=session
+    )
+    # Бронирование записано в обход индекса, например другим процессом.
+    await session.execute(insert(Reservation), [{**values, 'user_id': 1}])
+    await session.commit()
+
+    assert await reservation_crud.create_if_free(
+        ReservationCreate(**values), session, SimpleNamespace(id=1)
+    ) is None
+    assert reservation_index.get(room_id) is None
+    assert await reservation_crud.has_reservations_at_the_same_time(
+        **values, session=session
+    )
+    assert reservation_index.get(room_id).ids == [1]
+
+
+async def test_index_loaded_after_reservation_end_covers_earlier_check(
+    index_enabled, session
+):
+    now = datetime.now()
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [{
+        'meetingroom_id': room_id,
+        'from_reserve': now - timedelta(hours=3),
+        'to_reserve': now - timedelta(hours=2),
+    }])
+    await session.commit()
+    # Индекс загружен проверкой после окончания бронирования.
+    assert not await reservation_crud.has_reservations_at_the_same_time(
+        meetingroom_id=room_id,
+        from_reserve=now + timedelta(hours=1),
+        to_reserve=now + timedelta(hours=2),
+        session=session,
+    )
+
+    assert await reservation_crud.has_reservations_at_the_same_time(
+        meetingroom_id=room_id,
+        from_reserve=now - timedelta(minutes=150),
+        to_reserve=now - timedelta(minutes=90),
+        session=session,
+    )
+    assert reservation_index.get(room_id).ids == [1]
+
+
+def test_room_intervals_do_not_answer_before_loaded_window(tomorrow):
+    room_intervals = ReservationIntervalIndex().load(
+        1, [(1, tomorrow + timedelta(hours=1), tomorrow + timedelta(hours=3))],
+        covers_from=tomorrow + timedelta(hours=2),
+    )
+
+    assert room_intervals.overlaps(
+        tomorrow, tomorrow + timedelta(hours=1)
+    ) is None
+    assert room_intervals.overlaps(
+        tomorrow + timedelta(hours=2), tomorrow + timedelta(hours=4)
+    )
+
+
+def test_touching_intervals_do_not_overlap(tomorrow):
+    hour = timedelta(hours=1)
+    room_intervals = ReservationIntervalIndex().load(
+        1, [(1, tomorrow + hour, tomorrow + 2 * hour)]
+    )
+    booked = BookedIntervals([(tomorrow + hour, tomorrow + 2 * hour)])
+
+    for intervals in (room_intervals, booked):
+        assert not intervals.overlaps(tomorrow, tomorrow + hour)
+        assert not intervals.overlaps(tomorrow + 2 * hour, tomorrow + 3 * hour)
+        assert intervals.overlaps(tomorrow, tomorrow + hour + timedelta(seconds=1))
+    room_intervals.add(2, tomorrow + 2 * hour, tomorrow + 3 * hour)
+    assert room_intervals.consistent
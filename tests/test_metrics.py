@@ -0,0 +1,31 @@
+"""
+Тесты метрик в формате Prometheus.
+"""
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+pytestmark = pytest.mark.anyio
+
+
+def test_register_stats_exports_monotonic_values_as_counters():
+    registry = MetricsRegistry()
+    registry.register_stats(
+        'cache',
+        lambda: {'hits': 3, 'wait_seconds_total': 0.5, 'size': 2},
+        'Кэш',
+        counters=('hits',),
+    )
+
+    text = registry.render()
+
+    assert '# TYPE cache_hits_total counter\ncache_hits_total 3' in text
+    assert '# TYPE cache_wait_seconds_total counter' in text
+    assert '# TYPE cache_size gauge\ncache_size 2' in text
+
+
+async def test_metrics_endpoint_is_disabled_by_default(client):
+    response = await client.get('/metrics')
+
+    assert response.status_code == 404
@@ -0,0 +1,107 @@
+"""
+Тесты /reservations/my_reservations: ETag и 304, курсор и фильтры.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import auth_headers, create_room, reservation_json
+
+pytestmark = pytest.mark.anyio
+
+URL = '/reservations/my_reservations'
+
+
+async def reserve(client, headers, room_id, start) -> None:
+    """
+    Забронировать комнату на час с start.
+    """
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(room_id, start, start + timedelta(hours=1)),
+        headers=headers,
+    )
+    response.raise_for_status()
+
+
+async def test_matching_etag_returns_not_modified(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    await reserve(client, headers, room_id, tomorrow + timedelta(hours=10))
+    response = await client.get(URL, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    response = await client.get(
+        URL, headers={**headers, 'If-None-Match': etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['ETag'] == etag
+
+
+async def test_new_reservation_changes_etag(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    await reserve(client, headers, room_id, tomorrow + timedelta(hours=10))
+    etag = (await client.get(URL, headers=headers)).headers['ETag']
+    await reserve(client, headers, room_id, tomorrow + timedelta(hours=12))
+
+    response = await client.get(
+        URL, headers={**headers, 'If-None-Match': etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert len(response.json()['items']) == 2
+
+
+async def test_etag_is_not_shared_between_users(client):
+    first = await client.get(URL, headers=await auth_headers(client))
+    second_headers = await auth_headers(client, 'other@example.com')
+
+    response = await client.get(
+        URL, headers={**second_headers, 'If-None-Match': first.headers['ETag']}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {'items': [], 'next_cursor': None}
+
+
+async def test_descending_pages_round_trip_cursor(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    starts = [tomorrow + timedelta(hours=hour) for hour in (10, 12, 14)]
+    for start in starts:
+        await reserve(client, headers, room_id, start)
+
+    seen, after = [], None
+    while True:
+        params = {'order': 'desc', 'limit': 2}
+        if after is not None:
+            params['after'] = after
+        page = (await client.get(URL, params=params, headers=headers)).json()
+        seen.extend(item['from_reserve'] for item in page['items'])
+        after = page['next_cursor']
+        if after is None:
+            break
+
+    assert seen == [start.isoformat() for start in reversed(starts)]
+
+
+async def test_window_filter_is_half_open(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    for hour in (10, 11, 12):
+        await reserve(client, headers, room_id, tomorrow + timedelta(hours=hour))
+
+    response = await client.get(URL, params={
+        'from': (tomorrow + timedelta(hours=11)).isoformat(),
+        'to': (tomorrow + timedelta(hours=12)).isoformat(),
+    }, headers=headers)
+
+    assert [item['from_reserve'] for item in response.json()['items']] == [
+        (tomorrow + timedelta(hours=11)).isoformat()
+    ]
@@ -0,0 +1,91 @@
+"""
+Тесты постраничного вывода списков по курсору (keyset-пагинация).
+"""
+
+from datetime import timedelta
+from typing import Optional
+
+import pytest
+from sqlalchemy import insert
+
+from app.models import Reservation
+from tests.conftest import create_room, superuser_headers
+
+pytestmark = pytest.mark.anyio
+
+
+async def walk_pages(
+    client,
+    url: str,
+    limit: int,
+    headers: Optional[dict] = None,
+) -> list[list[int]]:
+    """
+    Пройти все страницы списка по next_cursor.
+
+    Returns:
+        list[list[int]]: ID объектов каждой страницы.
+    """
+    pages, after = [], None
+    while True:
+        params = {'limit': limit}
+        if after is not None:
+            params['after'] = after
+        response = await client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append([item['id'] for item in page['items']])
+        after = page.get('next_cursor')
+        if after is None:
+            return pages
+
+
+async def create_reservations(session, tomorrow, count: int) -> None:
+    """
+    Создать count непересекающихся бронирований напрямую в БД.
+    """
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [
+        {
+            'meetingroom_id': room_id,
+            'from_reserve': tomorrow + timedelta(hours=hour),
+            'to_reserve': tomorrow + timedelta(hours=hour + 1),
+        }
+        for hour in range(count)
+    ])
+    await session.commit()
+
+
+@pytest.mark.parametrize('count, pages', [
+    (5, [[1, 2], [3, 4], [5]]),
+    (4, [[1, 2], [3, 4]]),
+])
+async def test_reservation_pages_round_trip_cursor(
+    client, session, tomorrow, count, pages
+):
+    headers = await superuser_headers(client)
+    await create_reservations(session, tomorrow, count)
+
+    assert await walk_pages(client, '/reservations/', 2, headers) == pages
+
+
+async def test_reservation_cursor_after_last_returns_empty_page(
+    client, session, tomorrow
+):
+    headers = await superuser_headers(client)
+    await create_reservations(session, tomorrow, 2)
+
+    response = await client.get(
+        '/reservations/', params={'after': 2}, headers=headers
+    )
+
+    assert response.json() == {'items': [], 'next_cursor': None}
+
+
+async def test_meeting_room_pages_round_trip_cursor(client):
+    for number in range(5):
+        await create_room(f'Room {number}')
+
+    assert await walk_pages(client, '/meeting_rooms/', 2) == [
+        [1, 2], [3, 4], [5]
+    ]
@@ -0,0 +1,103 @@
+"""
+Тесты профилирования SQL: скрытие параметров, журнал медленных запросов
+и заголовок Server-Timing.
+"""
+
+import logging
+from datetime import datetime
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.db import engine
+from app.main import app
+from tests.conftest import auth_headers, create_room
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = 'secret@example.com'
+LISTENERS = (
+    ('before_cursor_execute', profiling.before_cursor_execute),
+    ('after_cursor_execute', profiling.after_cursor_execute),
+    ('handle_error', profiling.handle_error),
+)
+
+
+@pytest.fixture
+async def profiled_client(database) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Клиент приложения за ProfilingMiddleware с профилируемым движком.
+    """
+    profiling.instrument_engine(engine)
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(
+                app=profiling.ProfilingMiddleware(app)
+            ),
+            base_url='http://test',
+        ) as client:
+            yield client
+    finally:
+        for name, listener in LISTENERS:
+            event.remove(engine.sync_engine, name, listener)
+
+
+def test_redact_parameters_hides_strings_and_keeps_structure():
+    moment = datetime(2030, 1, 1, 10)
+
+    assert profiling.redact_parameters(
+        [{'email': EMAIL, 'id': 7, 'at': moment, 'hash': b'x', 'none': None}]
+    ) == [{
+        'email': profiling.REDACTED, 'id': 7, 'at': moment,
+        'hash': profiling.REDACTED, 'none': None,
+    }]
+    assert profiling.redact_parameters((1, 'a', 2.5)) == [
+        1, profiling.REDACTED, 2.5
+    ]
+
+
+async def test_slow_query_log_redacts_parameters(
+    profiled_client, monkeypatch, caplog
+):
+    monkeypatch.setattr(settings, 'sql_slow_query_ms', 0)
+    caplog.set_level(logging.WARNING, logger=profiling.__name__)
+
+    await auth_headers(profiled_client, EMAIL)
+
+    messages = [
+        record.getMessage() for record in caplog.records
+        if record.name == profiling.__name__
+    ]
+    assert any('POST /auth/jwt/login' in message for message in messages)
+    assert any(profiling.REDACTED in message for message in messages)
+    assert not any(EMAIL in message for message in messages)
+
+
+async def test_server_timing_header_on_request(profiled_client, monkeypatch):
+    monkeypatch.setattr(settings, 'sql_profile_header_enabled', True)
+    room_id = await create_room()
+    url = f'/meeting_rooms/{room_id}/reservations'
+
+    response = await profiled_client.get(url, headers={'X-SQL-Profile': '1'})
+
+    timing = response.headers['Server-Timing']
+    assert timing.startswith('db;dur=')
+    assert 'sql-1;dur=' in timing
+    assert 'CRUDReservation.get_room_schedule' in timing
+    response = await profiled_client.get(url)
+    assert 'Server-Timing' not in response.headers
+
+
+async def test_server_timing_header_disabled_by_default(profiled_client):
+    room_id = await create_room()
+
+    response = await profiled_client.get(
+        f'/meeting_rooms/{room_id}/reservations',
+        headers={'X-SQL-Profile': '1'},
+    )
+
+    assert 'Server-Timing' not in response.headers
@@ -0,0 +1,136 @@
+"""
+Тесты маршрутизации чтений в реплику: измерение задержки и read your
+own writes.
+"""
+
+import httpx
+import pytest
+from sqlalchemy import event, update
+
+from app.core import db
+from app.core.db import (
+    ReadYourWritesMiddleware, read_router, replica_heartbeat, request_user_id
+)
+from app.main import app
+from tests.conftest import (
+    DATABASE_PATH, auth_headers, create_room, reservation_json
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replica(database, monkeypatch):
+    """
+    Реплика — соединение только для чтения к тестовой базе.
+    """
+    replica_engine = db.create_engine(
+        f'sqlite+aiosqlite:///file:{DATABASE_PATH}?mode=ro&uri=true'
+    )
+    monkeypatch.setattr(db, 'read_engine', replica_engine)
+    monkeypatch.setattr(
+        db, 'AsyncReadSessionLocal',
+        db.sessionmaker(replica_engine, class_=db.AsyncSession),
+    )
+    monkeypatch.setattr(read_router, 'lag', None)
+    read_router.recent_writers.clear()
+    yield replica_engine
+    read_router.recent_writers.clear()
+    await replica_engine.dispose()
+
+
+@pytest.fixture
+def writes():
+    """
+    Изменяющие запросы к основной базе во время теста.
+    """
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(('SELECT', 'PRAGMA')):
+            executed.append(statement)
+
+    event.listen(db.engine.sync_engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(db.engine.sync_engine, 'before_cursor_execute', record)
+
+
+def user_id(headers: dict[str, str]) -> int:
+    """
+    ID пользователя из заголовка Authorization.
+    """
+    return request_user_id({
+        'headers': [(b'authorization', headers['Authorization'].encode())]
+    })
+
+
+async def test_check_only_reads(replica, writes):
+    await read_router.check()
+
+    assert writes == []
+    assert read_router.lag is None
+    assert not read_router.replica_allowed(None)
+
+    await read_router.write_heartbeat()
+    writes.clear()
+    await read_router.check()
+
+    assert writes == []
+    assert read_router.lag == 0
+    assert read_router.replica_allowed(None)
+
+
+async def test_stale_heartbeat_means_unknown_lag(replica):
+    await read_router.write_heartbeat()
+    async with db.engine.begin() as connection:
+        await connection.execute(
+            update(replica_heartbeat).values(written_at=0)
+        )
+
+    await read_router.check()
+
+    assert read_router.lag is None
+
+
+async def test_reads_stick_to_primary_after_own_write(replica, tomorrow):
+    read_router.lag = 0
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=ReadYourWritesMiddleware(app)),
+        base_url='http://test',
+    ) as client:
+        writer = await auth_headers(client, 'writer@example.com')
+        reader = await auth_headers(client, 'reader@example.com')
+        room_id = await create_room()
+
+        response = await client.patch(
+            '/users/me', headers=reader, json={'password': 'new-password'}
+        )
+        response.raise_for_status()
+
+        assert read_router.replica_allowed(user_id(writer))
+        assert read_router.replica_allowed(user_id(reader))
+
+        response = await client.post(
+            '/reservations/',
+            headers=writer,
+            json=reservation_json(
+                room_id, tomorrow.replace(hour=9), tomorrow.replace(hour=10)
+            ),
+        )
+        response.raise_for_status()
+
+        assert not read_router.replica_allowed(user_id(writer))
+        assert read_router.replica_allowed(user_id(reader))
+        assert read_router.replica_allowed(None)
+
+        primary_reads = read_router.primary_reads
+        replica_reads = read_router.replica_reads
+        response = await client.get(
+            '/reservations/my_reservations', headers=writer
+        )
+        assert [item['meetingroom_id'] for item in response.json()['items']] == [
+            room_id
+        ]
+        await client.get('/reservations/my_reservations', headers=reader)
+        assert read_router.primary_reads == primary_reads + 1
+        assert read_router.replica_reads == replica_reads + 1
@@ -0,0 +1,146 @@
+"""
+Тесты повторяющихся бронирований: развёртывание серии и пересечения.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Reservation
+from tests.conftest import auth_headers, create_room, reservation_json
+
+pytestmark = pytest.mark.anyio
+
+
+async def series_rows(session) -> list:
+    """
+    Начало, окончание и серия всех бронирований по порядку.
+    """
+    rows = await session.execute(
+        select(
+            Reservation.from_reserve,
+            Reservation.to_reserve,
+            Reservation.series_id,
+        ).order_by(Reservation.from_reserve)
+    )
+    return rows.all()
+
+
+async def test_weekly_series_expands_into_occurrences(client, session, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id, start, start + timedelta(hours=1),
+            recurrence={'frequency': 'weekly', 'interval': 2, 'count': 3},
+        ),
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()['from_reserve'] == start.isoformat()
+    rows = await series_rows(session)
+    assert [(from_reserve, to_reserve) for from_reserve, to_reserve, _ in rows] == [
+        (start + timedelta(weeks=2 * week),
+         start + timedelta(weeks=2 * week, hours=1))
+        for week in range(3)
+    ]
+    series_ids = {series_id for _, _, series_id in rows}
+    assert len(series_ids) == 1 and None not in series_ids
+
+
+async def test_daily_series_until_includes_last_start(client, session, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id, start, start + timedelta(hours=1),
+            recurrence={
+                'frequency': 'daily',
+                'until': (start + timedelta(days=4)).isoformat(),
+            },
+        ),
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert len(await series_rows(session)) == 5
+
+
+async def test_series_with_conflicting_occurrence_is_rejected(
+    client, session, tomorrow
+):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+    taken = start + timedelta(days=3, minutes=30)
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(room_id, taken, taken + timedelta(hours=1)),
+        headers=headers,
+    )
+    response.raise_for_status()
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id, start, start + timedelta(hours=1),
+            recurrence={'frequency': 'daily', 'count': 5},
+        ),
+        headers=headers,
+    )
+
+    assert response.status_code == 422
+    assert await series_rows(session) == [
+        (taken, taken + timedelta(hours=1), None)
+    ]
+
+
+async def test_series_occurrence_ending_at_next_start_is_accepted(
+    client, tomorrow
+):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(room_id, start + timedelta(days=1, hours=1),
+                              start + timedelta(days=1, hours=2)),
+        headers=headers,
+    )
+    response.raise_for_status()
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id, start, start + timedelta(hours=1),
+            recurrence={'frequency': 'daily', 'count': 3},
+        ),
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+
+
+async def test_series_overlapping_itself_is_rejected(client, tomorrow):
+    headers = await auth_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+
+    response = await client.post(
+        '/reservations/',
+        json=reservation_json(
+            room_id, start, start + timedelta(days=1),
+            recurrence={'frequency': 'daily', 'count': 2},
+        ),
+        headers=headers,
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,27 @@
+"""
+Тесты кэша каталога переговорных комнат.
+"""
+
+import pytest
+from sqlalchemy import insert
+
+from app.crud.meeting_room import meeting_room_crud
+from app.crud.room_catalog import room_catalog
+from app.models import MeetingRoom
+from tests.conftest import create_room
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_write_checks_see_rooms_missing_from_cache(session):
+    await create_room('Cached')
+    await room_catalog.get_page(session, limit=None, after=None)
+    # Комната создана в обход кэша, например другим процессом.
+    result = await session.execute(insert(MeetingRoom).values(name='New'))
+    await session.commit()
+    room_id = result.inserted_primary_key[0]
+
+    assert await meeting_room_crud.room_exists(room_id, session)
+    assert await meeting_room_crud.get_room_id_by_name('New', session) == room_id
+    body, _ = await room_catalog.get_page(session, limit=None, after=None)
+    assert b'New' not in body
@@ -0,0 +1,86 @@
+"""
+Тесты удаления переговорной комнаты вместе с её бронированиями и сериями.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.crud.interval_index import reservation_index
+from app.models import MeetingRoom, Reservation, ReservationSeries
+from tests.conftest import (
+    auth_headers, create_room, reservation_json, superuser_headers
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def count(session, model, room_id: int) -> int:
+    """
+    Количество строк модели, относящихся к комнате.
+    """
+    column = model.id if model is MeetingRoom else model.meetingroom_id
+    result = await session.execute(
+        select(func.count()).select_from(model).where(column == room_id)
+    )
+    return result.scalar()
+
+
+async def test_room_delete_removes_reservations_and_series(
+    client, session, tomorrow
+):
+    headers = await auth_headers(client)
+    admin_headers = await superuser_headers(client)
+    room_id = await create_room('Deleted')
+    other_room_id = await create_room('Kept')
+    start = tomorrow + timedelta(hours=10)
+    for target_room_id in (room_id, other_room_id):
+        response = await client.post(
+            '/reservations/',
+            json=reservation_json(
+                target_room_id, start, start + timedelta(hours=1),
+                recurrence={'frequency': 'daily', 'count': 3},
+            ),
+            headers=headers,
+        )
+        response.raise_for_status()
+        response = await client.post(
+            '/reservations/',
+            json=reservation_json(
+                target_room_id, start + timedelta(hours=2),
+                start + timedelta(hours=3),
+            ),
+            headers=headers,
+        )
+        response.raise_for_status()
+
+    response = await client.delete(
+        f'/meeting_rooms/{room_id}', headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()['id'] == room_id
+    for model in (MeetingRoom, Reservation, ReservationSeries):
+        assert await count(session, model, room_id) == 0
+    assert await count(session, Reservation, other_room_id) == 4
+    assert await count(session, ReservationSeries, other_room_id) == 1
+    assert reservation_index.get(room_id) is None
+
+
+async def test_deleted_room_schedule_is_not_found(client, tomorrow):
+    headers = await auth_headers(client)
+    admin_headers = await superuser_headers(client)
+    room_id = await create_room()
+    start = tomorrow + timedelta(hours=10)
+    slot = reservation_json(room_id, start, start + timedelta(hours=1))
+    response = await client.post('/reservations/', json=slot, headers=headers)
+    response.raise_for_status()
+    response = await client.delete(
+        f'/meeting_rooms/{room_id}', headers=admin_headers
+    )
+    response.raise_for_status()
+
+    response = await client.get(f'/meeting_rooms/{room_id}/reservations')
+
+    assert response.status_code == 404
@@ -0,0 +1,99 @@
+"""
+Тесты расписания комнаты: окно времени, порядок и ограничение limit.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.models import Reservation
+from app.schemas.constants import PaginationConstants
+from tests.conftest import create_room
+
+pytestmark = pytest.mark.anyio
+
+URL = '/meeting_rooms/{room_id}/reservations'
+
+
+@pytest.fixture
+async def schedule(session, tomorrow) -> int:
+    """
+    Комната с часовыми бронированиями, начинающимися каждые два часа
+    с начала завтрашнего дня, — больше DEFAULT_LIMIT штук.
+
+    Returns:
+        int: ID комнаты.
+    """
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [
+        {
+            'meetingroom_id': room_id,
+            'from_reserve': tomorrow + timedelta(hours=2 * number),
+            'to_reserve': tomorrow + timedelta(hours=2 * number + 1),
+        }
+        for number in range(PaginationConstants.DEFAULT_LIMIT + 5)
+    ])
+    await session.commit()
+    return room_id
+
+
+async def test_schedule_without_limit_is_not_truncated(client, schedule):
+    response = await client.get(URL.format(room_id=schedule))
+
+    assert response.status_code == 200
+    assert len(response.json()) == PaginationConstants.DEFAULT_LIMIT + 5
+    assert 'X-Next-From' not in response.headers
+
+
+async def test_schedule_window_includes_reservation_started_before(
+    client, schedule, tomorrow
+):
+    response = await client.get(URL.format(room_id=schedule), params={
+        'from': (tomorrow + timedelta(minutes=30)).isoformat(),
+        'to': (tomorrow + timedelta(hours=4)).isoformat(),
+    })
+
+    assert [item['from_reserve'] for item in response.json()] == [
+        tomorrow.isoformat(),
+        (tomorrow + timedelta(hours=2)).isoformat(),
+    ]
+
+
+async def test_schedule_limit_reports_next_window_start(
+    client, schedule, tomorrow
+):
+    url = URL.format(room_id=schedule)
+    window = {'from': tomorrow.isoformat(), 'limit': 3}
+    response = await client.get(url, params=window)
+
+    assert [item['from_reserve'] for item in response.json()] == [
+        (tomorrow + timedelta(hours=hours)).isoformat() for hours in (0, 2, 4)
+    ]
+    next_from = response.headers['X-Next-From']
+    assert next_from == (tomorrow + timedelta(hours=5)).isoformat()
+
+    response = await client.get(url, params={**window, 'from': next_from})
+
+    assert response.json()[0]['from_reserve'] == (
+        tomorrow + timedelta(hours=6)
+    ).isoformat()
+
+
+async def test_schedule_limit_covering_window_has_no_next(
+    client, schedule, tomorrow
+):
+    response = await client.get(URL.format(room_id=schedule), params={
+        'from': tomorrow.isoformat(),
+        'to': (tomorrow + timedelta(hours=4)).isoformat(),
+        'limit': 2,
+    })
+
+    assert len(response.json()) == 2
+    assert 'X-Next-From' not in response.headers
+
+
+async def test_schedule_of_missing_room_is_not_found(client):
+    response = await client.get(URL.format(room_id=1))
+
+    assert response.status_code == 404
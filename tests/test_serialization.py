@@ -0,0 +1,88 @@
+"""
+Тесты быстрой сериализации: вывод совпадает с выводом Pydantic.
+"""
+
+import json
+from datetime import timedelta
+
+import orjson
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+
+from app.core.serialization import dumps, trusted_items
+from app.crud.meeting_room import meeting_room_crud
+from app.crud.reservation import reservation_crud
+from app.models import MeetingRoom, Reservation
+from app.schemas.meeting_room import MeetingRoomDB
+from app.schemas.reservation import RESERVATION_PUBLIC_EXCLUDE, ReservationDB
+from tests.conftest import create_room, superuser_headers
+
+pytestmark = pytest.mark.anyio
+
+
+def pydantic_json(schema, objs, **options):
+    """
+    Эталонный JSON: модели Pydantic, jsonable_encoder и json.dumps.
+    """
+    return json.loads(json.dumps(jsonable_encoder(
+        [schema.from_orm(obj) for obj in objs], **options
+    )))
+
+
+@pytest.fixture
+async def reservations(session, tomorrow) -> None:
+    """
+    Бронирования с пустыми и заполненными необязательными полями
+    и временем с микросекундами.
+    """
+    room_id = await create_room()
+    await session.execute(insert(Reservation), [
+        {
+            'meetingroom_id': room_id,
+            'from_reserve': tomorrow + timedelta(hours=1),
+            'to_reserve': tomorrow + timedelta(hours=2, microseconds=123456),
+        },
+        {
+            'meetingroom_id': room_id,
+            'user_id': 1,
+            'from_reserve': tomorrow + timedelta(hours=3),
+            'to_reserve': tomorrow + timedelta(hours=4),
+        },
+    ])
+    await session.commit()
+
+
+@pytest.mark.parametrize('exclude', [None, RESERVATION_PUBLIC_EXCLUDE])
+async def test_reservation_items_match_pydantic(session, reservations, exclude):
+    rows = await reservation_crud.get_multi(session, as_rows=True)
+    objs = await reservation_crud.get_multi(session)
+
+    assert orjson.loads(dumps(
+        trusted_items(ReservationDB, rows, exclude=exclude)
+    )) == pydantic_json(ReservationDB, objs, exclude=exclude)
+
+
+async def test_meeting_room_items_match_pydantic(session):
+    await session.execute(insert(MeetingRoom), [
+        {'name': 'Plain'},
+        {'name': 'Described', 'description': 'Проектор'},
+    ])
+    await session.commit()
+    objs = await meeting_room_crud.get_multi(session)
+
+    assert orjson.loads(dumps(trusted_items(
+        MeetingRoomDB, await meeting_room_crud.get_multi(session, as_rows=True),
+        exclude_none=True,
+    ))) == pydantic_json(MeetingRoomDB, objs, exclude_none=True)
+
+
+async def test_reservation_list_endpoint_matches_pydantic(
+    client, session, reservations
+):
+    headers = await superuser_headers(client)
+    objs = await reservation_crud.get_multi(session)
+
+    response = await client.get('/reservations/', headers=headers)
+
+    assert response.json()['items'] == pydantic_json(ReservationDB, objs)
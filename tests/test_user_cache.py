@@ -0,0 +1,74 @@
+"""
+Тесты кэша аутентифицированных пользователей: сброс при смене прав и пароля.
+"""
+
+import pytest
+
+from app.core.user import user_cache
+from tests.conftest import auth_headers, superuser_headers
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = 'user@example.com'
+
+
+async def user_id(client, headers: dict[str, str]) -> int:
+    """
+    ID пользователя токена (запрос заодно кэширует пользователя).
+    """
+    response = await client.get('/users/me', headers=headers)
+    response.raise_for_status()
+    return response.json()['id']
+
+
+async def test_cached_user_is_served_without_database(client):
+    headers = await auth_headers(client, EMAIL)
+    await user_id(client, headers)
+    misses = user_cache.stats()['misses']
+
+    await user_id(client, headers)
+
+    assert user_cache.stats()['misses'] == misses
+    assert user_cache.stats()['size'] == 1
+
+
+async def test_role_change_invalidates_cached_user(client):
+    headers = await auth_headers(client, EMAIL)
+    admin_headers = await superuser_headers(client)
+    target_id = await user_id(client, headers)
+    response = await client.get('/reservations/', headers=headers)
+    assert response.status_code == 403
+
+    response = await client.patch(
+        f'/users/{target_id}', json={'is_superuser': True}, headers=admin_headers
+    )
+    response.raise_for_status()
+
+    response = await client.get('/reservations/', headers=headers)
+    assert response.status_code == 200
+
+
+async def test_deactivation_invalidates_cached_user(client):
+    headers = await auth_headers(client, EMAIL)
+    admin_headers = await superuser_headers(client)
+    target_id = await user_id(client, headers)
+
+    response = await client.patch(
+        f'/users/{target_id}', json={'is_active': False}, headers=admin_headers
+    )
+    response.raise_for_status()
+
+    response = await client.get('/users/me', headers=headers)
+    assert response.status_code == 401
+
+
+async def test_password_change_invalidates_cached_user(client):
+    headers = await auth_headers(client, EMAIL)
+    await user_id(client, headers)
+
+    response = await client.patch(
+        '/users/me', json={'password': 'new-password'}, headers=headers
+    )
+    response.raise_for_status()
+
+    assert user_cache.stats()['size'] == 0